@@ -1,5 +1,7 @@
 from fastapi import APIRouter
-from backend_fastapi.api.v1.endpoints import stocks
+from backend_fastapi.api.v1.endpoints import stocks, crypto, stream
 
 api_router = APIRouter()
 api_router.include_router(stocks.router, prefix="/stocks", tags=["stocks"])
+api_router.include_router(crypto.router, prefix="/crypto", tags=["crypto"])
+api_router.include_router(stream.router, prefix="/stream", tags=["stream"])
@@ -1,8 +1,9 @@
 
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from backend_fastapi.db.session import get_db
+from backend_fastapi.db.session import get_db, AsyncSessionLocal
 from backend_fastapi.services.crypto_loader import CryptoLoader
+from backend_fastapi.core.singleflight import singleflight
 import datetime
 
 router = APIRouter()
@@ -37,3 +38,34 @@ async def get_latest_crypto(symbol: str, db: AsyncSession = Depends(get_db)):
         "timestamp": data.timestamp,
         "source": data.source
     }
+
+async def _load_tickers(symbols: tuple):
+    async with AsyncSessionLocal() as db:
+        return await CryptoLoader(db).fetch_latest_prices(list(symbols))
+
+@router.get("/tickers")
+async def get_crypto_tickers(symbols: str = "BTC-KRW,ETH-KRW,XRP-KRW,USDT-KRW"):
+    """
+    Batch real-time prices: one exchange round trip for all pairs.
+    symbols: comma separated, "BTC-KRW" convention (same as /latest).
+    """
+    pairs = tuple(sorted({s.strip().upper().replace("-", "/") for s in symbols.split(",") if s.strip()}))
+    if not pairs:
+        raise HTTPException(status_code=400, detail="No symbols given")
+
+    tickers = await singleflight.do(("crypto/tickers", pairs), lambda: _load_tickers(pairs))
+    if tickers is None:
+        raise HTTPException(status_code=502, detail="Exchange request failed")
+
+    return [
+        {
+            "symbol": symbol.replace("/", "-"),
+            "price": t["last"],
+            "change_percent": t.get("percentage"),
+            "volume": t.get("baseVolume"),
+            "quote_volume": t.get("quoteVolume"),
+            "timestamp": t.get("timestamp"),
+            "source": "Upbit",
+        }
+        for symbol, t in sorted(tickers.items())
+    ]
@@ -1,44 +1,43 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.ext.asyncio import AsyncSession
-from backend_fastapi.db.session import get_db
+from fastapi import APIRouter, HTTPException
+from typing import Literal
+from backend_fastapi.db.session import AsyncSessionLocal
+from backend_fastapi.core.singleflight import singleflight
 from backend_fastapi.services.kr_loader import KRStockLoader
-import FinanceDataReader as fdr
-import asyncio
+from backend_fastapi.services.ohlcv_store import OHLCVStore
+from shared.ohlcv_format import columns_to_records
 
 router = APIRouter()
 kr_loader = KRStockLoader()
 
+async def _fetch_latest(symbol: str):
+    # Own session: the shared flight may outlive the request that started it
+    async with AsyncSessionLocal() as db:
+        return await kr_loader.fetch_and_save(symbol, db)
+
 @router.get("/latest/{symbol}")
-async def get_latest_stock(symbol: str, db: AsyncSession = Depends(get_db)):
-    # Simple pass-through for now, optimized later
-    data = await kr_loader.fetch_and_save(symbol, db)
+async def get_latest_stock(symbol: str):
+    # Concurrent requests for the same symbol share one FDR call
+    data = await singleflight.do(("stocks/latest", symbol), lambda: _fetch_latest(symbol))
     if not data:
         raise HTTPException(status_code=404, detail="Symbol not found")
     return data
 
+async def _load_history(symbol: str, days: int):
+    # Own session: the shared flight may outlive the request that started it
+    async with AsyncSessionLocal() as db:
+        return await OHLCVStore(db).get_history(symbol, days)
+
 @router.get("/history/{symbol}")
-async def get_stock_history(symbol: str, days: int = 365):
-    # Direct FDR call for history (optimized)
+async def get_stock_history(
+    symbol: str,
+    days: int = 365,
+    format: Literal["rows", "columns"] = "rows",
+):
+    # Served from the persistent daily bar store; FDR only for missing ranges.
+    # Concurrent identical requests (e.g. many sessions opening the KR tab) share one load.
+    # format=columns returns {"time": [...], "open": [...], ...} (compact, chart-ready)
     try:
-        df = await asyncio.to_thread(fdr.DataReader, symbol)
-        if df.empty:
-            return []
-            
-        # Limit to last N days
-        df = df.iloc[-days:]
-        df = df.dropna()
-        
-        # Convert to list of dicts for JSON
-        history = []
-        for index, row in df.iterrows():
-            history.append({
-                "time": index.strftime("%Y-%m-%d"),
-                "open": row['Open'],
-                "high": row['High'],
-                "low": row['Low'],
-                "close": row['Close'],
-                "volume": row['Volume']
-            })
-        return history
+        columns = await singleflight.do(("stocks/history", symbol, days), lambda: _load_history(symbol, days))
+        return columns if format == "columns" else columns_to_records(columns)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
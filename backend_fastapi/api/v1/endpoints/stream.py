@@ -0,0 +1,41 @@
+import asyncio
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from backend_fastapi.services.price_stream import price_hub
+
+router = APIRouter()
+
+@router.websocket("/ws")
+async def price_stream(websocket: WebSocket):
+    """
+    Push feed: first message is a full snapshot, then only changed ticks
+    ({"type": "tick"}) and kimchi premium updates ({"type": "kimchi"}).
+    """
+    await websocket.accept()
+    queue = price_hub.subscribe()
+
+    async def send():
+        while True:
+            await websocket.send_json(await queue.get())
+
+    async def receive():
+        # Client messages are ignored; this only notices a disconnect right away
+        # instead of on the next send (which may be long after in a quiet market).
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+
+    tasks = [asyncio.create_task(send()), asyncio.create_task(receive())]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            error = task.exception()
+            if error is not None and not isinstance(error, WebSocketDisconnect):
+                raise error
+    finally:
+        for task in tasks:
+            task.cancel()
+        price_hub.unsubscribe(queue)
+
+@router.get("/snapshot")
+async def price_snapshot():
+    """Latest tick per exchange:symbol and the current kimchi premium (in-memory, no upstream call)."""
+    return {**price_hub.snapshot(), "feeds": price_hub.status, "subscribers": len(price_hub.subscribers)}
@@ -7,5 +7,35 @@ class Settings:
     PROJECT_NAME: str = "InsightStream"
     API_PREFIX: str = "/api/v1"
     DATABASE_URL: str = "sqlite+aiosqlite:///./dashboard.db"
+    FRED_API_KEY: str = os.getenv("FRED_API_KEY")
+    # 일봉 저장소: 마지막 동기화 후 이 시간(초)이 지나야 FDR에서 최신 구간을 다시 조회
+    HISTORY_SYNC_INTERVAL: int = 600
+
+    # Background ingestion (services/scheduler.py)
+    SCHEDULER_ENABLED: bool = os.getenv("SCHEDULER_ENABLED", "1") == "1"
+    SCHEDULER_JITTER: float = 0.1 # +-10% on every interval
+    SCHEDULER_SOURCES: dict = {
+        # interval: seconds between passes, calls_per_minute: upstream budget
+        "kr": {"interval": 300, "calls_per_minute": 30},
+        "us": {"interval": 3600, "calls_per_minute": 20},
+        "crypto": {"interval": 30, "calls_per_minute": 60},
+        "fred": {"interval": 3600, "calls_per_minute": 10},
+    }
+    SCHEDULER_KR_DAYS: int = 2000 # Covers the dashboard's longest period (5Y)
+    SCHEDULER_US_DAYS: int = 365
+    SCHEDULER_CRYPTO_PAIRS: tuple = ("BTC/KRW", "ETH/KRW", "XRP/KRW", "USDT/KRW")
+    SCHEDULER_FRED_SERIES: tuple = ("DGS2", "DGS10", "DGS30")
+    # Watchlist files written by the Streamlit app (US / KR scheduler universe)
+    WATCHLIST_US_PATH: str = os.getenv("WATCHLIST_US_PATH", "./data/favorites.json")
+    WATCHLIST_KR_PATH: str = os.getenv("WATCHLIST_KR_PATH", "./data/kr_favorites.json")
+
+    # Exchange WebSocket price stream (services/price_stream.py)
+    STREAM_ENABLED: bool = os.getenv("STREAM_ENABLED", "1") == "1"
+    STREAM_UPBIT_PAIRS: tuple = ("BTC/KRW", "USDT/KRW", "ETH/KRW", "XRP/KRW")
+    STREAM_BINANCE_PAIRS: tuple = ("BTC/USDT",)
+    # Kimchi premium in /stream/snapshot is marked stale when a leg has not ticked for this long
+    STREAM_KIMCHI_MAX_AGE: float = 60
+    # JSONL of {"exchange", "symbol", "price"} ticks; replaces live feeds when set (tests / offline)
+    STREAM_REPLAY_PATH: str = os.getenv("STREAM_REPLAY_PATH", "")
 
 settings = Settings()
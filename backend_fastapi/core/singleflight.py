@@ -0,0 +1,43 @@
+import asyncio
+
+class SingleFlight:
+    """
+    In-process request coalescing.
+    Concurrent calls with the same key share one upstream execution; the result
+    (or exception) is fanned out to every waiter. Keys look like
+    (endpoint, symbol, *params) and the first element is used for metrics.
+    """
+    def __init__(self):
+        self._inflight = {}
+        self._metrics = {}
+
+    async def do(self, key: tuple, fn):
+        """Run `fn()` (a coroutine function) once per in-flight `key`."""
+        m = self._metrics.setdefault(key[0], {"requests": 0, "upstream_calls": 0, "saved": 0})
+        m["requests"] += 1
+
+        task = self._inflight.get(key)
+        if task is None:
+            m["upstream_calls"] += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+        else:
+            m["saved"] += 1
+
+        # shield: a disconnecting client must not cancel the shared upstream call
+        return await asyncio.shield(task)
+
+    def _done(self, key, task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception() # mark retrieved even if every waiter went away
+
+    def stats(self):
+        return {
+            endpoint: {**m, "in_flight": sum(1 for k in self._inflight if k[0] == endpoint)}
+            for endpoint, m in self._metrics.items()
+        }
+
+singleflight = SingleFlight()
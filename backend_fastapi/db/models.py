@@ -1,16 +1,46 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Index
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, Index, UniqueConstraint
 from backend_fastapi.db.session import Base
 from datetime import datetime
 
 class AssetPrice(Base):
+    """OHLCV bar written by the loaders. One row per (symbol, asset_type, timestamp)."""
     __tablename__ = "asset_prices"
     
     id = Column(Integer, primary_key=True, index=True)
-    symbol = Column(String, index=True) # e.g. "005930", "AAPL"
-    price = Column(Float)
-    change = Column(Float) # Change amount
-    change_percent = Column(Float) # %
-    timestamp = Column(DateTime, default=datetime.utcnow)
-    source = Column(String) # "FDR", "YF", "CCXT"
+    symbol = Column(String, nullable=False) # e.g. "005930", "NASDAQ:AAPL", "BTC/KRW", "DGS10"
+    asset_type = Column(String, nullable=False) # "STOCK_US", "CRYPTO", "MACRO"
+    timestamp = Column(DateTime, nullable=False, default=datetime.utcnow)
+    open = Column(Float)
+    high = Column(Float)
+    low = Column(Float)
+    close = Column(Float) # Macro values stored in close
+    volume = Column(Float)
+    source = Column(String) # "FDR", "Upbit", "FRED"
     
-    __table_args__ = (Index('idx_symbol_timestamp', 'symbol', 'timestamp'),)
+    __table_args__ = (
+        UniqueConstraint('symbol', 'asset_type', 'timestamp', name='uq_asset_price_bar'),
+        Index('idx_symbol_timestamp', 'symbol', 'timestamp'),
+    )
+
+
+class DailyBar(Base):
+    """일봉 OHLCV (history 엔드포인트 저장소). (symbol, date) 복합 PK로 범위 조회"""
+    __tablename__ = "daily_bars"
+
+    symbol = Column(String, primary_key=True) # e.g. "005930", "KOSPI"
+    date = Column(Date, primary_key=True)
+    open = Column(Float)
+    high = Column(Float)
+    low = Column(Float)
+    close = Column(Float)
+    volume = Column(Float)
+    source = Column(String, default="FDR")
+
+
+class HistorySync(Base):
+    """Symbol별 저장 범위 및 마지막 동기화 시각"""
+    __tablename__ = "history_sync"
+
+    symbol = Column(String, primary_key=True)
+    start_date = Column(Date) # 이 날짜 이후 구간은 모두 저장됨
+    synced_at = Column(DateTime) # 마지막 FDR 조회 시각 (UTC)
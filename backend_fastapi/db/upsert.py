@@ -0,0 +1,30 @@
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend_fastapi.db.models import AssetPrice
+
+# SQLite bound-parameter limit is 32766; 500 rows x ~10 columns stays well below it
+CHUNK_SIZE = 500
+
+async def bulk_upsert(db: AsyncSession, model, rows: list, conflict_cols: list, update_cols: list = None) -> int:
+    """
+    INSERT ... ON CONFLICT (conflict_cols) DO UPDATE in chunked multi-row statements.
+    Idempotent: re-loading the same bars overwrites them instead of duplicating.
+    Caller is responsible for commit.
+    """
+    if not rows:
+        return 0
+    if update_cols is None:
+        update_cols = [c for c in rows[0] if c not in conflict_cols]
+
+    for i in range(0, len(rows), CHUNK_SIZE):
+        stmt = insert(model).values(rows[i:i + CHUNK_SIZE])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[getattr(model, c) for c in conflict_cols],
+            set_={c: stmt.excluded[c] for c in update_cols},
+        )
+        await db.execute(stmt)
+    return len(rows)
+
+async def upsert_asset_prices(db: AsyncSession, rows: list) -> int:
+    """Shared ingestion path for all loaders (unique per symbol/asset_type/timestamp)."""
+    return await bulk_upsert(db, AssetPrice, rows, ["symbol", "asset_type", "timestamp"])
@@ -1,21 +1,45 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+from sqlalchemy import inspect
 from backend_fastapi.core.config import settings
 from backend_fastapi.api.v1.api import api_router
 from backend_fastapi.db.session import engine, Base
+from backend_fastapi.services.scheduler import IngestionScheduler
+from backend_fastapi.core.singleflight import singleflight
+from backend_fastapi.services.exchange_pool import exchange_pool
+from backend_fastapi.services.price_stream import price_hub
 import asyncio
 
 # Database Init
+def _drop_legacy_tables(sync_conn):
+    # asset_prices used to be (price, change, change_percent) without asset_type/OHLCV.
+    # create_all does not alter existing tables, so recreate it with the bar schema.
+    insp = inspect(sync_conn)
+    if insp.has_table("asset_prices"):
+        columns = {c["name"] for c in insp.get_columns("asset_prices")}
+        if "asset_type" not in columns:
+            Base.metadata.tables["asset_prices"].drop(sync_conn)
+
 async def init_tables():
     async with engine.begin() as conn:
+        await conn.run_sync(_drop_legacy_tables)
         await conn.run_sync(Base.metadata.create_all)
 
+scheduler = IngestionScheduler()
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await init_tables()
+    if settings.SCHEDULER_ENABLED:
+        scheduler.start()
+    if settings.STREAM_ENABLED:
+        price_hub.start()
     print("🚀 Backend Started & DB Initialized")
     yield
+    await scheduler.stop()
+    await price_hub.stop()
+    await exchange_pool.close()
     print("🛑 Backend Stopped")
 
 app = FastAPI(title="InsightStream Engine", lifespan=lifespan)
@@ -33,3 +57,12 @@ app.include_router(api_router, prefix=settings.API_PREFIX)
 @app.get("/health")
 def health_check():
     return {"status": "ok", "latency": "zero"}
+
+@app.get("/scheduler")
+def scheduler_status():
+    return scheduler.status
+
+@app.get("/metrics")
+def metrics():
+    # singleflight.saved = upstream calls avoided by request coalescing
+    return {"singleflight": singleflight.stats()}
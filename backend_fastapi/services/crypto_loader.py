@@ -1,19 +1,40 @@
 
-import ccxt
-import asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from datetime import datetime
 from backend_fastapi.db.models import AssetPrice
+from backend_fastapi.db.upsert import upsert_asset_prices
+from backend_fastapi.services.exchange_pool import exchange_pool
 
 class CryptoLoader:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, exchange=None):
         self.db = db
-        # Initialize exchange in sync mode as per test findings
-        self.exchange = ccxt.upbit({
-            'enableRateLimit': True,
-            'timeout': 10000,
-        })
+        # Shared app-scoped exchange (markets loaded once); injectable for tests
+        self.exchange = exchange
+
+    async def _exchange(self):
+        if self.exchange is None:
+            self.exchange = await exchange_pool.get("upbit")
+        return self.exchange
+
+    @staticmethod
+    def _ticker_row(symbol: str, ticker: dict) -> dict:
+        # Exchange timestamp (UTC) keeps repeated polls of the same tick idempotent
+        if ticker.get('timestamp'):
+            ts = datetime.utcfromtimestamp(ticker['timestamp'] / 1000)
+        else:
+            ts = datetime.utcnow()
+        return {
+            "symbol": symbol,
+            "asset_type": "CRYPTO",
+            "timestamp": ts,
+            "open": ticker.get('open'),
+            "high": ticker.get('high'),
+            "low": ticker.get('low'),
+            "close": ticker['last'],
+            "volume": ticker.get('baseVolume'), # 24h volume
+            "source": "Upbit",
+        }
 
     async def fetch_latest_price(self, symbol: str):
         """
@@ -21,37 +42,46 @@ class CryptoLoader:
         Symbol example: 'BTC/KRW'
         """
         try:
-            # Run sync CCXT call in a separate thread to avoid blocking async loop
-            ticker = await asyncio.to_thread(self.exchange.fetch_ticker, symbol)
+            exchange = await self._exchange()
+            ticker = await exchange.fetch_ticker(symbol)
             
             if not ticker:
                 return False
 
-            price = ticker['last']
-            ts = datetime.utcnow() # Universal time for DB
-            
             # Save to DB (Hot Cache style)
-            price_entry = AssetPrice(
-                symbol=symbol,
-                asset_type="CRYPTO",
-                timestamp=ts,
-                open=ticker.get('open'),
-                high=ticker.get('high'),
-                low=ticker.get('low'),
-                close=price,
-                volume=ticker.get('baseVolume'), # 24h volume
-                source="Upbit"
-            )
-            self.db.add(price_entry)
+            row = self._ticker_row(symbol, ticker)
+            await upsert_asset_prices(self.db, [row])
             await self.db.commit()
             
             # print(f"✅ [Crypto] Fetched {symbol}: {price}")
-            return price_entry
+            return AssetPrice(**row)
             
         except Exception as e:
             print(f"❌ [Crypto] Error loading {symbol}: {e}")
             return None
 
+    async def fetch_latest_prices(self, symbols: list):
+        """
+        Batch version of fetch_latest_price: one fetch_tickers call for all symbols.
+        Returns {symbol: ticker} for the symbols the exchange answered.
+        """
+        try:
+            exchange = await self._exchange()
+            known = [s for s in symbols if s in exchange.markets]
+            if not known:
+                return {}
+            tickers = await exchange.fetch_tickers(known)
+
+            rows = [self._ticker_row(s, t) for s, t in tickers.items() if t and t.get('last') is not None]
+            if rows:
+                await upsert_asset_prices(self.db, rows)
+                await self.db.commit()
+            return {s: t for s, t in tickers.items() if t and t.get('last') is not None}
+
+        except Exception as e:
+            print(f"❌ [Crypto] Error loading {', '.join(symbols)}: {e}")
+            return None
+
     async def get_latest_price_from_db(self, symbol: str):
         result = await self.db.execute(
             select(AssetPrice)
@@ -0,0 +1,39 @@
+
+import asyncio
+import ccxt.async_support as ccxt
+
+class ExchangePool:
+    """
+    App-scoped ccxt async exchanges.
+    One instance per exchange id keeps ccxt's market cache, rate limiter and
+    aiohttp connection pool alive across requests. Closed in the FastAPI lifespan.
+    """
+    def __init__(self):
+        self._exchanges = {}
+        self._lock = asyncio.Lock()
+
+    async def get(self, exchange_id: str = "upbit"):
+        exchange = self._exchanges.get(exchange_id)
+        if exchange is not None:
+            return exchange
+        async with self._lock:
+            exchange = self._exchanges.get(exchange_id)
+            if exchange is None:
+                exchange = getattr(ccxt, exchange_id)({
+                    'enableRateLimit': True,
+                    'timeout': 10000,
+                })
+                try:
+                    await exchange.load_markets()
+                except Exception:
+                    await exchange.close()
+                    raise
+                self._exchanges[exchange_id] = exchange
+        return exchange
+
+    async def close(self):
+        exchanges, self._exchanges = list(self._exchanges.values()), {}
+        for exchange in exchanges:
+            await exchange.close()
+
+exchange_pool = ExchangePool()
@@ -3,7 +3,7 @@ import pandas as pd
 from fredapi import Fred
 from sqlalchemy.ext.asyncio import AsyncSession
 from backend_fastapi.core.config import settings
-from backend_fastapi.db.models import AssetPrice
+from backend_fastapi.db.upsert import upsert_asset_prices
 import asyncio
 from datetime import datetime
 
@@ -35,22 +35,19 @@ class FredLoader:
             # Get last 5 data points for efficiency (Macro doesn't update often)
             # Actually, let's just get the latest one for the dashboard snapshot.
             # But the chart needs history. Let's start with last 30 points.
-            recent_data = series.tail(30)
-            
-            count = 0
-            for date, value in recent_data.items():
-                ts = pd.to_datetime(date).to_pydatetime()
-                
-                price_entry = AssetPrice(
-                    symbol=series_id,
-                    asset_type="MACRO",
-                    timestamp=ts,
-                    close=value, # Macro values stored in Close
-                    source="FRED"
-                )
-                self.db.add(price_entry)
-                count += 1
+            recent_data = series.dropna().tail(30)
             
+            rows = [
+                {
+                    "symbol": series_id,
+                    "asset_type": "MACRO",
+                    "timestamp": ts.to_pydatetime(),
+                    "close": float(value), # Macro values stored in Close
+                    "source": "FRED",
+                }
+                for ts, value in zip(pd.to_datetime(recent_data.index), recent_data.values)
+            ]
+            count = await upsert_asset_prices(self.db, rows)
             await self.db.commit()
             print(f"✅ [Macro] Saved {count} points for {series_id}")
             return True
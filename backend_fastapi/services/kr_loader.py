@@ -1,6 +1,7 @@
 import FinanceDataReader as fdr
 from sqlalchemy.ext.asyncio import AsyncSession
 from backend_fastapi.db.models import AssetPrice
+from backend_fastapi.services.ohlcv_store import OHLCVStore
 from sqlalchemy import select
 from datetime import datetime
 import asyncio
@@ -24,3 +25,7 @@ class KRStockLoader:
         except Exception as e:
             print(f"Error fetching {symbol}: {e}")
             return None
+
+    async def sync_daily(self, symbol: str, db: AsyncSession, days: int = 365):
+        """Warm the daily bar store served by /stocks/history (missing ranges only)."""
+        return await OHLCVStore(db).sync(symbol, days)
@@ -0,0 +1,118 @@
+
+import FinanceDataReader as fdr
+import pandas as pd
+import asyncio
+import weakref
+from datetime import date, datetime, timedelta
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend_fastapi.core.config import settings
+from backend_fastapi.db.models import DailyBar, HistorySync
+from backend_fastapi.db.upsert import bulk_upsert
+from shared.ohlcv_format import frame_to_columns
+
+# Per-symbol sync serialization (scheduler vs request, or two requests with different `days`).
+# Weak values: an entry lives only while some sync holds or waits on it, so arbitrary symbols don't accumulate.
+_sync_locks = weakref.WeakValueDictionary()
+
+class OHLCVStore:
+    """
+    Persistent daily bar store (dashboard.db).
+    History is served from the DB; FDR is only called for ranges not stored yet
+    (older head on first/longer request, newer tail since the last stored bar).
+    """
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @staticmethod
+    def _calendar_start(days: int) -> date:
+        # days = number of trading bars; ~250 trading days per 365 calendar days (+ holiday slack)
+        return date.today() - timedelta(days=int(days * 1.5) + 10)
+
+    async def get_history(self, symbol: str, days: int = 365):
+        """Columnar history: {"time": [...], "open": [...], ...}"""
+        await self.sync(symbol, days)
+        return await self.read(symbol, days)
+
+    async def sync(self, symbol: str, days: int):
+        """Fetch only the missing head/tail ranges for `symbol` and upsert them."""
+        lock = _sync_locks.get(symbol)
+        if lock is None:
+            lock = _sync_locks[symbol] = asyncio.Lock()
+        async with lock:
+            return await self._sync(symbol, days)
+
+    async def _sync(self, symbol: str, days: int):
+        state = await self.db.get(HistorySync, symbol)
+        need_start = self._calendar_start(days)
+        now = datetime.utcnow()
+
+        ranges = []
+        if state is None:
+            ranges.append((need_start, None))
+        else:
+            if need_start < state.start_date:
+                # Older bars requested than stored (e.g. 1Y -> 5Y)
+                ranges.append((need_start, state.start_date))
+            if now - state.synced_at >= timedelta(seconds=settings.HISTORY_SYNC_INTERVAL):
+                last_date = await self.db.scalar(
+                    select(func.max(DailyBar.date)).where(DailyBar.symbol == symbol)
+                )
+                # Re-fetch from the last stored bar (inclusive) so an intraday bar gets finalized
+                ranges.append((last_date or need_start, None))
+
+        if not ranges:
+            return 0
+
+        count = 0
+        for start, end in ranges:
+            df = await asyncio.to_thread(fdr.DataReader, symbol, start.isoformat(), end.isoformat() if end else None)
+            count += await self._upsert(symbol, df)
+
+        if state is None:
+            # Upsert: another process may have created the row since the read above
+            await bulk_upsert(
+                self.db, HistorySync, [{"symbol": symbol, "start_date": need_start, "synced_at": now}],
+                ["symbol"], update_cols=["synced_at"],
+            )
+        else:
+            state.start_date = min(state.start_date, need_start)
+            if any(end is None for _, end in ranges):
+                state.synced_at = now
+        await self.db.commit()
+        return count
+
+    async def _upsert(self, symbol: str, df: pd.DataFrame) -> int:
+        if df is None or df.empty:
+            return 0
+        cols = frame_to_columns(df)
+        rows = [
+            {
+                "symbol": symbol, "date": date.fromisoformat(t), "open": o, "high": h, "low": l,
+                "close": c, "volume": v, "source": "FDR",
+            }
+            for t, o, h, l, c, v in zip(
+                cols["time"], cols["open"], cols["high"], cols["low"], cols["close"], cols["volume"]
+            )
+        ]
+        return await bulk_upsert(self.db, DailyBar, rows, ["symbol", "date"])
+
+    async def read(self, symbol: str, days: int):
+        """Last `days` bars in chronological order, columnar (single indexed range query)."""
+        result = await self.db.execute(
+            select(DailyBar.date, DailyBar.open, DailyBar.high, DailyBar.low, DailyBar.close, DailyBar.volume)
+            .where(DailyBar.symbol == symbol)
+            .order_by(DailyBar.date.desc())
+            .limit(days)
+        )
+        rows = result.all()
+        rows.reverse()
+        if not rows:
+            return {"time": [], "open": [], "high": [], "low": [], "close": [], "volume": []}
+        # Transpose once instead of building a dict per bar
+        dates, opens, highs, lows, closes, volumes = map(list, zip(*rows))
+        return {
+            "time": [d.isoformat() for d in dates],
+            "open": opens, "high": highs, "low": lows, "close": closes,
+            "volume": [int(v or 0) for v in volumes],
+        }
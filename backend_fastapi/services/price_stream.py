@@ -0,0 +1,219 @@
+
+import asyncio
+import json
+import time
+import uuid
+from backend_fastapi.core.config import settings
+
+try:
+    import websockets
+except ImportError:
+    websockets = None
+
+# --- Upstream feeds ---
+# Each feed is an async generator of (symbol, price, timestamp_ms) ticks.
+
+class UpbitFeed:
+    name = "upbit"
+    URL = "wss://api.upbit.com/websocket/v1"
+
+    def __init__(self, pairs=("BTC/KRW", "USDT/KRW")):
+        # "BTC/KRW" -> Upbit market code "KRW-BTC"
+        self.codes = {f"{p.split('/')[1]}-{p.split('/')[0]}": p for p in pairs}
+
+    async def stream(self):
+        if websockets is None:
+            raise RuntimeError("websockets is not installed")
+        async with websockets.connect(self.URL, ping_interval=20) as ws:
+            await ws.send(json.dumps([
+                {"ticket": str(uuid.uuid4())},
+                {"type": "ticker", "codes": list(self.codes), "isOnlyRealtime": True},
+            ]))
+            async for raw in ws:
+                msg = json.loads(raw)
+                symbol = self.codes.get(msg.get("code"))
+                if symbol:
+                    yield symbol, float(msg["trade_price"]), msg.get("trade_timestamp") or msg.get("timestamp")
+
+class BinanceFeed:
+    name = "binance"
+    URL = "wss://stream.binance.com:9443/stream?streams="
+
+    def __init__(self, pairs=("BTC/USDT",)):
+        # "BTC/USDT" -> "BTCUSDT" (miniTicker "s" field)
+        self.symbols = {p.replace("/", ""): p for p in pairs}
+
+    async def stream(self):
+        if websockets is None:
+            raise RuntimeError("websockets is not installed")
+        streams = "/".join(f"{s.lower()}@miniTicker" for s in self.symbols)
+        async with websockets.connect(self.URL + streams, ping_interval=20) as ws:
+            async for raw in ws:
+                data = json.loads(raw).get("data", {})
+                symbol = self.symbols.get(data.get("s"))
+                if symbol:
+                    yield symbol, float(data["c"]), data.get("E")
+
+class ReplayFeed:
+    """
+    Local stand-in for an exchange feed (tests / offline dev).
+    Replays (symbol, price) ticks every `interval` seconds, looping forever.
+    """
+    def __init__(self, name, ticks, interval=0.5, loop=True):
+        self.name = name
+        self.ticks = list(ticks)
+        self.interval = interval
+        self.loop = loop
+
+    @classmethod
+    def from_jsonl(cls, path, interval=0.5):
+        # One {"exchange": "upbit", "symbol": "BTC/KRW", "price": 1.0} per line -> one feed per exchange
+        by_exchange = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    t = json.loads(line)
+                    by_exchange.setdefault(t["exchange"], []).append((t["symbol"], float(t["price"])))
+        return [cls(name, ticks, interval) for name, ticks in by_exchange.items()]
+
+    async def stream(self):
+        while True:
+            for symbol, price in self.ticks:
+                yield symbol, price, int(time.time() * 1000)
+                await asyncio.sleep(self.interval)
+            if not self.loop:
+                return
+
+# --- Hub ---
+
+class PriceHub:
+    """
+    One upstream connection per exchange, fanned out to any number of subscribers.
+    Keeps the latest tick per "exchange:symbol" in memory, pushes only changed ticks
+    and recomputes the kimchi premium incrementally whenever one of its legs moves.
+    The snapshot's kimchi carries "as_of" (oldest leg receive time) and "stale" so
+    readers can fall back to REST when a feed drops or goes quiet.
+    """
+    KIMCHI_LEGS = ("upbit:BTC/KRW", "upbit:USDT/KRW", "binance:BTC/USDT")
+    QUEUE_SIZE = 256
+
+    def __init__(self, feeds=None):
+        self.feeds = feeds
+        self.latest = {}
+        self.received = {}
+        self.kimchi = None
+        self.subscribers = set()
+        self.status = {}
+        self.tasks = []
+
+    @staticmethod
+    def default_feeds():
+        if settings.STREAM_REPLAY_PATH:
+            return ReplayFeed.from_jsonl(settings.STREAM_REPLAY_PATH)
+        return [UpbitFeed(settings.STREAM_UPBIT_PAIRS), BinanceFeed(settings.STREAM_BINANCE_PAIRS)]
+
+    # --- Lifecycle ---
+    def start(self):
+        if self.feeds is None:
+            self.feeds = self.default_feeds()
+        for feed in self.feeds:
+            self.status[feed.name] = {"connected": False, "ticks": 0, "reconnects": 0, "last_error": None}
+            self.tasks.append(asyncio.create_task(self._run(feed), name=f"stream-{feed.name}"))
+        print(f"📡 Price stream started ({', '.join(self.status)})")
+
+    async def stop(self):
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+
+    async def _run(self, feed):
+        status = self.status[feed.name]
+        backoff = 1
+        while True:
+            try:
+                async for symbol, price, ts in feed.stream():
+                    status["connected"] = True
+                    status["ticks"] += 1
+                    backoff = 1
+                    self.on_tick(feed.name, symbol, price, ts)
+                # Finite feed (replay without loop)
+                status["connected"] = False
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                status["connected"] = False
+                status["reconnects"] += 1
+                status["last_error"] = str(e)
+                print(f"❌ [Stream] {feed.name}: {e} (retry in {backoff}s)")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 30)
+
+    # --- Ticks ---
+    def on_tick(self, exchange, symbol, price, ts=None):
+        key = f"{exchange}:{symbol}"
+        self.received[key] = time.time()
+        prev = self.latest.get(key)
+        if prev is not None and prev["price"] == price:
+            return
+        tick = {"exchange": exchange, "symbol": symbol, "price": price, "timestamp": ts}
+        self.latest[key] = tick
+        self.publish({"type": "tick", "key": key, **tick})
+
+        if key in self.KIMCHI_LEGS:
+            kimchi = self._compute_kimchi()
+            if kimchi is not None and kimchi != self.kimchi:
+                self.kimchi = kimchi
+                self.publish({"type": "kimchi", **kimchi})
+
+    def _compute_kimchi(self):
+        legs = [self.latest.get(k) for k in self.KIMCHI_LEGS]
+        if any(leg is None for leg in legs):
+            return None
+        btc_korea_krw, usd_krw_rate, btc_global_usd = (leg["price"] for leg in legs)
+        btc_global_krw = btc_global_usd * usd_krw_rate
+        if not btc_global_krw:
+            return None
+        return {
+            "btc_global_usd": btc_global_usd,
+            "btc_korea_krw": btc_korea_krw,
+            "usd_krw_rate": usd_krw_rate,
+            "premium_percent": (btc_korea_krw - btc_global_krw) / btc_global_krw * 100,
+        }
+
+    def _kimchi_status(self):
+        """Kimchi premium with freshness: stale if a leg's feed is down or silent too long."""
+        if self.kimchi is None:
+            return None
+        as_of = min(self.received.get(k, 0) for k in self.KIMCHI_LEGS)
+        connected = all(
+            self.status.get(k.split(":")[0], {}).get("connected", False) for k in self.KIMCHI_LEGS
+        )
+        stale = not connected or time.time() - as_of > settings.STREAM_KIMCHI_MAX_AGE
+        return {**self.kimchi, "as_of": as_of, "stale": stale}
+
+    # --- Subscribers ---
+    def snapshot(self):
+        return {"type": "snapshot", "ticks": dict(self.latest), "kimchi": self._kimchi_status()}
+
+    def subscribe(self):
+        queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        queue.put_nowait(self.snapshot())
+        self.subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue):
+        self.subscribers.discard(queue)
+
+    def publish(self, message):
+        for queue in self.subscribers:
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # Slow consumer: drop its backlog and resync with one snapshot
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(self.snapshot())
+
+price_hub = PriceHub()
@@ -0,0 +1,119 @@
+
+import asyncio
+import random
+import time
+from datetime import datetime
+from backend_fastapi.core.config import settings
+from backend_fastapi.db.session import AsyncSessionLocal
+from backend_fastapi.services.kr_loader import KRStockLoader
+from backend_fastapi.services.us_loader import USStockLoader
+from backend_fastapi.services.crypto_loader import CryptoLoader
+from backend_fastapi.services.fred_loader import FredLoader
+from shared.market_universe import (
+    DEFAULT_FAVORITES, DEFAULT_KR_FAVORITES, KR_STOCK_INFO, is_krx_open, read_watchlist,
+)
+
+class RateBudget:
+    """Token bucket: at most `calls_per_minute` upstream calls per source."""
+    def __init__(self, calls_per_minute: int):
+        self.rate = calls_per_minute / 60.0
+        self.capacity = max(1, calls_per_minute)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class IngestionScheduler:
+    """
+    Background refresh of the configured universe so request handlers read warm data.
+    One asyncio task per source with jittered intervals, a per-source rate budget and
+    KRX market-hours awareness (KR bars are only polled during the 09:00-15:30 KST session,
+    plus one warm-up pass at startup).
+    """
+    def __init__(self):
+        self.tasks = []
+        self.status = {}
+        self.kr_loader = KRStockLoader()
+        self.sources = {
+            "kr": (self.kr_universe, self.refresh_kr),
+            "us": (self.us_universe, self.refresh_us),
+            # All pairs in one fetch_tickers call (single batch item)
+            "crypto": (lambda: [tuple(settings.SCHEDULER_CRYPTO_PAIRS)], self.refresh_crypto),
+            "fred": (lambda: list(settings.SCHEDULER_FRED_SERIES), self.refresh_fred),
+        }
+
+    # --- Universe ---
+    @staticmethod
+    def kr_universe():
+        codes = [t.split(":")[-1] for t in read_watchlist(settings.WATCHLIST_KR_PATH, DEFAULT_KR_FAVORITES)]
+        codes += list(KR_STOCK_INFO.keys())
+        return list(dict.fromkeys(["KOSPI", "KOSDAQ"] + codes))
+
+    @staticmethod
+    def us_universe():
+        return list(dict.fromkeys(read_watchlist(settings.WATCHLIST_US_PATH, DEFAULT_FAVORITES)))
+
+    # --- Refreshers (one symbol, own session) ---
+    async def refresh_kr(self, db, symbol):
+        await self.kr_loader.sync_daily(symbol, db, days=settings.SCHEDULER_KR_DAYS)
+
+    async def refresh_us(self, db, symbol):
+        await USStockLoader(db).fetch_and_save_daily(symbol, days=settings.SCHEDULER_US_DAYS)
+
+    async def refresh_crypto(self, db, pairs):
+        if await CryptoLoader(db).fetch_latest_prices(list(pairs)) is None:
+            raise RuntimeError("fetch_tickers failed")
+
+    async def refresh_fred(self, db, symbol):
+        await FredLoader(db).fetch_and_save_series(symbol)
+
+    # --- Loop ---
+    def start(self):
+        for name, cfg in settings.SCHEDULER_SOURCES.items():
+            if name in self.sources:
+                self.status[name] = {"runs": 0, "calls": 0, "errors": 0, "skipped": 0, "last_run": None}
+                self.tasks.append(asyncio.create_task(self._loop(name, cfg), name=f"ingest-{name}"))
+        print(f"⏱️  Scheduler started ({', '.join(self.status)})")
+
+    async def stop(self):
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+
+    async def _loop(self, name, cfg):
+        universe, refresh = self.sources[name]
+        budget = RateBudget(cfg["calls_per_minute"])
+        status = self.status[name]
+        first = True
+        while True:
+            if name == "kr" and not first and not is_krx_open():
+                status["skipped"] += 1
+            else:
+                await self._run_once(universe(), refresh, budget, status)
+            first = False
+            jitter = 1 + random.uniform(-settings.SCHEDULER_JITTER, settings.SCHEDULER_JITTER)
+            await asyncio.sleep(cfg["interval"] * jitter)
+
+    async def _run_once(self, symbols, refresh, budget, status):
+        for symbol in symbols:
+            await budget.acquire()
+            try:
+                async with AsyncSessionLocal() as db:
+                    await refresh(db, symbol)
+                status["calls"] += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                status["errors"] += 1
+                print(f"❌ [Scheduler] {symbol}: {e}")
+        status["runs"] += 1
+        status["last_run"] = datetime.utcnow().isoformat()
@@ -1,10 +1,12 @@
 
 import FinanceDataReader as fdr
-import pandas as pd
+import asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from datetime import datetime, timedelta
 from backend_fastapi.db.models import AssetPrice
+from backend_fastapi.db.upsert import upsert_asset_prices
+from shared.ohlcv_format import frame_to_columns
 
 class USStockLoader:
     def __init__(self, db: AsyncSession):
@@ -22,31 +24,26 @@ class USStockLoader:
         start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
         
         try:
-            # Sync call to FDR
-            df = fdr.DataReader(symbol, start_date)
+            # Sync FDR call -> thread
+            df = await asyncio.to_thread(fdr.DataReader, symbol, start_date)
             if df.empty:
                 print(f"⚠️  [US] No data found for {symbol}")
                 return False
                 
-            count = 0
-            for index, row in df.iterrows():
-                ts = index.to_pydatetime()
-                
-                # Create AssetPrice entry
-                price_entry = AssetPrice(
-                    symbol=symbol,
-                    asset_type="STOCK_US",
-                    timestamp=ts,
-                    open=row['Open'],
-                    high=row['High'],
-                    low=row['Low'],
-                    close=row['Close'],
-                    volume=row.get('Volume', 0),
-                    source="FDR"
+            cols = frame_to_columns(df)
+            rows = [
+                {
+                    "symbol": symbol, "asset_type": "STOCK_US",
+                    "timestamp": datetime.fromisoformat(t),
+                    "open": o, "high": h, "low": l, "close": c, "volume": v,
+                    "source": "FDR",
+                }
+                for t, o, h, l, c, v in zip(
+                    cols["time"], cols["open"], cols["high"], cols["low"], cols["close"], cols["volume"]
                 )
-                self.db.add(price_entry)
-                count += 1
-            
+            ]
+            # One upsert batch per symbol (idempotent on re-runs)
+            count = await upsert_asset_prices(self.db, rows)
             await self.db.commit()
             print(f"✅ [US] Saved {count} rows for {symbol}")
             return True
@@ -0,0 +1,69 @@
+"""
+Chart Payload Benchmark - render_lightweight_chart before/after downsampling
+
+Usage:
+    python benchmarks/bench_chart_payload.py
+
+기간(1Y/3Y/5Y 일봉 수)과 차트 폭(기준 폭 1열 / 3열 그리드)별로 캔들/라인 차트의
+컴포넌트 args(JSON) 크기, 전송 점 수, 서버 측 생성 시간(다운샘플링 포함)을 비교합니다. 브라우저 렌더 시간은 전송 점 수에 비례하므로
+점 수를 함께 표시합니다 (Lightweight Charts setData는 점 수에 선형).
+"""
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import components.lightweight_chart as lightweight_chart  # noqa: E402
+from components.tv_widgets import TradingViewWidget  # noqa: E402
+from services.chart_downsample import downsample_columns, point_budget  # noqa: E402
+
+PERIODS = {"1Y": 365, "3Y": 1095, "5Y": 2000}
+REPEAT = 5
+
+_captured = []
+lightweight_chart._component = lambda key=None, default=None, **args: _captured.append(json.dumps(args))
+
+
+def synthetic_columns(n):
+    rng = np.random.default_rng(0)
+    close = 2500 + np.cumsum(rng.normal(0, 15, n))
+    idx = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=n)
+    return {
+        "time": idx.strftime("%Y-%m-%d").tolist(),
+        "open": (close + rng.normal(0, 5, n)).round(2).tolist(),
+        "high": (close + 20).round(2).tolist(),
+        "low": (close - 20).round(2).tolist(),
+        "close": close.round(2).tolist(),
+        "volume": rng.integers(1e5, 1e6, n).tolist(),
+    }
+
+
+def measure(data, max_points):
+    best = float("inf")
+    for _ in range(REPEAT):
+        _captured.clear()
+        start = time.perf_counter()
+        TradingViewWidget.render_lightweight_chart(data, "BENCH", 320, max_points=max_points)
+        best = min(best, time.perf_counter() - start)
+    points = len(downsample_columns(data, max_points)["time"])
+    return len(_captured[-1].encode("utf-8")), points, best * 1000
+
+
+def main():
+    print(f"{'period':<8}{'series':<8}{'mode':<10}{'points':>8}{'payload KB':>12}{'build ms':>10}")
+    for label, n in PERIODS.items():
+        candles = synthetic_columns(n)
+        line = {"time": candles["time"], "value": candles["close"]}
+        for series, data in (("candle", candles), ("line", line)):
+            for mode, max_points in (("full", None), ("1-col", point_budget(None, 1)), ("3-col", point_budget(None, 3))):
+                size, points, ms = measure(data, max_points)
+                print(f"{label:<8}{series:<8}{mode:<10}{points:>8}{size / 1024:>12.1f}{ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+News Classifier Benchmark - legacy substring categorize_news vs precompiled matcher
+
+Usage:
+    python benchmarks/bench_news_classifier.py [반복 배수]
+
+benchmarks/news_labeled.csv (label: 1 거시, 2 지수, 3 주식)로
+- 정확도 / 카테고리별 precision
+- 피드 규모(수백 건)로 늘렸을 때 처리 시간
+을 비교합니다. "substring xN"은 새 키워드 테이블 전체를 기존 방식(부분 문자열 루프)으로
+검사한 경우로, 키워드 수가 늘 때 정규식 한 번 스캔과의 비용 차이를 보여줍니다.
+"""
+import csv
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.news_classifier import KEYWORDS, KeywordClassifier, classify_title  # noqa: E402
+
+LABELED_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "news_labeled.csv")
+
+
+def legacy_categorize(title, source=None):
+    """기존 categorize_news (비교용 사본)"""
+    t = title.lower()
+    macro = ['fed', 'rate', 'inflation', 'cpi', 'gdp', 'job', 'economy', 'recession', 'policy', 'treasury', 'yield', 'war', 'oil', 'gold', '금리', '물가', '연준']
+    index = ['s&p', 'nasdaq', 'dow', 'market', 'stocks', 'rally', 'crash', 'bull', 'bear', 'index', 'kospi', 'kosdaq', '지수', '증시', '상승', '하락', 'futures']
+    if any(k in t for k in macro): return 1
+    if any(k in t for k in index): return 2
+    return 3
+
+
+def substring_weighted(title, source=None):
+    """같은 키워드/가중치 테이블을 부분 문자열 루프로 검사 (키워드 수에 비례하는 비용 비교용)"""
+    t = title.lower()
+    scores = {}
+    for cat, terms in KEYWORDS.items():
+        for term, weight in terms.items():
+            if term in t:
+                scores[cat] = scores.get(cat, 0) + weight
+    return max(sorted(scores), key=lambda c: scores[c]) if scores else 3
+
+
+def evaluate(fn, rows):
+    predicted = [fn(r["title"], r["source"]) for r in rows]
+    correct = sum(p == int(r["label"]) for p, r in zip(predicted, rows))
+    precision = {}
+    for cat in (1, 2, 3):
+        hits = [int(r["label"]) == cat for p, r in zip(predicted, rows) if p == cat]
+        precision[cat] = sum(hits) / len(hits) if hits else 0.0
+    return correct / len(rows), precision
+
+
+def throughput(fn, rows, repeat):
+    items = rows * repeat
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for r in items:
+            fn(r["title"], r["source"])
+        best = min(best, time.perf_counter() - start)
+    return len(items), best * 1000
+
+
+def scaling(rows, sizes=(0, 500, 1000, 2000)):
+    """키워드 테이블 크기별 처리 시간 (임의 키워드를 추가해 테이블 확장)"""
+    rng = random.Random(1)
+    print(f"\n{'keywords':>10}{'substring ms':>14}{'precompiled ms':>16}")
+    for extra in sizes:
+        table = {cat: dict(terms) for cat, terms in KEYWORDS.items()}
+        for i in range(extra):
+            term = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 9)))
+            table[1 + i % 3][term] = 1
+        classifier = KeywordClassifier(table)
+
+        def substring(title, source=None):
+            t = title.lower()
+            return [term for terms in table.values() for term in terms if term in t]
+
+        n_terms = sum(len(t) for t in table.values())
+        _, sub_ms = throughput(substring, rows, 10)
+        _, pre_ms = throughput(lambda title, source=None: classifier.scores(title), rows, 10)
+        print(f"{n_terms:>10}{sub_ms:>14.2f}{pre_ms:>16.2f}")
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    with open(LABELED_PATH, encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+
+    print(f"labeled set: {len(rows)} headlines\n")
+    print(f"{'classifier':<16}{'accuracy':>10}{'P(macro)':>10}{'P(index)':>10}{'P(stock)':>10}{'items':>8}{'ms':>9}")
+    n_terms = sum(len(t) for t in KEYWORDS.values())
+    cases = (
+        ("legacy", legacy_categorize),
+        (f"substring x{n_terms}", substring_weighted),
+        ("precompiled", classify_title),
+    )
+    for name, fn in cases:
+        acc, prec = evaluate(fn, rows)
+        n, ms = throughput(fn, rows, repeat)
+        print(f"{name:<16}{acc:>10.1%}{prec[1]:>10.1%}{prec[2]:>10.1%}{prec[3]:>10.1%}{n:>8}{ms:>9.2f}")
+
+    print("\nlegacy misclassifications fixed / introduced:")
+    for r in rows:
+        old, new, label = legacy_categorize(r["title"]), classify_title(r["title"], r["source"]), int(r["label"])
+        if old != new:
+            mark = "fixed" if new == label else ("broke" if old == label else "still wrong")
+            print(f"  [{mark}] {label} legacy={old} new={new}  {r['title']}")
+
+    scaling(rows)
+
+
+if __name__ == "__main__":
+    main()
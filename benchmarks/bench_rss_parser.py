@@ -0,0 +1,95 @@
+"""
+RSS Parser Benchmark - regex scraping (legacy fetch_rss_news) vs streaming XMLPullParser
+
+Usage:
+    python benchmarks/bench_rss_parser.py                 # 합성 피드 (RSS 2.0, 5000 items)
+    python benchmarks/bench_rss_parser.py feed1.xml ...   # 저장해 둔 실제 피드 파일
+
+각 피드에 대해 최신 30개 / 전체 파싱 시간(최소값)과 tracemalloc peak 메모리를 출력합니다.
+"""
+import html
+import os
+import re
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.rss_parser import parse_feed  # noqa: E402
+
+REPEAT = 5
+
+
+def regex_parse(text, limit=None):
+    """기존 fetch_rss_news의 regex 경로 (비교용 사본, 타임존 무시)"""
+    items = re.findall(r'<item>(.*?)</item>', text, re.DOTALL)
+    out = []
+    for item in items[:limit]:
+        title_m = re.search(r'<title>(.*?)</title>', item, re.DOTALL)
+        link_m = re.search(r'<link>(.*?)</link>', item, re.DOTALL)
+        pub_m = re.search(r'<pubDate>(.*?)</pubDate>', item, re.DOTALL)
+        guid_m = re.search(r'<guid[^>]*>(.*?)</guid>', item, re.DOTALL)
+        if not title_m:
+            continue
+        t = html.unescape(re.sub(r'<!\[CDATA\[(.*?)\]\]>', r'\1', title_m.group(1))).strip()
+        t = re.sub(r'<[^>]+>', '', t)
+        l = re.sub(r'<!\[CDATA\[(.*?)\]\]>', r'\1', link_m.group(1)).strip() if link_m else ""
+        published = None
+        if pub_m:
+            try:
+                published = datetime.strptime(pub_m.group(1).strip()[:25], "%a, %d %b %Y %H:%M:%S").timestamp()
+            except ValueError:
+                pass
+        out.append({"guid": guid_m.group(1) if guid_m else "", "title": t, "link": l, "published": published})
+    return out
+
+
+def synthetic_rss(n_items=5000):
+    now = datetime.now(timezone(timedelta(hours=-5)))
+    body = "Lorem ipsum &amp; dolor sit amet, consectetur adipiscing elit. " * 16
+    items = []
+    for i in range(n_items):
+        pub = (now - timedelta(minutes=i)).strftime("%a, %d %b %Y %H:%M:%S %z")
+        items.append(
+            f"<item><title><![CDATA[Fed holds rates as markets rally #{i}]]></title>"
+            f"<link>https://example.com/news/{i}</link><guid isPermaLink=\"false\">id-{i}</guid>"
+            f"<pubDate>{pub}</pubDate><description>{body}</description></item>"
+        )
+    return ('<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>Bench</title>'
+            + "".join(items) + "</channel></rss>").encode("utf-8")
+
+
+def measure(fn):
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak / 1024, len(result)
+
+
+def main():
+    feeds = [(path, open(path, "rb").read()) for path in sys.argv[1:]] or [("synthetic RSS 2.0 x5000", synthetic_rss())]
+    for name, data in feeds:
+        print(f"\n{name}  ({len(data) / 1024:,.0f} KB)")
+        print(f"{'case':<28}{'time (ms)':>12}{'peak (KB)':>12}{'items':>8}")
+        cases = [
+            # regex 경로는 응답 전체를 str로 디코딩한 뒤 시작
+            ("regex, newest 30", lambda: regex_parse(data.decode("utf-8"), 30)),
+            ("streaming, newest 30", lambda: parse_feed(data, 30)),
+            ("regex, all items", lambda: regex_parse(data.decode("utf-8"))),
+            ("streaming, all items", lambda: parse_feed(data)),
+        ]
+        for label, fn in cases:
+            ms, kb, n = measure(fn)
+            print(f"{label:<28}{ms:>12.2f}{kb:>12,.0f}{n:>8}")
+
+
+if __name__ == "__main__":
+    main()
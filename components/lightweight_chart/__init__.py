@@ -0,0 +1,113 @@
+"""
+Lightweight Chart Component - Vendored TradingView Lightweight Charts (v4.1.3)
+CDN 없이 frontend/ 의 라이브러리를 Streamlit 컴포넌트 정적 파일로 제공합니다.
+- 라이브러리 파일명에 버전 포함 -> 브라우저 캐시 재사용, 오프라인 동작
+- 차트 여러 개를 iframe 하나에 렌더 (라이브러리 다운로드/파싱 1회)
+- key를 주면 iframe과 차트 인스턴스가 rerun 사이에 유지되고, 바뀐 봉만 전송 (series.update)
+
+증분 갱신 프로토콜 (args):
+    revision: 이번 상태 번호
+    base_revision: None이면 전체(full), 아니면 이 번호 상태에 적용할 delta
+    charts[i].mode: "full" | "delta" (cols = 마지막으로 보낸 봉부터의 꼬리) | "none"
+    charts[i].budget / reduced / view: 점 예산, 다운샘플 여부, 세밀하게 보낸 구간 (확대 요청 판단용)
+프론트엔드가 base_revision 상태를 갖고 있지 않으면(새 iframe 등) 컴포넌트 값으로
+{"need_full": true, "request": id}를 보내고, 다음 실행에서 전체를 다시 보냅니다.
+
+뷰포트 보고 (컴포넌트 값, key 지정 시):
+    width: iframe 렌더 폭 (px) -> 차트별 점 예산 계산
+    views[i]: 확대된 차트의 보이는 구간 [시작 time, 끝 time] (없으면 null) -> 그 구간만 세밀하게 전송
+"""
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+_FRONTEND_DIR = Path(__file__).parent / "frontend"
+_component = components.declare_component("lightweight_chart", path=str(_FRONTEND_DIR))
+
+
+def chart_viewport(key: Optional[str]) -> Tuple[Optional[float], List[Optional[list]]]:
+    """프론트엔드가 보고한 (렌더 폭, 차트별 확대 구간). key가 없거나 아직 보고 전이면 (None, [])"""
+    value = (st.session_state.get(key) if key else None) or {}
+    width = value.get("width")
+    views = value.get("views") or []
+    return (float(width) if isinstance(width, (int, float)) and width > 0 else None), list(views)
+
+
+def _tail_delta(prev: Dict[str, list], cols: Dict[str, list]) -> Optional[Dict[str, list]]:
+    """
+    prev 이후 바뀐 꼬리 (마지막 봉 갱신 + 새 봉). 앞부분이 달라졌으면 None (전체 전송 필요)
+    변경이 없으면 빈 dict
+    """
+    n_prev = len(prev.get("time", []))
+    if n_prev == 0 or set(prev) != set(cols) or len(cols["time"]) < n_prev:
+        return None
+    k = n_prev - 1
+    for name, values in cols.items():
+        if values[:k] != prev[name][:k]:
+            return None
+    if all(cols[name][k:] == prev[name][k:] for name in cols):
+        return {}
+    return {name: values[k:] for name, values in cols.items()}
+
+
+def _incremental_args(key: str, charts: List[dict], layout: dict) -> dict:
+    state_key = f"_lwc_state_{key}"
+    state = st.session_state.get(state_key)
+    value = st.session_state.get(key) or {}
+    request = value.get("request") if value.get("need_full") else None
+
+    full = (
+        state is None
+        or state["layout"] != layout
+        or [(c["title"], c["is_candle"]) for c in charts] != state["series"]
+        or (request is not None and request != state["handled_request"])
+    )
+
+    if not full:
+        deltas = [_tail_delta(prev, c["cols"]) for prev, c in zip(state["cols"], charts)]
+        if any(d is None for d in deltas):
+            full = True
+        elif not any(deltas):
+            return state["last_args"]  # 변경 없음: 같은 args -> 프론트엔드는 무시
+
+    revision = (state["revision"] + 1) if state else 1
+    if full:
+        specs = [dict(c, mode="full") for c in charts]
+        base_revision = None
+    else:
+        specs = [
+            dict(c, mode="delta", cols=d) if d else {"title": c["title"], "is_candle": c["is_candle"], "mode": "none"}
+            for c, d in zip(charts, deltas)
+        ]
+        base_revision = state["revision"]
+
+    args = dict(layout, charts=specs, revision=revision, base_revision=base_revision)
+    st.session_state[state_key] = {
+        "revision": revision,
+        "layout": layout,
+        "series": [(c["title"], c["is_candle"]) for c in charts],
+        "cols": [c["cols"] for c in charts],
+        "handled_request": request if request is not None else (state or {}).get("handled_request"),
+        "last_args": args,
+    }
+    return args
+
+
+def lightweight_charts(charts: List[dict], height: int = 300, columns: int = 1, key: Optional[str] = None):
+    """
+    차트 묶음 렌더
+
+    Args:
+        charts: [{"title", "cols"(columnar payload), "is_candle"}]
+        height: 차트 하나의 높이 (px)
+        columns: 한 줄에 배치할 차트 수
+        key: 고정 key (지정 시 차트 인스턴스 유지 + 증분 갱신)
+    """
+    layout = {"height": height, "columns": columns}
+    if key is None:
+        args = dict(layout, charts=[dict(c, mode="full") for c in charts], revision=0, base_revision=None)
+    else:
+        args = _incremental_args(key, charts, layout)
+    return _component(**args, key=key, default=None)
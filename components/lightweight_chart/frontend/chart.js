@@ -0,0 +1,240 @@
+// Lightweight Charts Streamlit component (no build step / no streamlit-component-lib)
+// args: { charts: [{ title, cols, is_candle, mode, budget, reduced, view }], height, columns, revision, base_revision }
+// mode "full" -> setData, "delta" -> series.update per bar (last bar replaced, new bars appended), "none" -> skip
+// Component value: { width, views, need_full?, request? }
+//   width: rendered iframe width -> server-side point budget per chart
+//   views[i]: visible [from, to] time of a zoomed-in downsampled chart -> server sends that range in detail
+(function () {
+    const root = document.getElementById("root");
+    let mounted = [];   // [{ title, isCandle, chart, main, volume, el, times, spec }]
+    let revision = null;
+    const nonce = Math.random().toString(36).slice(2);
+    let requests = 0;
+    const report = { width: null, views: [] };
+    const ZOOM_DEBOUNCE_MS = 400;
+
+    const LAYOUT = { background: { type: "solid", color: "#131722" }, textColor: "#d1d4dc", fontSize: 12 };
+    const GRID = {
+        vertLines: { color: "rgba(42, 46, 57, 0.2)", style: 1 },
+        horzLines: { color: "rgba(42, 46, 57, 0.2)", style: 1 },
+    };
+    const UP = "rgba(38, 166, 154, 0.5)";
+    const DOWN = "rgba(239, 83, 80, 0.5)";
+
+    function send(type, data) {
+        window.parent.postMessage(Object.assign({ isStreamlitMessage: true, type: type }, data), "*");
+    }
+
+    // columnar payload -> series arrays
+    function buildSeries(cols, isCandle) {
+        const n = cols.time.length;
+        const main = new Array(n);
+        const volume = isCandle ? new Array(n) : null;
+        for (let i = 0; i < n; i++) {
+            if (isCandle) {
+                main[i] = { time: cols.time[i], open: cols.open[i], high: cols.high[i], low: cols.low[i], close: cols.close[i] };
+                volume[i] = { time: cols.time[i], value: cols.volume[i], color: cols.close[i] >= cols.open[i] ? UP : DOWN };
+            } else {
+                main[i] = { time: cols.time[i], value: cols.value[i] };
+            }
+        }
+        return { main: main, volume: volume };
+    }
+
+    function mount(spec, height, index) {
+        const el = document.createElement("div");
+        el.className = "chart";
+        el.style.height = height + "px";
+        const mark = document.createElement("div");
+        mark.className = "watermark";
+        mark.textContent = spec.title;
+        el.appendChild(mark);
+        root.appendChild(el);
+
+        const entry = {
+            title: spec.title, isCandle: spec.is_candle, el: el, chart: null, main: null, volume: null,
+            times: null, view: null, spec: spec, index: index, timer: null,
+        };
+        if (!spec.cols.time.length) {
+            el.classList.add("empty");
+            el.textContent = "No Data for " + spec.title;
+            return entry;
+        }
+
+        const chart = LightweightCharts.createChart(el, {
+            width: el.clientWidth || 300,
+            height: height,
+            layout: LAYOUT,
+            grid: GRID,
+            crosshair: { mode: 0 },
+            timeScale: { borderColor: "rgba(197, 203, 206, 0.3)", timeVisible: true },
+            rightPriceScale: { borderColor: "rgba(197, 203, 206, 0.3)" },
+        });
+        entry.chart = chart;
+        if (spec.is_candle) {
+            entry.main = chart.addCandlestickSeries({
+                upColor: "#26a69a", downColor: "#ef5350",
+                borderVisible: false, wickUpColor: "#26a69a", wickDownColor: "#ef5350",
+            });
+            entry.volume = chart.addHistogramSeries({
+                color: "#26a69a", priceFormat: { type: "volume" }, priceScaleId: "volume_pane",
+            });
+            chart.priceScale("volume_pane").applyOptions({ scaleMargins: { top: 0.8, bottom: 0 }, visible: false });
+        } else {
+            entry.main = chart.addAreaSeries({
+                topColor: "rgba(41, 121, 255, 0.3)", bottomColor: "rgba(41, 121, 255, 0)",
+                lineColor: "#2979ff", lineWidth: 2,
+            });
+        }
+        new ResizeObserver(function (entries) {
+            for (const e of entries) {
+                if (e.contentRect.width > 0) chart.applyOptions({ width: e.contentRect.width });
+            }
+        }).observe(el);
+        chart.timeScale().subscribeVisibleLogicalRangeChange(function () {
+            clearTimeout(entry.timer);
+            entry.timer = setTimeout(function () { checkView(entry); }, ZOOM_DEBOUNCE_MS);
+        });
+        return entry;
+    }
+
+    // --- Viewport reporting ---
+    function sendValue(extra) {
+        send("streamlit:setComponentValue", {
+            value: Object.assign({ width: report.width, views: report.views }, extra || {}), dataType: "json",
+        });
+    }
+
+    function reportWidth() {
+        const width = root.clientWidth;
+        if (!width) return false;
+        // Only significant changes (avoid a rerun per pixel while resizing)
+        if (report.width && Math.abs(width - report.width) / report.width < 0.15) return false;
+        report.width = width;
+        return true;
+    }
+
+    function visibleTimes(entry) {
+        const range = entry.chart.timeScale().getVisibleLogicalRange();
+        const times = entry.times;
+        if (!range || !times || !times.length) return null;
+        const clamp = function (i) { return Math.min(times.length - 1, Math.max(0, i)); };
+        return { from: times[clamp(Math.floor(range.from))], to: times[clamp(Math.ceil(range.to))], bars: range.to - range.from };
+    }
+
+    // Zoomed in on a downsampled chart -> ask for the visible range in detail; zoomed back out -> overview
+    function checkView(entry) {
+        const spec = entry.spec;
+        if (!entry.chart || !spec || !(spec.reduced || spec.view)) return;
+        const vis = visibleTimes(entry);
+        if (!vis) return;
+        const view = spec.view;
+        const outside = !view || vis.from < view[0] || vis.to > view[1];
+        let want;
+        if (vis.bars < (spec.budget || 0) / 4) {
+            if (!outside) return;
+            want = [vis.from, vis.to];
+        } else {
+            if (!view || !outside) return;
+            want = null;
+        }
+        report.views[entry.index] = want;
+        sendValue();
+    }
+
+    function restoreView(entry, keep) {
+        const times = entry.times;
+        const lower = function (t) {
+            let lo = 0, hi = times.length;
+            while (lo < hi) { const mid = (lo + hi) >> 1; if (times[mid] < t) lo = mid + 1; else hi = mid; }
+            return lo;
+        };
+        entry.chart.timeScale().setVisibleLogicalRange({ from: lower(keep.from), to: lower(keep.to) });
+    }
+
+    function setData(entry, spec) {
+        entry.spec = spec;
+        if (!entry.chart) return;
+        // Detail in/out for a zoom request: keep the user's visible range instead of fitting everything
+        const keep = entry.times && (spec.view || entry.view) ? visibleTimes(entry) : null;
+        const series = buildSeries(spec.cols, spec.is_candle);
+        entry.main.setData(series.main);
+        if (entry.volume) entry.volume.setData(series.volume);
+        entry.times = spec.cols.time;
+        entry.view = spec.view;
+        if (keep) restoreView(entry, keep);
+        else entry.chart.timeScale().fitContent();
+    }
+
+    function applyDelta(entry, spec) {
+        if (!entry.chart) return;
+        const series = buildSeries(spec.cols, spec.is_candle);
+        // Delta: cols start at the last bar already shown (replace it, append the rest)
+        entry.times = entry.times.slice(0, entry.times.length - 1).concat(spec.cols.time);
+        entry.spec = Object.assign({}, spec, { cols: null });
+        for (let i = 0; i < series.main.length; i++) {
+            entry.main.update(series.main[i]);
+            if (entry.volume) entry.volume.update(series.volume[i]);
+        }
+    }
+
+    function requestFull() {
+        requests += 1;
+        reportWidth();
+        sendValue({ need_full: true, request: nonce + ":" + requests });
+    }
+
+    function sameLayout(specs) {
+        return mounted.length === specs.length && specs.every(function (s, i) {
+            const m = mounted[i];
+            return m.title === s.title && m.isCandle === s.is_candle && !!m.chart === s.cols.time.length > 0;
+        });
+    }
+
+    function render(args) {
+        const specs = args.charts || [];
+        const height = args.height || 300;
+        if (args.revision === revision && revision !== 0) {
+            send("streamlit:setFrameHeight", { height: root.scrollHeight });
+            return;  // same state re-sent on an unrelated rerun
+        }
+        const isFull = args.base_revision === null || args.base_revision === undefined;
+        if (!isFull && args.base_revision !== revision) {
+            requestFull();  // missed a revision (e.g. new iframe): ask the server for full data
+            return;
+        }
+        root.style.gridTemplateColumns = "repeat(" + (args.columns || 1) + ", minmax(0, 1fr))";
+        try {
+            if (isFull) {
+                if (!sameLayout(specs)) {
+                    mounted.forEach(function (m) { if (m.chart) m.chart.remove(); });
+                    root.innerHTML = "";
+                    report.views = [];
+                    mounted = specs.map(function (s, i) { return mount(s, height, i); });
+                }
+                specs.forEach(function (s, i) { setData(mounted[i], s); });
+            } else {
+                specs.forEach(function (s, i) { if (s.mode === "delta") applyDelta(mounted[i], s); });
+            }
+            revision = args.revision;
+            // First render (or a large resize): tell the server the real width for the point budget
+            if (reportWidth()) sendValue();
+        } catch (e) {
+            root.innerHTML = '<div class="error">Error: ' + e.message + "</div>";
+            mounted = [];
+            revision = null;
+        }
+        send("streamlit:setFrameHeight", { height: root.scrollHeight });
+    }
+
+    let resizeTimer = null;
+    new ResizeObserver(function () {
+        clearTimeout(resizeTimer);
+        resizeTimer = setTimeout(function () { if (revision !== null && reportWidth()) sendValue(); }, ZOOM_DEBOUNCE_MS);
+    }).observe(root);
+
+    window.addEventListener("message", function (event) {
+        if (event.data && event.data.type === "streamlit:render") render(event.data.args);
+    });
+    send("streamlit:componentReady", { apiVersion: 1 });
+})();
@@ -2,8 +2,14 @@
 TradingView Widget Library v7.0
 Added symbol-info widget for indices
 """
+from typing import Optional, Union
+
 import streamlit.components.v1 as components
 
+from components.lightweight_chart import chart_viewport, lightweight_charts
+from services.chart_downsample import downsample_view, point_budget
+from shared.ohlcv_format import as_columns
+
 
 class TradingViewWidget:
     """TradingView 위젯 생성기 - v7.0"""
@@ -194,139 +200,53 @@ class TradingViewWidget:
         components.html(html_code, height=height)
 
     @staticmethod
-    def render_lightweight_chart(data: list, title: str, height: int = 300) -> None:
+    def _chart_spec(data, title: str, max_points: Optional[int], view=None) -> dict:
+        """차트 데이터 -> 컴포넌트 payload (columnar, 다운샘플링 적용, view 구간은 세밀하게)"""
+        raw = as_columns(data)
+        cols, detail = downsample_view(raw, max_points, view)
+        if not cols.get("time"):
+            return {"title": title, "cols": {"time": []}, "is_candle": False}
+        meta = {"budget": max_points, "reduced": len(cols["time"]) < len(raw["time"]), "view": detail}
+
+        # Series Data: columnar 그대로 전달하고 브라우저에서 series 객체로 변환
+        is_candle = 'open' in cols
+        if is_candle:
+            payload = {k: cols[k] for k in ("time", "open", "high", "low", "close")}
+            payload["volume"] = cols.get("volume") or [0] * len(cols["time"])
+        else:
+            payload = {"time": cols["time"], "value": cols["value"]}
+        return {"title": title, "cols": payload, "is_candle": is_candle, **meta}
+
+    @staticmethod
+    def render_lightweight_chart(data, title: str, height: int = 300, max_points: Union[int, str, None] = "auto",
+                                 key: Optional[str] = None) -> None:
         """
         Custom Data를 사용해 TradingView Lightweight Charts 렌더링 (Candle + Volume)
+        data: row 리스트 [{time, open, ...}] 또는 columnar dict {"time": [...], "open": [...], ...}
+        max_points: 전송할 최대 점 수 (초과 시 주봉/월봉 집계 또는 LTTB).
+            "auto"면 렌더 폭 기준 예산 + 확대 구간 세밀 전송, None이면 원본 그대로
+        key: 고정 key를 주면 차트를 유지한 채 바뀐 봉만 전송 (폭/확대 보고도 key가 있어야 동작)
         """
-        import uuid
-        import json
-        
-        if not data:
-            components.html(f"<div style='color:#6b7280; font-family:sans-serif; padding:20px; background:#131722; height:{height}px;'>No Data for {title}</div>", height=height)
-            return
-
-        is_candle = 'open' in data[0]
-        chart_id = f"chart_{uuid.uuid4().hex}"
-        
-        # Color & Config (Prober-like)
-        layout_cfg = {
-            "background": {"type": "solid", "color": "#131722"},
-            "textColor": "#d1d4dc",
-            "fontSize": 12,
-        }
-        grid_cfg = {
-            "vertLines": {"color": "rgba(42, 46, 57, 0.2)", "style": 1},
-            "horzLines": {"color": "rgba(42, 46, 57, 0.2)", "style": 1},
-        }
-        
-        # Series Data Preparation
-        main_data = []
-        volume_data = []
-        
-        for d in data:
-            time_val = d['time']
-            if is_candle:
-                main_data.append({
-                    "time": time_val,
-                    "open": d['open'], "high": d['high'], "low": d['low'], "close": d['close']
-                })
-                # Volume data with color logic
-                vol_color = "rgba(38, 166, 154, 0.5)" if d['close'] >= d['open'] else "rgba(239, 83, 80, 0.5)"
-                volume_data.append({
-                    "time": time_val,
-                    "value": d.get('volume', 0),
-                    "color": vol_color
-                })
-            else:
-                main_data.append({"time": time_val, "value": d['value']})
+        TradingViewWidget.render_lightweight_charts(
+            [(data, title)], height=height, columns=1, max_points=max_points, key=key
+        )
 
-        html_code = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <style>
-                body {{ margin: 0; padding: 0; background-color: #131722; overflow: hidden; }}
-                #{chart_id} {{ width: 100%; height: {height}px; position: relative; }}
-                .watermark {{
-                    position: absolute; top: 10px; left: 10px; font-size: 14px;
-                    color: rgba(255, 255, 255, 0.15); font-family: sans-serif;
-                    z-index: 5; pointer-events: none;
-                }}
-            </style>
-            <script src="https://unpkg.com/lightweight-charts@4.1.1/dist/lightweight-charts.standalone.production.js"></script>
-        </head>
-        <body>
-            <div id="{chart_id}"><div class="watermark">{title}</div></div>
-            <script>
-            (function() {{
-                const container = document.getElementById('{chart_id}');
-                
-                function init() {{
-                    if (typeof LightweightCharts === 'undefined') {{
-                        setTimeout(init, 50);
-                        return;
-                    }}
-                    
-                    try {{
-                        const chart = LightweightCharts.createChart(container, {{
-                            width: container.clientWidth || 300,
-                            height: {height},
-                            layout: {json.dumps(layout_cfg)},
-                            grid: {json.dumps(grid_cfg)},
-                            crosshair: {{ mode: 0 }},
-                            timeScale: {{ borderColor: "rgba(197, 203, 206, 0.3)", timeVisible: true }},
-                            rightPriceScale: {{ borderColor: "rgba(197, 203, 206, 0.3)" }}
-                        }});
-
-                        // 1. Price Series
-                        let mainSeries;
-                        if ({json.dumps(is_candle)}) {{
-                            mainSeries = chart.addCandlestickSeries({{
-                                upColor: "#26a69a", downColor: "#ef5350",
-                                borderVisible: false, wickUpColor: "#26a69a", wickDownColor: "#ef5350"
-                            }});
-                        }} else {{
-                            mainSeries = chart.addAreaSeries({{
-                                topColor: "rgba(41, 121, 255, 0.3)", bottomColor: "rgba(41, 121, 255, 0)",
-                                lineColor: "#2979ff", lineWidth: 2
-                            }});
-                        }}
-                        mainSeries.setData({json.dumps(main_data)});
-
-                        // 2. Volume Series
-                        if ({json.dumps(is_candle)}) {{
-                            const volumeSeries = chart.addHistogramSeries({{
-                                color: "#26a69a",
-                                priceFormat: {{ type: "volume" }},
-                                priceScaleId: "volume_pane",
-                            }});
-                            volumeSeries.setData({json.dumps(volume_data)});
-                            
-                            chart.priceScale("volume_pane").applyOptions({{
-                                scaleMargins: {{ top: 0.8, bottom: 0 }},
-                                visible: false
-                            }});
-                        }}
-
-                        chart.timeScale().fitContent();
-
-                        const ro = new ResizeObserver(entries => {{
-                            for (let entry of entries) {{
-                                if (entry.contentRect.width > 0) chart.applyOptions({{ width: entry.contentRect.width }});
-                            }}
-                        }});
-                        ro.observe(container);
-                    }} catch (e) {{
-                        container.innerHTML = `<div style="color:#ef5350;padding:10px;font-family:sans-serif;font-size:12px;">Error: ${{e.message}}</div>`;
-                    }}
-                }}
-                
-                if (document.readyState === 'complete') init();
-                else window.addEventListener('load', init);
-            }})();
-            </script>
-        </body>
-        </html>
+    @staticmethod
+    def render_lightweight_charts(items, height: int = 300, columns: int = 2, max_points: Union[int, str, None] = "auto",
+                                  key: Optional[str] = None) -> None:
         """
-        components.html(html_code, height=height)
+        여러 차트를 하나의 컴포넌트(iframe)에 렌더링 - 라이브러리 로드/파싱 1회
+        items: [(data, title), ...]
+        max_points: "auto"면 차트별 예산 = 보고된 iframe 폭 / columns x CHART_POINTS_PER_PX
+        key: 고정 key (rerun 사이 iframe/차트 유지, 새 봉/마지막 봉만 series.update로 반영)
+        """
+        width, views = chart_viewport(key)
+        if max_points == "auto":
+            max_points = point_budget(width, columns)
+        else:
+            views = []  # 고정 예산/원본: 확대 구간 세밀 전송 없음
+        specs = [
+            TradingViewWidget._chart_spec(data, title, max_points, views[i] if i < len(views) else None)
+            for i, (data, title) in enumerate(items)
+        ]
+        lightweight_charts(specs, height=height, columns=columns, key=key)
@@ -10,7 +10,13 @@ from pathlib import Path
 BASE_DIR = Path(__file__).parent.parent
 DATA_DIR = BASE_DIR / "data"
 JOURNAL_PATH = DATA_DIR / "journal.md"
-HISTORY_PATH = DATA_DIR / "market_history.csv"
+JOURNAL_INDEX_PATH = DATA_DIR / "journal.idx"  # 일지 항목 시작 위치 (services/journal_store.py)
+JOURNAL_FSYNC_SEC = 2  # 일지 추가 후 fsync까지 대기 (이 사이의 추가는 한 번에 fsync)
+JOURNAL_SEARCH_DB_PATH = DATA_DIR / "journal_search.db"  # 일지 전문 검색 색인 (services/journal_search.py)
+HISTORY_PATH = DATA_DIR / "market_history.csv"  # 기존 CSV (스냅샷 저장소 최초 생성 시 1회 가져오기)
+SNAPSHOT_DB_PATH = DATA_DIR / "market_history.db"
+NEWS_INDEX_PATH = DATA_DIR / "news_index.json"
+TRANSLATION_CACHE_PATH = DATA_DIR / "translation_cache.json"
 
 # Make sure data directory exists
 os.makedirs(DATA_DIR, exist_ok=True)
@@ -38,3 +44,72 @@ CALENDAR_IMPORTANCE_FILTER = "-1" # Show all or filter by importance in widget s
 
 # AI Service Settings
 AI_MODEL_NAME = "gemini-2.0-flash-exp" # Fast and capable
+
+# FastAPI Backend (backend_fastapi/) - 실패 시 각 서비스가 직접 조회로 폴백
+BACKEND_URL = "http://127.0.0.1:8000/api/v1"
+
+# Cache Settings (services/cache_service.py)
+# Source별 신선 유지 시간 (초). 만료 후 같은 시간 동안은 이전 값을 반환하며 백그라운드에서 갱신
+CACHE_TTL = {
+    "crypto": 10,            # 김치프리미엄 (Binance/Upbit 시세)
+    "fear_greed": 600,       # CNN / Alternative.me
+    "fred": 3600,            # 국채 금리 (일 단위 업데이트)
+    "yahoo": 60,             # 지수 시세
+    "commodity": 300,        # 원자재 이력
+    "news": 300,             # RSS 피드
+    "kr_history": 86400,     # 장 마감 후 한국 지수/종목 일봉 (다음 장 시작 시 만료)
+    "kr_history_live": 60,   # 장중 일봉 (마지막 캔들 변동)
+}
+CACHE_MAX_ENTRIES = 256  # Source별 LRU 최대 항목 수
+
+# Prefetch Settings (services/prefetch_service.py)
+# 페이지 로드 시 source별 대기 기한 (초). 초과 시 오류 상태로 렌더하고 다음 rerun에서 캐시 사용
+PREFETCH_DEADLINES = {
+    "fear_greed": 5,
+    "crypto": 5,
+    "fred": 8,
+    "kr_history": 8,
+    "news": 8,
+    "quotes": 6,
+}
+PREFETCH_MAX_WORKERS = 16
+
+# HTTP Client Settings (services/http_client.py)
+HTTP_MAX_RETRIES = 2          # 연결 오류 / 429 / 5xx 재시도 횟수 (GET만)
+HTTP_BACKOFF_FACTOR = 0.3     # 0.3s, 0.6s ... 지수 backoff
+HTTP_POOL_SIZE = 10           # Host별 keep-alive 연결 수
+HTTP_HOST_CONCURRENCY = 4     # Host별 동시 요청 수 제한
+HTTP_NO_RETRY_HOSTS = ("127.0.0.1", "localhost")  # 로컬 백엔드는 즉시 폴백
+
+# News Ingest Settings (services/news_ingest_service.py)
+NEWS_RETENTION_HOURS = 72   # 기사 인덱스 보관 기간 (발행 시각 기준)
+NEWS_FEED_LIMIT = 30        # 피드당 반환 기사 수
+
+# Translation Cache Settings (services/translation_cache.py)
+TRANSLATION_CACHE_MAX_ENTRIES = 2000  # LRU 최대 항목 수 (헤드라인 단위)
+NEWS_TRANSLATION_POLL_SEC = 2         # 백그라운드 번역 진행 중 뉴스 영역 갱신 주기
+NEWS_TRANSLATION_RETRY_SEC = 300      # 실패한 번역 재시도 간격
+
+# Chart Settings (services/chart_downsample.py)
+CHART_POINTS_PER_PX = 2         # 차트 폭 1px당 최대 점 수 (초과 시 캔들은 주봉/월봉 집계, 라인은 LTTB)
+CHART_DEFAULT_WIDTH_PX = 1400   # 컴포넌트가 실제 폭을 보고하기 전 (key 없는 차트 포함) 기준 폭
+CHART_MIN_POINTS = 120          # 좁은 차트의 최소 점 수
+
+# Snapshot Store Settings (services/snapshot_store.py)
+SNAPSHOT_FLUSH_ROWS = 50   # 버퍼가 이 행 수에 도달하면 한 트랜잭션으로 기록
+SNAPSHOT_FLUSH_SEC = 60    # 버퍼의 가장 오래된 행이 이 시간(초)을 넘기면 기록
+
+# Quote Settings (services/index_service.py fetch_quotes)
+QUOTE_BATCH_SIZE = 20     # Yahoo spark 호출당 심볼 수
+QUOTE_MAX_SYMBOLS = 100   # 관심 목록 한 번에 조회할 최대 종목 수
+QUOTE_MAX_WORKERS = 6     # 묶음/개별 폴백 병렬 요청 상한
+
+# Symbol Master Settings (services/symbol_master.py)
+SYMBOL_MASTER_PATH = DATA_DIR / "krx_symbols.csv"  # KRX 상장 종목 목록 캐시
+SYMBOL_MASTER_REFRESH_SEC = 86400                  # 목록 갱신 주기 (1일)
+
+# Watchlist Settings (services/watchlist_service.py)
+WATCHLIST_FLUSH_SEC = 0.5  # 즐겨찾기 변경 후 파일 저장까지 대기 (그 사이 변경은 한 번에 저장)
+
+# Crypto Settings (services/crypto_service.py)
+CRYPTO_TICKER_PAIRS = ["BTC-KRW", "ETH-KRW", "XRP-KRW", "SOL-KRW", "DOGE-KRW", "USDT-KRW"]  # 크립토 탭 시세 (한 번에 조회)
@@ -13,22 +13,34 @@ import os
 load_dotenv(override=True) # Force .env to win over local system environment variables
 
 from components.tv_widgets import TradingViewWidget
-from services.crypto_service import get_kimchi_premium
-from services.data_service import log_market_snapshot, load_journal, append_journal_entry
+from services.crypto_service import get_kimchi_premium, fetch_crypto_tickers, KimchiPremiumData
+from services.data_service import log_market_snapshot, load_journal, append_journal_entry, search_journal
 from services.ai_service import generate_market_insight
-from services.fred_service import get_treasury_yields
+from services.fred_service import fetch_fred_series, TreasuryYieldData, TREASURY_SERIES
 from services.favorites_service import load_favorites, add_favorite, remove_favorite
 from services.kr_stock_service import (
     get_kr_stock_name,
     fetch_kr_stock,
-    fetch_kr_index_history
+    fetch_kr_index_history,
+    fetch_kr_quotes,
+    KrStockData
 )
 from services.kr_favorites_service import load_kr_favorites, add_kr_favorite, remove_kr_favorite
-from services.news_service import get_translated_economic_events, get_translated_market_news
+from services.symbol_master import symbol_master, resolve_kr_code
+from services.news_service import (
+    get_translated_economic_events,
+    get_translated_market_news,
+    news_translation_state,
+    fetch_rss_news,
+    MARKET_NEWS_SOURCES
+)
 from services.commodity_service import get_all_commodities
-from services.fear_greed_service import get_fear_greed_index
-from services.index_service import get_us_indices, get_kr_indices
-from config.settings import APP_TITLE, APP_ICON
+from services.fear_greed_service import get_cnn_fear_greed, get_crypto_fear_greed, FearGreedData
+from services.index_service import get_us_indices, get_kr_indices, fetch_us_quotes
+from services.cache_service import get_cache_stats
+from services.http_client import get_http_stats
+from services.prefetch_service import Prefetch
+from config.settings import APP_TITLE, APP_ICON, CRYPTO_TICKER_PAIRS, NEWS_TRANSLATION_POLL_SEC
 
 # ============================================================
 # ============================================================
@@ -56,6 +68,35 @@ if "us_symbol" not in st.session_state:
 if "kr_symbol" not in st.session_state:
     st.session_state["kr_symbol"] = "005930"
 
+# ============================================================
+# Prefetch: 독립적인 조회를 모두 동시에 시작 (탭에서는 결과만 대기)
+# ============================================================
+period_options = {"1M": 30, "3M": 90, "1Y": 365, "3Y": 1095, "5Y": 2000}
+# 세그먼트 컨트롤은 rerun 시작 시 이미 새 값을 갖고 있으므로 위젯보다 먼저 읽을 수 있음
+prefetch_kr_days = period_options.get(st.session_state.get("kr_period_selector") or st.session_state.get("kr_period", "1Y"), 365)
+prefetch_stock_days = period_options.get(st.session_state.get("kr_stock_period_selector") or st.session_state.get("kr_stock_period", "1Y"), 365)
+prefetch_kr_code = resolve_kr_code(st.session_state.get("kr_search_input") or st.session_state["kr_symbol"])
+timeout_msg = "응답 시간 초과"
+
+prefetch = Prefetch()
+prefetch.submit("fear_greed", get_cnn_fear_greed, default=FearGreedData(0, "Unknown", "CNN", error=timeout_msg))
+prefetch.submit("fear_greed", get_crypto_fear_greed, default=FearGreedData(0, "Unknown", "Crypto", error=timeout_msg))
+prefetch.submit("kr_history", fetch_kr_index_history, "KOSPI", days=prefetch_kr_days, default=[])
+prefetch.submit("kr_history", fetch_kr_index_history, "KOSDAQ", days=prefetch_kr_days, default=[])
+prefetch.submit("kr_history", fetch_kr_stock, prefetch_kr_code, days=prefetch_stock_days,
+                default=KrStockData(prefetch_kr_code, prefetch_kr_code, None, None, [], error=timeout_msg))
+if os.getenv("FRED_API_KEY"):
+    for sid, sname in TREASURY_SERIES.items():
+        prefetch.submit("fred", fetch_fred_series, sid, sname,
+                        default=TreasuryYieldData(sid, sname, None, None, None, [], error=timeout_msg))
+prefetch.submit("crypto", get_kimchi_premium, default=KimchiPremiumData(0, 0, 0, 0, error=timeout_msg))
+prefetch.submit("crypto", fetch_crypto_tickers, tuple(CRYPTO_TICKER_PAIRS), default=[])
+for url, src in MARKET_NEWS_SOURCES:
+    prefetch.submit("news", fetch_rss_news, url, src, default=[])
+# 즐겨찾기 전체 시세: 묶음 조회 (spark) 한두 번
+prefetch.submit("quotes", fetch_us_quotes, tuple(load_favorites()), default={})
+prefetch.submit("quotes", fetch_kr_quotes, tuple(load_kr_favorites()), default={})
+
 # ============================================================
 # Sidebar Configuration
 # ============================================================
@@ -69,10 +110,21 @@ with st.sidebar:
     if manual_gemini_key:
         st.session_state["manual_gemini_key"] = manual_gemini_key
 
+    with st.expander("🗄️ 캐시 상태"):
+        for source, s in get_cache_stats().items():
+            st.caption(f"{source}: hit {s['hits'] + s['stale_hits']} / miss {s['misses']} ({s['hit_rate']:.0%}) · {s['size']}건")
+
+    with st.expander("🌐 네트워크 상태"):
+        for host, s in get_http_stats().items():
+            st.caption(f"{host}: {s['requests']}회 · 평균 {s['avg_latency_ms']:.0f}ms · 연결 재사용 {s['reuse_rate']:.0%}")
+
 # ============================================================
 # Top Bar: F&G + Ticker Tape
 # ============================================================
-fg_data = get_fear_greed_index()
+fg_data = {
+    "cnn": prefetch.get(get_cnn_fear_greed),
+    "crypto": prefetch.get(get_crypto_fear_greed),
+}
 
 col_fg, col_tape = st.columns([2, 8])
 
@@ -106,6 +158,15 @@ with st.sidebar:
         st.success("저장됨!")
         st.rerun()
 
+    journal_query = st.text_input("🔎 일지 검색", placeholder="예: 삼성전자 FOMC", key="journal_query")
+    if journal_query.strip():
+        hits = search_journal(journal_query, limit=5)
+        if not hits:
+            st.caption("검색 결과 없음")
+        for hit in hits:
+            st.caption(f"🕒 {hit.timestamp}")
+            st.markdown(hit.text if len(hit.text) <= 200 else hit.text[:200] + "…")
+
 # ============================================================
 # Main Tabs
 # ============================================================
@@ -142,6 +203,13 @@ with tabs[0]:
         if f_cols[i % len(f_cols)].button(name, key=f"us_fav_{t}", use_container_width=True):
             st.session_state["us_symbol"] = t
             st.rerun()
+
+    us_quotes = prefetch.get(fetch_us_quotes, tuple(favorites))
+    if us_quotes:
+        for i, t in enumerate(favorites):
+            q = us_quotes.get(t)
+            if q:
+                f_cols[i % len(f_cols)].metric(t.split(":")[-1], f"${q.current_price:,.2f}", f"{q.change_percent:+.2f}%")
             
     with st.expander("⚙️ 즐겨찾기 관리"):
         c1, c2 = st.columns(2)
@@ -178,7 +246,6 @@ with tabs[1]:
     st.subheader("📊 한국 주요 지수")
     
     # 기간 선택 UI
-    period_options = {"1M": 30, "3M": 90, "1Y": 365, "3Y": 1095, "5Y": 2000}
     if "kr_period" not in st.session_state:
         st.session_state.kr_period = "1Y"
     
@@ -196,8 +263,8 @@ with tabs[1]:
     # 데이터 로딩
     days_to_fetch = period_options.get(st.session_state.kr_period, 365)
     with st.spinner(f"KOSPI/KOSDAQ 데이터 로딩 중... ({st.session_state.kr_period})"):
-        kospi_data = fetch_kr_index_history("KOSPI", days=days_to_fetch)
-        kosdaq_data = fetch_kr_index_history("KOSDAQ", days=days_to_fetch)
+        kospi_data = prefetch.get(fetch_kr_index_history, "KOSPI", days=days_to_fetch)
+        kosdaq_data = prefetch.get(fetch_kr_index_history, "KOSDAQ", days=days_to_fetch)
     
     # 지수 정보 추출 및 카드 렌더링
     def get_index_info(data, name):
@@ -247,13 +314,10 @@ with tabs[1]:
 
     # 차트 (Lightweight Charts + Volume)
     st.caption(f"📉 시장 지수 추이 ({st.session_state.kr_period}) - Prober-like High Performance View")
-    k_chart_cols = st.columns(2)
-    
-    with k_chart_cols[0]:
-        TradingViewWidget.render_lightweight_chart(data=kospi_data, title="KOSPI", height=320)
-        
-    with k_chart_cols[1]:
-        TradingViewWidget.render_lightweight_chart(data=kosdaq_data, title="KOSDAQ", height=320)
+    # KOSPI + KOSDAQ: 한 컴포넌트에 나란히 렌더 (라이브러리 1회 로드)
+    TradingViewWidget.render_lightweight_charts(
+        [(kospi_data, "KOSPI"), (kosdaq_data, "KOSDAQ")], height=320, columns=2, key="kr_index_charts"
+    )
 
     st.divider()
     
@@ -267,6 +331,13 @@ with tabs[1]:
         if kf_cols[i % len(kf_cols)].button(name, key=f"kr_fav_{t}", use_container_width=True):
             st.session_state["kr_symbol"] = t
             st.rerun()
+
+    kr_quotes = prefetch.get(fetch_kr_quotes, tuple(kr_favorites))
+    if kr_quotes:
+        for i, t in enumerate(kr_favorites):
+            q = kr_quotes.get(t)
+            if q:
+                kf_cols[i % len(kf_cols)].metric(q.name, f"₩{q.current_price:,.0f}", f"{q.change_percent:+.2f}%")
             
     with st.expander("⚙️ 즐겨찾기 관리"):
         c1, c2 = st.columns(2)
@@ -284,15 +355,33 @@ with tabs[1]:
     st.divider()
     
     def on_kr_search_change():
-        st.session_state["kr_symbol"] = st.session_state.kr_search_input
+        st.session_state["kr_symbol"] = resolve_kr_code(st.session_state.kr_search_input)
+
+    def on_kr_suggestion_pick():
+        picked = st.session_state.get("kr_search_pick")
+        if picked:
+            st.session_state["kr_symbol"] = picked
+            st.session_state["kr_search_input"] = picked
 
     kr_code_full = st.text_input(
         "🔍 종목코드", 
         value=st.session_state["kr_symbol"], 
         key="kr_search_input",
+        placeholder="코드 또는 종목명 (예: 005930, 삼성, naver)",
         on_change=on_kr_search_change
     )
-    kr_code = kr_code_full.replace("KRX:", "") 
+    # 종목명/코드 일부 입력 시 접두어 검색 결과를 추천 (1순위 종목을 바로 표시)
+    kr_code = resolve_kr_code(kr_code_full)
+    kr_suggestions = [] if symbol_master.lookup(kr_code_full) else symbol_master.search(kr_code_full, limit=6)
+    if kr_suggestions:
+        st.pills(
+            "추천 종목",
+            [s.code for s in kr_suggestions],
+            format_func=lambda c: f"{get_kr_stock_name(c)} ({c})",
+            key="kr_search_pick",
+            on_change=on_kr_suggestion_pick,
+            label_visibility="collapsed",
+        )
     
     # 개별 종목 기간 선택 UI
     stock_period_options = {"1M": 30, "3M": 90, "1Y": 365, "3Y": 1095, "5Y": 2000}
@@ -313,7 +402,7 @@ with tabs[1]:
     stock_days_to_fetch = stock_period_options.get(st.session_state.kr_stock_period, 365)
     
     with st.spinner(f"{get_kr_stock_name(kr_code)} 데이터 로딩... ({st.session_state.kr_stock_period})"):
-        kr_data = fetch_kr_stock(kr_code, days=stock_days_to_fetch)
+        kr_data = prefetch.get(fetch_kr_stock, kr_code, days=stock_days_to_fetch)
     
     if kr_data.error:
         st.error(f"오류: {kr_data.error} (종목코드를 확인하세요)")
@@ -328,7 +417,9 @@ with tabs[1]:
         with col2:
             st.caption(f"📉 최근 주가 추이 ({st.session_state.kr_stock_period}) - Prober-like High Performance View")
             if kr_data.history:
-                TradingViewWidget.render_lightweight_chart(data=kr_data.history, title=kr_data.name, height=320)
+                TradingViewWidget.render_lightweight_chart(
+                    data=kr_data.history, title=kr_data.name, height=320, key="kr_stock_chart"
+                )
 
 # --- Tab 3: Forex & Commodities ---
 with tabs[2]:
@@ -407,7 +498,7 @@ with tabs[3]:
     fred_key = os.getenv("FRED_API_KEY")
     if fred_key:
         with st.spinner("FRED 데이터 로딩..."):
-            yields = get_treasury_yields()
+            yields = {sid: prefetch.get(fetch_fred_series, sid, sname) for sid, sname in TREASURY_SERIES.items()}
         
         y_cols = st.columns(3)
         for i, (sid, label) in enumerate(zip(["DGS2", "DGS10", "DGS30"], ["2년물", "10년물", "30년물"])):
@@ -444,8 +535,16 @@ with tabs[4]:
             st.caption(label)
             TradingViewWidget.render_commodity_mini_chart(sym, height=180, locale="kr")
     
+    # Upbit KRW 시세 (전 종목 한 번에 조회)
+    tickers = prefetch.get(fetch_crypto_tickers, tuple(CRYPTO_TICKER_PAIRS))
+    if tickers:
+        q_cols = st.columns(len(tickers))
+        for col, t in zip(q_cols, tickers):
+            delta = f"{t.change_percent:+.2f}%" if t.change_percent is not None else None
+            col.metric(t.symbol.replace("-KRW", ""), f"{t.price:,.0f}원" if t.price >= 100 else f"{t.price:,.2f}원", delta)
+
     st.divider()
-    kp = get_kimchi_premium()
+    kp = prefetch.get(get_kimchi_premium)
     if not kp.error:
          st.metric("🌶️ 김치 프리미엄", f"{kp.premium_percent:.2f}%", f"{kp.btc_korea_krw:,.0f} KRW (Upbit) / ${kp.btc_global_usd:,.0f} (Binance)")
 
@@ -472,6 +571,19 @@ with tabs[5]:
         st.subheader("📰 시장 뉴스 (AI 번역)")
         use_gemini = st.checkbox("Gemini 번역 활성화", value=True)
         if use_gemini:
-            st.markdown(get_translated_market_news())
+            feeds = [prefetch.get(fetch_rss_news, url, src) for url, src in MARKET_NEWS_SOURCES]
+            # 번역은 백그라운드 작업: 원문을 먼저 표시하고, 진행 중에는 이 영역만 주기적으로 갱신
+            # 번역 상태는 실행마다 1회 계산 (전체 실행의 첫 패널 렌더는 아래에서 계산한 값을 사용)
+            initial_state = [news_translation_state(feeds)]
+            news_polling = initial_state[0]["pending"]
+
+            @st.fragment(run_every=NEWS_TRANSLATION_POLL_SEC if news_polling else None)
+            def market_news_panel():
+                state = initial_state.pop() if initial_state else news_translation_state(feeds)
+                st.markdown(get_translated_market_news(feeds, state=state))
+                if news_polling and not state["pending"]:
+                    st.rerun()  # 번역 도착 -> 폴링 종료
+
+            market_news_panel()
         else:
             TradingViewWidget.render_timeline(height=600, locale="kr")
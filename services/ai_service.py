@@ -15,14 +15,44 @@ try:
 except ImportError:
     st = None
 
+# 인사이트에 참고할 과거 메모 검색어 (현재 제공하는 시장 데이터 관련)
+INSIGHT_NOTE_TERMS = ["김치프리미엄", "김프", "환율", "달러", "비트코인", "BTC"]
+INSIGHT_NOTE_CHARS = 500
+
+
+def build_journal_context(max_chars: int = INSIGHT_NOTE_CHARS) -> str:
+    """
+    관련 과거 메모(전문 검색) + 가장 최근 메모를 max_chars 이내로 묶습니다.
+    관련도가 높은 메모와 최근 메모가 뒤쪽에 오도록 배치합니다.
+    """
+    from services.data_service import find_related_notes, read_journal_tail
+
+    recent = read_journal_tail(max_chars // 2).strip()
+    notes = []
+    budget = max_chars - len(recent)
+    for hit in find_related_notes(INSIGHT_NOTE_TERMS, limit=3):
+        if hit.text in recent:
+            continue
+        note = f"[{hit.timestamp}] {hit.text[:150]}"
+        if len(note) + 1 > budget:
+            break
+        notes.insert(0, note)
+        budget -= len(note) + 1
+    return "\n".join(notes + [recent]) if recent or notes else ""
+
+
 def generate_market_insight(
     kimchi_premium: float,
     usd_krw: float,
-    journal_text: str
+    journal_text: Optional[str] = None
 ) -> Optional[str]:
     """
     Gemini AI를 사용하여 시장 데이터와 투자 일지를 기반으로 한 줄 인사이트를 생성합니다.
+    journal_text를 생략하면 관련 과거 메모와 최근 메모를 색인에서 찾아 사용합니다.
     """
+    if journal_text is None:
+        journal_text = build_journal_context()
+
     api_key = None
     
     # Priority 1: Manual Session Bypass
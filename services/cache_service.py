@@ -0,0 +1,231 @@
+"""
+Cache Service - TTL-aware memoization for data fetchers
+Streamlit rerun과 FastAPI 요청 모두에서 동작하는 프로세스 단위 캐시.
+- Source별 TTL (config.settings.CACHE_TTL)
+- Source별 LRU eviction
+- Stale-while-revalidate: 만료 직후에는 이전 값을 즉시 반환하고 백그라운드에서 갱신
+- Hit/Miss 카운터 (get_cache_stats)
+"""
+import functools
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, Hashable, Optional, Union
+
+from config.settings import CACHE_TTL, CACHE_MAX_ENTRIES
+
+# TTL은 초 단위 숫자 또는 저장 시점에 TTL을 계산하는 함수 (예: 장중/장마감 구분)
+TTL = Union[float, Callable[[], float]]
+
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """Source별 캐시 통계"""
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    evictions: int = 0
+    rejected: int = 0  # 오류 결과 등 캐시하지 않은 값
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+    stale_until: float
+
+
+def is_cacheable(value: Any) -> bool:
+    """오류/빈 결과는 캐시하지 않음 (다음 호출에서 바로 재시도)"""
+    if value is None:
+        return False
+    if getattr(value, "error", None):
+        return False
+    if isinstance(value, (list, tuple, dict)) and not value:
+        return False
+    return True
+
+
+def all_items_cacheable(value: Any) -> bool:
+    """목록 항목 중 하나라도 오류면 캐시하지 않음 (일시적 실패 행이 TTL 동안 고정되지 않도록)"""
+    return is_cacheable(value) and not any(getattr(item, "error", None) for item in value)
+
+
+class TTLCache:
+    """스레드 안전 TTL + LRU 캐시 (source 단위로 하나씩 생성)"""
+
+    def __init__(self, source: str, maxsize: int = CACHE_MAX_ENTRIES):
+        self.source = source
+        self.maxsize = maxsize
+        self.stats = CacheStats()
+        self._data: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing: set = set()
+        # 동일 키 동시 miss 시 upstream 호출을 한 번으로 합치기 위한 striped lock
+        self._key_locks = [threading.Lock() for _ in range(32)]
+
+    def key_lock(self, key: Hashable) -> threading.Lock:
+        return self._key_locks[hash(key) % len(self._key_locks)]
+
+    def lookup(self, key: Hashable):
+        """(value, fresh) 반환. 없거나 완전히 만료되면 (_MISSING, False)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return _MISSING, False
+            if now < entry.expires_at:
+                self._data.move_to_end(key)
+                return entry.value, True
+            if now < entry.stale_until:
+                self._data.move_to_end(key)
+                return entry.value, False
+            del self._data[key]
+            return _MISSING, False
+
+    def store(self, key: Hashable, value: Any, ttl: float, stale_ttl: float) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._data[key] = _Entry(value, now + ttl, now + ttl + stale_ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.stats.evictions += 1
+
+    def begin_refresh(self, key: Hashable) -> bool:
+        """백그라운드 갱신은 키당 하나만 실행"""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key: Hashable) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_caches: Dict[str, TTLCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache(source: str, maxsize: Optional[int] = None) -> TTLCache:
+    """source 이름으로 공유 캐시를 반환 (없으면 생성)"""
+    with _caches_lock:
+        cache = _caches.get(source)
+        if cache is None:
+            cache = TTLCache(source, maxsize or CACHE_MAX_ENTRIES)
+            _caches[source] = cache
+        return cache
+
+
+def _resolve_ttl(source: str, ttl: Optional[TTL]) -> float:
+    if ttl is None:
+        return float(CACHE_TTL.get(source, 60))
+    return float(ttl() if callable(ttl) else ttl)
+
+
+def cached(
+    source: str,
+    ttl: Optional[TTL] = None,
+    stale_ttl: Optional[float] = None,
+    maxsize: Optional[int] = None,
+    cache_if: Callable[[Any], bool] = is_cacheable,
+):
+    """
+    서비스 fetcher용 TTL 캐시 데코레이터
+
+    Args:
+        source: 캐시 그룹 이름 (CACHE_TTL의 키, 통계 단위)
+        ttl: 신선 유지 시간(초) 또는 TTL 계산 함수. 기본값은 CACHE_TTL[source]
+        stale_ttl: 만료 후 이전 값을 반환하며 백그라운드 갱신하는 유예 시간. 기본값은 ttl과 동일
+        maxsize: LRU 최대 항목 수
+        cache_if: 결과를 캐시할지 판단하는 함수 (기본: 오류/빈 결과 제외)
+    """
+    def decorator(fn):
+        cache = get_cache(source, maxsize)
+
+        def _load(key, args, kwargs):
+            value = fn(*args, **kwargs)
+            if cache_if(value):
+                fresh_ttl = _resolve_ttl(source, ttl)
+                cache.store(key, value, fresh_ttl, fresh_ttl if stale_ttl is None else stale_ttl)
+            else:
+                cache.stats.rejected += 1
+            return value
+
+        def _refresh(key, args, kwargs):
+            try:
+                _load(key, args, kwargs)
+                cache.stats.refreshes += 1
+            except Exception as e:
+                print(f"Cache refresh failed ({source}): {e}")
+            finally:
+                cache.end_refresh(key)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = (fn.__module__, fn.__qualname__, args, tuple(sorted(kwargs.items())))
+            try:
+                hash(key)
+            except TypeError:
+                # 해시 불가능한 인자는 캐시 우회
+                return fn(*args, **kwargs)
+
+            value, fresh = cache.lookup(key)
+            if value is not _MISSING:
+                if fresh:
+                    cache.stats.hits += 1
+                else:
+                    cache.stats.stale_hits += 1
+                    if cache.begin_refresh(key):
+                        threading.Thread(target=_refresh, args=(key, args, kwargs), daemon=True).start()
+                return value
+
+            with cache.key_lock(key):
+                # 대기하는 동안 다른 스레드가 채웠을 수 있음
+                value, _ = cache.lookup(key)
+                if value is not _MISSING:
+                    cache.stats.hits += 1
+                    return value
+                cache.stats.misses += 1
+                return _load(key, args, kwargs)
+
+        wrapper.cache = cache
+        wrapper.uncached = fn
+        return wrapper
+
+    return decorator
+
+
+def get_cache_stats() -> Dict[str, dict]:
+    """Source별 hit/miss 통계와 현재 항목 수"""
+    with _caches_lock:
+        caches = list(_caches.values())
+    stats = {}
+    for cache in caches:
+        s = asdict(cache.stats)
+        total = s["hits"] + s["stale_hits"] + s["misses"]
+        s["size"] = len(cache)
+        s["hit_rate"] = (s["hits"] + s["stale_hits"]) / total if total else 0.0
+        stats[cache.source] = s
+    return stats
+
+
+def clear_cache(source: Optional[str] = None) -> None:
+    """캐시 비우기 (source 미지정 시 전체)"""
+    with _caches_lock:
+        caches = [_caches[source]] if source in _caches else ([] if source else list(_caches.values()))
+    for cache in caches:
+        cache.clear()
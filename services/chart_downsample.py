@@ -0,0 +1,147 @@
+"""
+Chart Downsample - Viewport-aware payload reduction for client-side charts
+차트 폭보다 많은 점은 화면에 구분되지 않으므로, 브라우저로 보내기 전에 줄입니다.
+- 점 예산: 차트 한 개의 렌더 폭(px) x CHART_POINTS_PER_PX (point_budget)
+- Line/Area: LTTB (Largest-Triangle-Three-Buckets) - 피크/저점 형태 유지
+- Candle: 주봉/월봉 OHLC 집계 (시가=첫 봉, 고가=max, 저가=min, 종가=마지막 봉, 거래량=합계)
+- 확대 구간(view): 보이는 범위는 예산 안에서 원본(일봉)에 가깝게, 나머지는 전체 기준 해상도 (downsample_view)
+입력/출력은 columnar 규격 ({"time": [...], ...})입니다.
+"""
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config.settings import CHART_DEFAULT_WIDTH_PX, CHART_MIN_POINTS, CHART_POINTS_PER_PX
+
+Columns = Dict[str, list]
+
+# 캔들 집계 단위 (작은 단위부터 시도)
+OHLC_RULES = ("W", "M", "Q")
+
+
+def lttb_indices(values: List[float], threshold: int) -> np.ndarray:
+    """
+    LTTB로 남길 인덱스 (첫/마지막 점 포함 threshold개)
+
+    x축은 인덱스(거래일 순서)를 사용합니다.
+    """
+    n = len(values)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    y = np.asarray(values, dtype=float)
+    x = np.arange(n, dtype=float)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)  # 가운데 threshold-2개 버킷 경계
+
+    # 버킷별 평균 (다음 버킷 평균으로 사용, 마지막은 마지막 점)
+    counts = np.diff(np.r_[edges, n - 1])
+    avg_x = np.r_[np.add.reduceat(x[:n - 1], edges[:-1]) / counts[:-1], x[-1]]
+    avg_y = np.r_[np.add.reduceat(y[:n - 1], edges[:-1]) / counts[:-1], y[-1]]
+
+    keep = np.empty(threshold, dtype=int)
+    keep[0] = 0
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        # 이전 선택점 a, 후보점, 다음 버킷 평균이 이루는 삼각형 넓이 최대
+        xs, ys = x[start:end], y[start:end]
+        area = np.abs((x[a] - avg_x[i + 1]) * (ys - y[a]) - (x[a] - xs) * (avg_y[i + 1] - y[a]))
+        a = start + int(area.argmax())
+        keep[i + 1] = a
+    keep[-1] = n - 1
+    return keep
+
+
+def _bucket_keys(times: List[str], rule: str) -> np.ndarray:
+    days = np.array(times, dtype="datetime64[D]")
+    if rule == "W":
+        # 1970-01-01은 목요일 -> +3일 하면 월요일 시작 주 번호
+        return (days.astype(np.int64) + 3) // 7
+    months = days.astype("datetime64[M]").astype(np.int64)
+    return months if rule == "M" else months // 3
+
+
+def aggregate_ohlc(cols: Columns, rule: str) -> Columns:
+    """일봉 -> 주봉("W") / 월봉("M") / 분기봉("Q"). time은 구간의 첫 거래일 (시간순 입력)"""
+    keys = _bucket_keys(cols["time"], rule)
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    ends = np.r_[starts[1:], len(keys)] - 1
+
+    opens = np.asarray(cols["open"], dtype=float)
+    closes = np.asarray(cols["close"], dtype=float)
+    volume = np.asarray(cols.get("volume") or np.zeros(len(keys)), dtype=np.int64)
+    return {
+        "time": [cols["time"][i] for i in starts],
+        "open": opens[starts].tolist(),
+        "high": np.maximum.reduceat(np.asarray(cols["high"], dtype=float), starts).tolist(),
+        "low": np.minimum.reduceat(np.asarray(cols["low"], dtype=float), starts).tolist(),
+        "close": closes[ends].tolist(),
+        "volume": np.add.reduceat(volume, starts).tolist(),
+    }
+
+
+def point_budget(width_px: Optional[float] = None, columns: int = 1) -> int:
+    """차트 한 개에 보낼 최대 점 수 (렌더 폭 / 열 수 x CHART_POINTS_PER_PX)"""
+    width = (width_px or CHART_DEFAULT_WIDTH_PX) / max(columns, 1)
+    return max(CHART_MIN_POINTS, int(width * CHART_POINTS_PER_PX))
+
+
+def downsample_columns(cols: Columns, max_points: Optional[int]) -> Columns:
+    """
+    max_points 이하로 점 수 축소 (이미 적으면 그대로 반환)
+
+    Candle은 max_points 이하가 되는 가장 작은 집계 단위를, Line은 LTTB를 사용합니다.
+    """
+    n = len(cols.get("time") or [])
+    if not max_points or n <= max_points:
+        return cols
+
+    if "open" in cols:
+        for rule in OHLC_RULES:
+            out = aggregate_ohlc(cols, rule)
+            if len(out["time"]) <= max_points:
+                break
+        return out
+
+    idx = lttb_indices(cols["value"], max_points)
+    return {k: [v[i] for i in idx] for k, v in cols.items() if v is not None}
+
+
+def downsample_view(
+    cols: Columns, max_points: Optional[int], view: Optional[Sequence[str]] = None
+) -> Tuple[Columns, Optional[Tuple[str, str]]]:
+    """
+    확대 구간만 세밀하게 다운샘플
+
+    view(보이는 구간의 시작/끝 time)를 양쪽으로 구간 길이의 절반씩 넓혀 max_points 예산으로 줄이고,
+    나머지는 전체 기준 결과의 봉을 그대로 씁니다. 경계는 전체 기준 봉 경계에 맞춰 겹치지 않습니다.
+
+    Returns:
+        (columnar 결과, 세밀하게 보낸 구간 (시작, 끝) 또는 None)
+    """
+    coarse = downsample_columns(cols, max_points)
+    times = cols.get("time") or []
+    if not view or coarse is cols or len(view) != 2:
+        return coarse, None
+
+    # 보이는 구간 + 양쪽 여유 (조금 이동해도 다시 요청하지 않도록)
+    i0, i1 = bisect_left(times, view[0]), bisect_right(times, view[1])
+    pad = max((i1 - i0) // 2, 1)
+    i0, i1 = max(i0 - pad, 0), min(i1 + pad, len(times))
+    if i1 - i0 < 2 or (i0 == 0 and i1 == len(times)):
+        return coarse, None
+
+    # 전체 기준 봉 경계로 맞춤: [coarse[lo], coarse[hi]) 를 세밀한 봉으로 교체
+    coarse_times = coarse["time"]
+    lo = max(bisect_right(coarse_times, times[i0]) - 1, 0)
+    hi = bisect_right(coarse_times, times[i1 - 1])
+    start = bisect_left(times, coarse_times[lo])
+    end = bisect_left(times, coarse_times[hi]) if hi < len(coarse_times) else len(times)
+    detail = downsample_columns({k: v[start:end] for k, v in cols.items() if v is not None}, max_points)
+
+    n_detail = len(detail["time"])
+    merged = {
+        k: coarse[k][:lo] + list(detail.get(k) or [0] * n_detail) + coarse[k][hi:]
+        for k in coarse
+    }
+    return merged, (times[start], times[end - 1])
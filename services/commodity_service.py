@@ -4,7 +4,9 @@ Commodity Service v2 - with period selection
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional, List, Tuple
-import requests
+
+from services import http_client
+from services.cache_service import cached
 
 
 @dataclass
@@ -19,6 +21,7 @@ class CommodityData:
     error: Optional[str] = None
 
 
+@cached("commodity")
 def fetch_commodity_via_yahoo(symbol: str, name: str, days: int = 30) -> CommodityData:
     """
     Yahoo Finance API로 원자재 가격 조회
@@ -36,7 +39,7 @@ def fetch_commodity_via_yahoo(symbol: str, name: str, days: int = 30) -> Commodi
         params = {"period1": start_date, "period2": end_date, "interval": "1d"}
         headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
         
-        response = requests.get(url, params=params, headers=headers, timeout=10)
+        response = http_client.get(url, params=params, headers=headers, timeout=10)
         response.raise_for_status()
         data = response.json()
         
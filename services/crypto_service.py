@@ -1,12 +1,16 @@
 """
-Crypto Service - Kimchi Premium Calculator (REST API Version)
-Uses pure requests to fetch BTC prices from Binance and Upbit public APIs.
+Crypto Service - Kimchi Premium Calculator & batched tickers (REST API Version)
+Uses pure requests to fetch prices from the backend, Binance and Upbit public APIs.
 No external dependencies that require C++ compilation.
 """
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional, Sequence
 import requests
 
+from config.settings import BACKEND_URL
+from services import http_client
+from services.cache_service import cached
+
 
 @dataclass
 class KimchiPremiumData:
@@ -18,32 +22,64 @@ class KimchiPremiumData:
     error: Optional[str] = None
 
 
+@dataclass
+class CryptoTicker:
+    """코인 시세 (symbol: "BTC-KRW" 형식)"""
+    symbol: str
+    price: float
+    change_percent: Optional[float]
+    quote_volume: Optional[float]
+    source: str
+
+
+def _kimchi_from_stream() -> Optional[KimchiPremiumData]:
+    """
+    백엔드 실시간 스트림이 계산해 둔 김치프리미엄 (거래소 호출 없음)
+    피드 연결이 끊겼거나 오래된 값(stale)이면 None -> REST로 직접 계산
+    """
+    try:
+        resp = http_client.get(f"{BACKEND_URL}/stream/snapshot", timeout=2)
+        if resp.status_code == 200:
+            kimchi = resp.json().get("kimchi")
+            if kimchi and not kimchi.get("stale", True):
+                return KimchiPremiumData(
+                    btc_global_usd=kimchi["btc_global_usd"],
+                    btc_korea_krw=kimchi["btc_korea_krw"],
+                    usd_krw_rate=kimchi["usd_krw_rate"],
+                    premium_percent=kimchi["premium_percent"],
+                )
+    except (requests.RequestException, KeyError, TypeError, ValueError):
+        pass
+    return None
+
+
+@cached("crypto")
 def get_kimchi_premium() -> KimchiPremiumData:
     """
     바이낸스와 업비트 BTC 가격을 비교하여 김치프리미엄을 계산합니다.
-    순수 REST API 사용 (ccxt 의존성 없음).
+    백엔드 WebSocket 스트림 값 우선, 없으면 REST API로 직접 계산 (ccxt 의존성 없음).
 
     Returns:
         KimchiPremiumData: 글로벌 가격, 국내 가격, 환율, 프리미엄 비율
     """
+    streamed = _kimchi_from_stream()
+    if streamed is not None:
+        return streamed
+
     try:
         # 1. Binance (Global USD Price)
         binance_url = "https://api.binance.com/api/v3/ticker/price?symbol=BTCUSDT"
-        binance_resp = requests.get(binance_url, timeout=10)
+        binance_resp = http_client.get(binance_url, timeout=10)
         binance_resp.raise_for_status()
         btc_global_usd = float(binance_resp.json()["price"])
 
-        # 2. Upbit (Korea KRW Price)
-        upbit_btc_url = "https://api.upbit.com/v1/ticker?markets=KRW-BTC"
-        upbit_btc_resp = requests.get(upbit_btc_url, timeout=10)
-        upbit_btc_resp.raise_for_status()
-        btc_korea_krw = float(upbit_btc_resp.json()[0]["trade_price"])
-
-        # 3. Upbit (USD/KRW via USDT)
-        upbit_usdt_url = "https://api.upbit.com/v1/ticker?markets=KRW-USDT"
-        upbit_usdt_resp = requests.get(upbit_usdt_url, timeout=10)
-        upbit_usdt_resp.raise_for_status()
-        usd_krw_rate = float(upbit_usdt_resp.json()[0]["trade_price"])
+        # 2~3. Upbit (Korea KRW Price + USD/KRW via USDT) - 한 번의 요청
+        upbit_url = "https://api.upbit.com/v1/ticker?markets=KRW-BTC,KRW-USDT"
+        upbit_resp = http_client.get(upbit_url, timeout=10)
+        upbit_resp.raise_for_status()
+        upbit_prices = {t["market"]: float(t["trade_price"]) for t in upbit_resp.json()}
+        btc_korea_krw = upbit_prices["KRW-BTC"]
+        usd_krw_rate = upbit_prices["KRW-USDT"]
 
         # 4. Calculate Premium
         btc_global_krw = btc_global_usd * usd_krw_rate
@@ -62,3 +98,53 @@ def get_kimchi_premium() -> KimchiPremiumData:
         return KimchiPremiumData(0, 0, 0, 0, error=f"데이터 파싱 오류: {e}")
     except Exception as e:
         return KimchiPremiumData(0, 0, 0, 0, error=f"알 수 없는 오류: {e}")
+
+
+@cached("crypto")
+def fetch_crypto_tickers(symbols: Sequence[str]) -> List[CryptoTicker]:
+    """
+    여러 코인 시세를 한 번의 왕복으로 조회합니다.
+    백엔드 배치 엔드포인트(/crypto/tickers) 우선, 실패 시 Upbit 다중 마켓 조회로 폴백.
+
+    Args:
+        symbols: "BTC-KRW" 형식 심볼 목록
+
+    Returns:
+        List[CryptoTicker]: 조회 실패 시 빈 리스트
+    """
+    symbols = list(symbols)
+
+    # 1. Backend (shared ccxt exchange, fetch_tickers 1회)
+    try:
+        resp = http_client.get(f"{BACKEND_URL}/crypto/tickers", params={"symbols": ",".join(symbols)}, timeout=3)
+        if resp.status_code == 200:
+            by_symbol = {
+                t["symbol"]: CryptoTicker(
+                    t["symbol"], float(t["price"]), t.get("change_percent"), t.get("quote_volume"), t.get("source", "Upbit")
+                )
+                for t in resp.json()
+            }
+            return [by_symbol[s] for s in symbols if s in by_symbol]
+    except (requests.RequestException, KeyError, TypeError, ValueError):
+        pass
+
+    # 2. Upbit REST fallback ("BTC-KRW" -> "KRW-BTC")
+    try:
+        markets = {f"{s.split('-')[1]}-{s.split('-')[0]}": s for s in symbols if "-" in s}
+        resp = http_client.get("https://api.upbit.com/v1/ticker", params={"markets": ",".join(markets)}, timeout=10)
+        resp.raise_for_status()
+        by_symbol = {
+            markets[t["market"]]: CryptoTicker(
+                markets[t["market"]],
+                float(t["trade_price"]),
+                float(t["signed_change_rate"]) * 100,
+                t.get("acc_trade_price_24h"),
+                "Upbit",
+            )
+            for t in resp.json()
+            if t.get("market") in markets
+        }
+        return [by_symbol[s] for s in symbols if s in by_symbol]
+    except (requests.RequestException, KeyError, IndexError, TypeError, ValueError) as e:
+        print(f"Crypto tickers error: {e}")
+        return []
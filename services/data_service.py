@@ -1,13 +1,17 @@
 """
-Data Service - CSV Logging & Journal I/O
+Data Service - Snapshot Logging & Journal I/O
 Handles persistent storage for market snapshots and user notes.
 """
-import csv
+import json
+import os
+import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, List, Optional, Sequence
 
-from config.settings import HISTORY_PATH, JOURNAL_PATH
+from services.journal_search import JournalHit, journal_index
+from services.journal_store import journal_store
+from services.snapshot_store import MarketSnapshot, snapshot_store
 
 
 def log_market_snapshot(
@@ -18,7 +22,7 @@ def log_market_snapshot(
     fear_greed: Optional[int] = None
 ) -> None:
     """
-    시장 스냅샷을 CSV 파일에 추가합니다.
+    시장 스냅샷을 스냅샷 저장소에 추가합니다 (버퍼링 후 배치 기록).
 
     Args:
         btc_global: 글로벌 BTC 가격 (USD)
@@ -27,29 +31,69 @@ def log_market_snapshot(
         usd_krw: 원달러 환율
         fear_greed: 공포/탐욕 지수 (Optional)
     """
-    timestamp = datetime.now().isoformat()
-    row = [timestamp, btc_global, btc_krw, kimchi_premium, usd_krw, fear_greed or ""]
-
-    with open(HISTORY_PATH, "a", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(row)
+    snapshot_store.append(MarketSnapshot(
+        timestamp=datetime.now(),
+        btc_global=btc_global,
+        btc_krw=btc_krw,
+        kimchi_premium=kimchi_premium,
+        usd_krw=usd_krw,
+        fear_greed=fear_greed,
+    ))
 
 
 def load_journal() -> str:
     """저널 파일 내용을 읽어옵니다."""
-    if JOURNAL_PATH.exists():
-        return JOURNAL_PATH.read_text(encoding="utf-8")
-    return ""
+    return journal_store.read_all()
+
+
+def read_journal_tail(chars: int = 500) -> str:
+    """저널의 마지막 chars 글자만 읽어옵니다 (파일 끝부분만 seek)."""
+    # UTF-8 한글 3바이트 -> 넉넉히 4배 읽고 글자 수로 자름
+    return journal_store.tail_bytes(chars * 4)[-chars:]
+
+
+def search_journal(query: str, limit: int = 10) -> List[JournalHit]:
+    """저널 전문 검색 (공백으로 구분된 모든 단어 포함, 관련도 순)."""
+    return journal_index.search(query, limit)
+
+
+def find_related_notes(terms: Sequence[str], limit: int = 3) -> List[JournalHit]:
+    """terms 중 하나라도 언급한 과거 메모 (관련도 순)."""
+    return journal_index.search_any(terms, limit)
 
 
 def save_journal(content: str) -> None:
-    """저널 파일에 내용을 저장합니다."""
-    JOURNAL_PATH.write_text(content, encoding="utf-8")
+    """저널 파일 전체를 저장합니다 (원자적 교체 후 항목 인덱스 재생성)."""
+    path = journal_store.path
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    journal_store.invalidate()
 
 
 def append_journal_entry(entry: str) -> None:
-    """저널에 새로운 항목을 추가합니다 (날짜 자동 삽입)."""
-    current = load_journal()
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-    new_entry = f"\n\n---\n**[{timestamp}]**\n{entry}"
-    save_journal(current + new_entry)
+    """저널에 새로운 항목을 추가합니다 (날짜 자동 삽입, 파일 끝에만 기록)."""
+    journal_store.append(entry)
+
+
+def write_json_atomic(path: Path, data: Any, indent: Optional[int] = None) -> None:
+    """
+    JSON 파일을 원자적으로 저장합니다 (임시 파일 작성 후 교체).
+    쓰는 도중 종료되어도 기존 파일이 깨지지 않습니다.
+    """
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=indent)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
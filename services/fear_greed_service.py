@@ -3,10 +3,12 @@ Fear & Greed Index Service v2
 - Alternative.me: Crypto Fear & Greed (무료 API)
 - CNN Fear & Greed: 주식 시장용 (API)
 """
-import requests
 from dataclasses import dataclass
 from typing import Optional
 
+from services import http_client
+from services.cache_service import cached
+
 
 @dataclass
 class FearGreedData:
@@ -17,6 +19,7 @@ class FearGreedData:
     error: Optional[str] = None
 
 
+@cached("fear_greed")
 def get_crypto_fear_greed() -> FearGreedData:
     """
     Crypto Fear & Greed Index (Alternative.me API)
@@ -24,7 +27,7 @@ def get_crypto_fear_greed() -> FearGreedData:
     """
     try:
         url = "https://api.alternative.me/fng/?limit=1"
-        response = requests.get(url, timeout=10)
+        response = http_client.get(url, timeout=10)
         response.raise_for_status()
         data = response.json()
         
@@ -47,6 +50,7 @@ def get_crypto_fear_greed() -> FearGreedData:
         return FearGreedData(0, "Unknown", "Crypto", error=str(e))
 
 
+@cached("fear_greed")
 def get_cnn_fear_greed() -> FearGreedData:
     """
     CNN Fear & Greed Index (주식 시장용)
@@ -57,7 +61,7 @@ def get_cnn_fear_greed() -> FearGreedData:
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         }
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http_client.get(url, headers=headers, timeout=10)
         response.raise_for_status()
         data = response.json()
         
@@ -9,9 +9,20 @@ from typing import Optional, List, Tuple
 import requests
 from dotenv import load_dotenv
 
+from services import http_client
+from services.cache_service import cached
+
 load_dotenv()
 
 
+# 미국 국채 수익률 시리즈 (FRED series_id -> 이름)
+TREASURY_SERIES = {
+    "DGS2": "2년물",
+    "DGS10": "10년물",
+    "DGS30": "30년물",
+}
+
+
 @dataclass
 class TreasuryYieldData:
     """국채 수익률 데이터"""
@@ -24,6 +35,7 @@ class TreasuryYieldData:
     error: Optional[str] = None
 
 
+@cached("fred")
 def fetch_fred_series(series_id: str, name: str, observations: int = 30) -> TreasuryYieldData:
     """
     FRED API에서 시계열 데이터를 조회합니다.
@@ -56,7 +68,7 @@ def fetch_fred_series(series_id: str, name: str, observations: int = 30) -> Trea
             "limit": observations,
         }
 
-        response = requests.get(url, params=params, timeout=10)
+        response = http_client.get(url, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
 
@@ -130,14 +142,8 @@ def get_treasury_yields() -> dict:
     Returns:
         dict: {series_id: TreasuryYieldData}
     """
-    series_map = {
-        "DGS2": "2년물",
-        "DGS10": "10년물",
-        "DGS30": "30년물",
-    }
-
     results = {}
-    for series_id, name in series_map.items():
+    for series_id, name in TREASURY_SERIES.items():
         results[series_id] = fetch_fred_series(series_id, name)
 
     return results
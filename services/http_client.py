@@ -0,0 +1,142 @@
+"""
+HTTP Client - Pooled, retrying HTTP access shared by all services
+- Host별 keep-alive 세션 (TCP/TLS 핸드셰이크 재사용)
+- 지수 backoff 재시도 (연결 오류, 429, 5xx)
+- gzip/deflate 압축 협상
+- Host별 동시 요청 수 제한
+- Host별 지연 시간 / 연결 재사용 통계 (get_http_stats)
+"""
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.settings import (
+    HTTP_MAX_RETRIES,
+    HTTP_BACKOFF_FACTOR,
+    HTTP_POOL_SIZE,
+    HTTP_HOST_CONCURRENCY,
+    HTTP_NO_RETRY_HOSTS,
+)
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept-Encoding": "gzip, deflate",
+}
+
+
+@dataclass
+class HostStats:
+    """Host별 요청 통계"""
+    requests: int = 0
+    errors: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+
+
+class _HostClient:
+    """단일 host 전용 세션 + 동시성 제한"""
+
+    def __init__(self, host: str):
+        self.host = host
+        self.stats = HostStats()
+        self.semaphore = threading.BoundedSemaphore(HTTP_HOST_CONCURRENCY)
+        self._stats_lock = threading.Lock()
+
+        retries = 0 if host in HTTP_NO_RETRY_HOSTS else HTTP_MAX_RETRIES
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            backoff_factor=HTTP_BACKOFF_FACTOR,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,  # 최종 응답은 그대로 반환 (서비스에서 status 확인)
+        )
+        self.adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+
+    def record(self, latency: float, error: bool) -> None:
+        with self._stats_lock:
+            self.stats.requests += 1
+            self.stats.errors += int(error)
+            self.stats.total_latency += latency
+            self.stats.max_latency = max(self.stats.max_latency, latency)
+
+    def pool_counters(self) -> Dict[str, int]:
+        """urllib3 풀 기준 새 연결 수 / 요청 수"""
+        connections = requests_sent = 0
+        for key in list(self.adapter.poolmanager.pools.keys()):
+            pool = self.adapter.poolmanager.pools.get(key)
+            if pool is None:
+                continue
+            connections += pool.num_connections
+            requests_sent += pool.num_requests
+        return {"connections": connections, "pool_requests": requests_sent}
+
+
+_clients: Dict[str, _HostClient] = {}
+_clients_lock = threading.Lock()
+
+
+def _client_for(url: str) -> _HostClient:
+    host = urlsplit(url).hostname or ""
+    with _clients_lock:
+        client = _clients.get(host)
+        if client is None:
+            client = _HostClient(host)
+            _clients[host] = client
+        return client
+
+
+def request(method: str, url: str, timeout: float = 10, **kwargs) -> requests.Response:
+    """
+    공유 세션으로 HTTP 요청 (requests.request와 동일한 인자)
+
+    실패 시 requests.RequestException을 그대로 전달합니다.
+    """
+    client = _client_for(url)
+    start = time.perf_counter()
+    error = True
+    with client.semaphore:
+        try:
+            response = client.session.request(method, url, timeout=timeout, **kwargs)
+            error = response.status_code >= 400
+            return response
+        finally:
+            client.record(time.perf_counter() - start, error)
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    return request("POST", url, **kwargs)
+
+
+def get_http_stats() -> Dict[str, dict]:
+    """Host별 요청 수, 평균/최대 지연(ms), 연결 재사용률"""
+    with _clients_lock:
+        clients = list(_clients.values())
+    stats = {}
+    for client in clients:
+        s = asdict(client.stats)
+        s.update(client.pool_counters())
+        s["avg_latency_ms"] = (s["total_latency"] / s["requests"] * 1000) if s["requests"] else 0.0
+        s["max_latency_ms"] = s.pop("max_latency") * 1000
+        s.pop("total_latency")
+        reused = max(0, s["pool_requests"] - s["connections"])
+        s["reuse_rate"] = reused / s["pool_requests"] if s["pool_requests"] else 0.0
+        stats[client.host] = s
+    return stats
@@ -1,10 +1,25 @@
 """
 Index Service v2 - Stable Fetching from Yahoo Finance
+- 관심 목록 시세는 spark 엔드포인트로 QUOTE_BATCH_SIZE개씩 묶어 조회 (묶음끼리는 병렬)
 """
-import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Callable, Dict, Iterable, Optional, List, Sequence, Tuple
+
+from config.settings import QUOTE_BATCH_SIZE, QUOTE_MAX_SYMBOLS, QUOTE_MAX_WORKERS
+from services import http_client
+from services.cache_service import all_items_cacheable, cached
+
+YAHOO_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "application/json",
+    "Referer": "https://finance.yahoo.com/"
+}
+
+# 시세 일괄 조회 전용 풀 (동시 요청 수 상한)
+_quote_executor = ThreadPoolExecutor(max_workers=QUOTE_MAX_WORKERS, thread_name_prefix="quotes")
+
 
 @dataclass
 class IndexData:
@@ -16,6 +31,7 @@ class IndexData:
     error: Optional[str] = None
 
 
+@cached("yahoo")
 def fetch_index(symbol: str, name: str) -> IndexData:
     """
     Yahoo Finance에서 지수 데이터 가져오기 (헤더 강화)
@@ -24,18 +40,14 @@ def fetch_index(symbol: str, name: str) -> IndexData:
         # query2가 더 안정적일 수 있음
         url = f"https://query2.finance.yahoo.com/v8/finance/chart/{symbol}?interval=1d&range=1d"
         
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "application/json",
-            "Referer": "https://finance.yahoo.com/"
-        }
+        headers = YAHOO_HEADERS
         
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http_client.get(url, headers=headers, timeout=10)
         
         # 404/401 에러 등이 발생할 경우 query1으로 백업
         if response.status_code != 200:
             url = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?interval=1d&range=1d"
-            response = requests.get(url, headers=headers, timeout=10)
+            response = http_client.get(url, headers=headers, timeout=10)
         
         response.raise_for_status()
         data = response.json()
@@ -95,6 +107,7 @@ def get_us_indices() -> List[IndexData]:
     return [fetch_index(sym, name) for sym, name in indices]
 
 
+@cached("yahoo", cache_if=all_items_cacheable)
 def get_kr_indices() -> List[IndexData]:
     """한국 주요 지수 (KOSPI, KOSDAQ) - 5일 데이터로 변동률 계산"""
     indices = [
@@ -112,7 +125,7 @@ def get_kr_indices() -> List[IndexData]:
         try:
             # 5일 데이터로 전일 종가 확보
             url = f"https://query2.finance.yahoo.com/v8/finance/chart/{symbol}?interval=1d&range=5d"
-            response = requests.get(url, headers=headers, timeout=10)
+            response = http_client.get(url, headers=headers, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -147,3 +160,100 @@ def get_kr_indices() -> List[IndexData]:
             results.append(IndexData(symbol=symbol, name=name, error=f"오류: {str(e)[:30]}"))
     
     return results
+
+
+def map_bounded(fn: Callable, items: Iterable) -> list:
+    """fn을 QUOTE_MAX_WORKERS 이내로 병렬 실행 (입력 순서대로 결과 반환)"""
+    items = list(items)
+    if len(items) <= 1:
+        return [fn(item) for item in items]
+    return list(_quote_executor.map(fn, items))
+
+
+def _spark_series(data: dict) -> Dict[str, Tuple[dict, list]]:
+    """spark 응답 -> {symbol: (meta, closes)} (구/신 응답 형식 모두 처리)"""
+    series = {}
+    if "spark" in data:
+        for item in (data["spark"] or {}).get("result") or []:
+            response = (item.get("response") or [{}])[0]
+            closes = (response.get("indicators", {}).get("quote") or [{}])[0].get("close") or []
+            series[item.get("symbol")] = (response.get("meta", {}), closes)
+    else:
+        for symbol, item in data.items():
+            if isinstance(item, dict):
+                series[symbol] = (item, item.get("close") or [])
+    return series
+
+
+def _spark_chunk(symbols: Sequence[str]) -> Optional[Dict[str, IndexData]]:
+    """spark 한 번 호출로 여러 심볼의 현재가/전일 대비 조회 (호출 실패 시 None)"""
+    quotes = {}
+    try:
+        response = http_client.get(
+            "https://query2.finance.yahoo.com/v8/finance/spark",
+            params={"symbols": ",".join(symbols), "range": "5d", "interval": "1d"},
+            headers=YAHOO_HEADERS,
+            timeout=10,
+        )
+        response.raise_for_status()
+        series = _spark_series(response.json())
+    except Exception as e:
+        print(f"Spark quote error ({len(symbols)} symbols): {e}")
+        return None
+
+    for symbol, (meta, closes) in series.items():
+        valid = [c for c in closes if c is not None]
+        price = meta.get("regularMarketPrice") or (valid[-1] if valid else None)
+        if not price:
+            continue
+        previous = valid[-2] if len(valid) >= 2 else meta.get("previousClose")
+        change = price - previous if previous else 0
+        quotes[symbol] = IndexData(
+            symbol=symbol,
+            name=symbol,
+            current_price=price,
+            change=change,
+            change_percent=(change / previous) * 100 if previous else 0,
+        )
+    return quotes
+
+
+@cached("yahoo")
+def fetch_quotes(symbols: Tuple[str, ...], fallback: bool = True) -> Dict[str, IndexData]:
+    """
+    여러 Yahoo 심볼 시세를 최소 호출로 조회
+
+    Args:
+        symbols: Yahoo 심볼
+        fallback: spark 응답에 없는 심볼을 개별 chart 조회로 보완할지 여부
+            (spark 호출 자체가 실패한 묶음은 같은 host이므로 보완하지 않음)
+
+    Returns:
+        {symbol: IndexData} (조회된 심볼만, 입력 순서)
+    """
+    symbols = list(dict.fromkeys(symbols))
+    chunks = [symbols[i:i + QUOTE_BATCH_SIZE] for i in range(0, len(symbols), QUOTE_BATCH_SIZE)]
+    quotes, answered = {}, set()
+    for chunk, chunk_quotes in zip(chunks, map_bounded(_spark_chunk, chunks)):
+        if chunk_quotes is not None:
+            quotes.update(chunk_quotes)
+            answered.update(chunk)
+
+    missing = [s for s in symbols if s in answered and s not in quotes]
+    if fallback and missing:
+        for data in map_bounded(lambda s: fetch_index(s, s), missing):
+            if not data.error:
+                quotes[data.symbol] = data
+    return {s: quotes[s] for s in symbols if s in quotes}
+
+
+def tv_to_yahoo(ticker: str) -> str:
+    """TradingView 심볼 -> Yahoo 심볼 (NASDAQ:NVDA -> NVDA, NYSE:BRK.B -> BRK-B)"""
+    return ticker.split(":")[-1].upper().replace(".", "-")
+
+
+def fetch_us_quotes(tickers: Tuple[str, ...]) -> Dict[str, IndexData]:
+    """미국 즐겨찾기 시세 일괄 조회 ({TradingView 심볼: IndexData}, 최대 QUOTE_MAX_SYMBOLS 종목)"""
+    yahoo = {t: tv_to_yahoo(t) for t in tickers[:QUOTE_MAX_SYMBOLS]}
+    quotes = fetch_quotes(tuple(yahoo.values()))
+    return {t: quotes[y] for t, y in yahoo.items() if y in quotes}
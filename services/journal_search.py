@@ -0,0 +1,163 @@
+"""
+Journal Search - Incremental full-text index over journal entries (SQLite FTS5)
+일지 전체를 읽어 문자열 검색하는 대신 항목 단위 색인을 조회합니다.
+- 한글은 음절 bigram, 영문/숫자는 단어 단위 토큰 (Python에서 토큰화 -> FTS5 unicode61에 공백 구분으로 저장)
+- 항목 시작 위치(journal_store 오프셋)가 rowid, 작성 시각은 메타데이터로 보관
+- 증분 동기화: 마지막으로 색인한 항목 이후만 추가
+  파일 (크기, mtime, inode)가 그대로면 건너뜀, 색인한 앞부분의 해시가 달라졌으면 전체 재색인
+- bm25 순위 (동점이면 최신 항목 우선)
+"""
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from config.settings import JOURNAL_SEARCH_DB_PATH
+from services.journal_store import JournalStore, journal_store
+
+_TOKEN_RE = re.compile(r"[가-힣]+|[0-9a-z]+")
+_ENTRY_RE = re.compile(r"^\s*---\s*\*\*\[([^\]]*)\]\*\*\s*", re.S)
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER)",
+    "CREATE TABLE IF NOT EXISTS entries (offset INTEGER PRIMARY KEY, ts TEXT, body TEXT)",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(tokens, content='', tokenize='unicode61')",
+)
+
+
+@dataclass
+class JournalHit:
+    """검색 결과 항목"""
+    offset: int
+    timestamp: str
+    text: str
+    score: float
+
+
+def tokenize(text: str) -> List[str]:
+    """한글 음절 bigram (한 글자 단어는 그대로) + 영문/숫자 단어"""
+    tokens = []
+    for word in _TOKEN_RE.findall(text.lower()):
+        if "가" <= word[0] <= "힣" and len(word) > 1:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def _term_query(term: str) -> Optional[str]:
+    """검색어 하나 -> FTS5 식 (토큰 AND, 한 글자/영문 토큰은 접두어 검색)"""
+    parts = []
+    for token in tokenize(term):
+        prefix = len(token) == 1 or token.isascii()
+        parts.append(f'"{token}"' + ("*" if prefix else ""))
+    return " AND ".join(parts) if parts else None
+
+
+def parse_entry(raw: str) -> tuple:
+    """'---\\n**[2026-01-31 09:00]**\\n본문' -> (시각, 본문)"""
+    match = _ENTRY_RE.match(raw)
+    if not match:
+        return "", raw.strip()
+    return match.group(1), raw[match.end():].strip()
+
+
+class JournalSearchIndex:
+    """일지 항목 전문 검색 색인 (스레드 안전)"""
+
+    def __init__(self, store: JournalStore = journal_store, path: Path = JOURNAL_SEARCH_DB_PATH):
+        self.store = store
+        self.path = Path(path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _meta(self, key: str, default: int = -1) -> int:
+        row = self._db().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def _reset(self, conn: sqlite3.Connection) -> None:
+        conn.execute("DELETE FROM entries")
+        conn.execute("DELETE FROM meta")
+        conn.execute("DROP TABLE entries_fts")
+        conn.execute(_SCHEMA[2])
+
+    def sync(self) -> int:
+        """
+        새 항목만 색인. 추가된 항목 수 반환
+        마지막 색인 이후 앞부분이 바뀌었으면 (직접 편집, 재작성 - 크기가 같아도) 전체 재색인
+        """
+        with self._lock:
+            conn = self._db()
+            size, mtime_ns, inode = self.store.signature()
+            if [size, mtime_ns, inode] == [self._meta(k) for k in ("journal_size", "journal_mtime", "journal_ino")]:
+                return 0
+            last = self._meta("last_offset")
+            indexed_size = self._meta("journal_size", 0)
+            appended = inode == self._meta("journal_ino") and size >= indexed_size
+            if size:
+                indexed_hash, file_hash = self.store.prefix_digests(min(indexed_size, size), size)
+            else:
+                indexed_hash = file_hash = 0
+            with conn:
+                if last >= 0 and not (
+                    appended and indexed_hash == self._meta("journal_hash", 0) and self.store.has_entry(last)
+                ):
+                    self._reset(conn)
+                    last = -1
+                rows = []
+                for offset, raw in self.store.entries_after(last):
+                    ts, body = parse_entry(raw)
+                    rows.append((offset, ts, body))
+                conn.executemany("INSERT OR REPLACE INTO entries (offset, ts, body) VALUES (?, ?, ?)", rows)
+                conn.executemany(
+                    "INSERT INTO entries_fts (rowid, tokens) VALUES (?, ?)",
+                    [(offset, " ".join(tokenize(body))) for offset, _, body in rows],
+                )
+                if rows:
+                    last = rows[-1][0]
+                conn.executemany(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    [("last_offset", last), ("journal_size", size), ("journal_mtime", mtime_ns),
+                     ("journal_ino", inode), ("journal_hash", file_hash)],
+                )
+            return len(rows)
+
+    def _query(self, match: str, limit: int) -> List[JournalHit]:
+        self.sync()
+        with self._lock:
+            rows = self._db().execute(
+                "SELECT e.offset, e.ts, e.body, bm25(entries_fts) AS score "
+                "FROM entries_fts JOIN entries e ON e.offset = entries_fts.rowid "
+                "WHERE entries_fts MATCH ? ORDER BY score, e.offset DESC LIMIT ?",
+                (match, limit),
+            ).fetchall()
+        return [JournalHit(*row) for row in rows]
+
+    def search(self, query: str, limit: int = 10) -> List[JournalHit]:
+        """모든 단어를 포함하는 항목 (공백으로 구분된 단어 AND)"""
+        terms = [t for t in (_term_query(word) for word in query.split()) if t]
+        if not terms:
+            return []
+        return self._query(" AND ".join(f"({t})" for t in terms), limit)
+
+    def search_any(self, terms: Sequence[str], limit: int = 3) -> List[JournalHit]:
+        """terms 중 하나라도 포함하는 항목 (관련도 순)"""
+        queries = [t for t in (_term_query(term) for term in terms) if t]
+        if not queries:
+            return []
+        return self._query(" OR ".join(f"({q})" for q in queries), limit)
+
+
+journal_index = JournalSearchIndex()
@@ -0,0 +1,252 @@
+"""
+Journal Store - Append-only investment journal with an entry offset index
+저장 시 전체 파일을 읽고 다시 쓰는 대신 파일 끝에만 기록합니다.
+- O_APPEND write (기존 내용은 건드리지 않음, 짧은 쓰기는 이어서 기록, 실패 시 원래 크기로 잘라냄)
+- fsync 묶음 처리: 마지막 추가 후 JOURNAL_FSYNC_SEC 뒤 한 번 (종료 시 즉시)
+- 항목 시작 위치 인덱스 (journal.idx, little-endian uint64 배열)
+- 꼬리 읽기: 마지막 N 바이트 / N 항목만 seek해서 읽음
+인덱스 캐시는 파일 (크기, mtime, inode)가 같을 때만 재사용합니다. 일지가 인덱스보다 나중에
+수정되었으면 (직접 편집 등) 구분선("---")을 처음부터 다시 스캔해 재생성합니다.
+"""
+import atexit
+import hashlib
+import os
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from config.settings import JOURNAL_PATH, JOURNAL_INDEX_PATH, JOURNAL_FSYNC_SEC
+
+ENTRY_SEPARATOR = b"\n\n---\n**["
+_OFFSET = struct.Struct("<Q")
+
+
+class JournalStore:
+    """Append 전용 일지 + 항목 오프셋 인덱스 (스레드 안전)"""
+
+    def __init__(self, path: Path = JOURNAL_PATH, index_path: Path = JOURNAL_INDEX_PATH,
+                 fsync_sec: float = JOURNAL_FSYNC_SEC):
+        self.path = Path(path)
+        self.index_path = Path(index_path)
+        self.fsync_sec = fsync_sec
+        self._offsets: Optional[array] = None
+        self._signature: Optional[Tuple[int, int, int]] = None
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
+
+    # --- Index ---
+    def _scan(self, start: int) -> array:
+        """start 이후 항목 시작 위치 스캔"""
+        offsets = array("Q")
+        if not self.path.exists():
+            return offsets
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            data = f.read()
+        pos = data.find(ENTRY_SEPARATOR)
+        while pos != -1:
+            offsets.append(start + pos)
+            pos = data.find(ENTRY_SEPARATOR, pos + 1)
+        return offsets
+
+    def _write_index(self) -> None:
+        offsets = array("Q", self._offsets)
+        if sys.byteorder != "little":
+            offsets.byteswap()
+        tmp = self.index_path.with_suffix(".idx.tmp")
+        with open(tmp, "wb") as f:
+            offsets.tofile(f)
+        os.replace(tmp, self.index_path)
+
+    @staticmethod
+    def _stat(path: Path) -> Optional[os.stat_result]:
+        try:
+            return os.stat(path)
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _signature_of(st: Optional[os.stat_result]) -> Tuple[int, int, int]:
+        return (st.st_size, st.st_mtime_ns, st.st_ino) if st else (0, 0, 0)
+
+    def _load(self) -> array:
+        """인덱스 로드 + 검증 (마지막 항목 이후 추가분은 꼬리만 스캔)"""
+        st = self._stat(self.path)
+        signature = self._signature_of(st)
+        if self._offsets is not None and signature == self._signature:
+            return self._offsets
+        size = signature[0]
+
+        offsets = array("Q")
+        index_st = self._stat(self.index_path)
+        # append()는 일지 -> 인덱스 순으로 쓰므로, 일지가 더 최근이면 인덱스 이후 편집된 것
+        if index_st and st and index_st.st_mtime_ns >= st.st_mtime_ns:
+            with open(self.index_path, "rb") as f:
+                raw = f.read()
+            offsets.frombytes(raw[: len(raw) - len(raw) % offsets.itemsize])
+            if sys.byteorder != "little":
+                offsets.byteswap()
+
+        valid = not offsets or (offsets[-1] < size and self._separator_at(offsets[-1]))
+        if valid:
+            tail = self._scan(offsets[-1] + 1 if offsets else 0)
+            changed = len(tail) > 0
+            offsets.extend(tail)
+        else:
+            offsets = self._scan(0)
+            changed = True
+
+        self._offsets, self._signature = offsets, signature
+        if changed:
+            self._write_index()
+        return offsets
+
+    def _separator_at(self, offset: int) -> bool:
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return f.read(len(ENTRY_SEPARATOR)) == ENTRY_SEPARATOR
+
+    def invalidate(self) -> None:
+        """파일 전체를 다시 쓴 경우 호출 (인덱스 재생성)"""
+        with self._lock:
+            self._offsets = None
+            self.index_path.unlink(missing_ok=True)
+
+    # --- Write ---
+    def append(self, entry: str, timestamp: Optional[datetime] = None) -> int:
+        """
+        새 항목을 파일 끝에 추가하고 항목 시작 위치를 반환합니다.
+        """
+        stamp = (timestamp or datetime.now()).strftime("%Y-%m-%d %H:%M")
+        data = f"\n\n---\n**[{stamp}]**\n{entry}".encode("utf-8")
+        with self._lock:
+            offsets = self._load()
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                offset = os.fstat(fd).st_size
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view):]
+                except BaseException:
+                    os.ftruncate(fd, offset)  # 잘린 항목을 남기지 않음
+                    raise
+                signature = self._signature_of(os.fstat(fd))
+            finally:
+                os.close(fd)
+            offsets.append(offset)
+            self._signature = signature
+            with open(self.index_path, "ab") as f:
+                f.write(_OFFSET.pack(offset))
+            self._schedule_fsync()
+            return offset
+
+    def _schedule_fsync(self) -> None:
+        self._dirty = True
+        if self._timer is None:
+            self._timer = threading.Timer(self.fsync_sec, self.sync)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def sync(self) -> None:
+        """대기 중인 추가분을 디스크에 fsync (여러 번의 추가를 한 번에)"""
+        with self._lock:
+            self._timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            for path in (self.path, self.index_path):
+                if path.exists():
+                    fd = os.open(path, os.O_RDONLY)
+                    try:
+                        os.fsync(fd)
+                    finally:
+                        os.close(fd)
+
+    # --- Read ---
+    def read_all(self) -> str:
+        with self._lock:
+            return self.path.read_text(encoding="utf-8") if self.path.exists() else ""
+
+    def tail_bytes(self, n: int) -> str:
+        """마지막 n 바이트 (잘린 UTF-8 문자는 버림)"""
+        with self._lock:
+            if not self.path.exists():
+                return ""
+            with open(self.path, "rb") as f:
+                f.seek(max(0, f.seek(0, os.SEEK_END) - n))
+                return f.read().decode("utf-8", errors="ignore")
+
+    def tail_entries(self, n: int) -> str:
+        """마지막 n개 항목 (구분선 포함)"""
+        with self._lock:
+            offsets = self._load()
+            if not offsets or n <= 0:
+                return ""
+            with open(self.path, "rb") as f:
+                f.seek(offsets[-min(n, len(offsets))])
+                return f.read().decode("utf-8", errors="replace")
+
+    def entries_after(self, offset: int = -1) -> List[Tuple[int, str]]:
+        """offset 이후에 시작하는 항목들 [(시작 위치, 텍스트)] - 증분 색인용"""
+        with self._lock:
+            offsets = self._load()
+            i = bisect_right(offsets, offset)
+            if i >= len(offsets):
+                return []
+            with open(self.path, "rb") as f:
+                f.seek(offsets[i])
+                data = f.read()
+            bounds = [o - offsets[i] for o in offsets[i:]] + [len(data)]
+            return [
+                (offsets[i] + start, data[start:end].decode("utf-8", errors="replace"))
+                for start, end in zip(bounds, bounds[1:])
+            ]
+
+    def has_entry(self, offset: int) -> bool:
+        """offset이 현재 파일의 항목 시작 위치인지 (파일 재작성 감지용)"""
+        with self._lock:
+            offsets = self._load()
+            i = bisect_left(offsets, offset)
+            return i < len(offsets) and offsets[i] == offset
+
+    def size(self) -> int:
+        with self._lock:
+            self._load()
+            return self._signature[0]
+
+    def signature(self) -> Tuple[int, int, int]:
+        """(크기, mtime_ns, inode) - 파일 변경 감지용"""
+        with self._lock:
+            self._load()
+            return self._signature
+
+    def prefix_digests(self, *lengths: int) -> List[int]:
+        """
+        앞 n 바이트의 64비트 해시 (lengths는 오름차순, 파일은 한 번만 읽음) - 앞부분 편집 감지용
+        """
+        digests = []
+        hasher = hashlib.blake2b(digest_size=8)
+        pos = 0
+        with self._lock, open(self.path, "rb") as f:
+            for length in lengths:
+                if length > pos:
+                    chunk = f.read(length - pos)
+                    hasher.update(chunk)
+                    pos += len(chunk)
+                digests.append(int.from_bytes(hasher.digest(), "little", signed=True))
+        return digests
+
+    def entry_count(self) -> int:
+        with self._lock:
+            return len(self._load())
+
+
+journal_store = JournalStore()
+atexit.register(journal_store.sync)
@@ -1,23 +1,15 @@
 """
 Korean Stock Favorites Service v2
-한국 주식 즐겨찾기 관리 - TradingView 호환 심볼 사용
+한국 주식 즐겨찾기 관리 - TradingView 호환 심볼 사용 (watchlist "kr", services/watchlist_service.py)
 """
-import json
-from pathlib import Path
 from typing import List
 from config.settings import DATA_DIR
+from services.symbol_master import symbol_master
+from services.watchlist_service import get_watchlist
+from shared.market_universe import DEFAULT_KR_FAVORITES
 
 KR_FAVORITES_PATH = DATA_DIR / "kr_favorites.json"
 
-# TradingView 한국 주식 심볼 형식: KOSPI:005930, KOSDAQ:035720
-DEFAULT_KR_FAVORITES = [
-    "KRX:005930",   # 삼성전자
-    "KRX:000660",   # SK하이닉스  
-    "KRX:373220",   # LG에너지솔루션
-    "KRX:005380",   # 현대차
-    "KRX:035420",   # NAVER
-]
-
 # 종목명 매핑
 KR_STOCK_NAMES = {
     "KRX:005930": "삼성전자",
@@ -33,46 +25,37 @@ KR_STOCK_NAMES = {
 }
 
 
+_watchlist = get_watchlist("kr", KR_FAVORITES_PATH, DEFAULT_KR_FAVORITES)
+
+
 def load_kr_favorites() -> List[str]:
-    """한국 주식 즐겨찾기 로드"""
-    if KR_FAVORITES_PATH.exists():
-        try:
-            with open(KR_FAVORITES_PATH, "r", encoding="utf-8") as f:
-                return json.load(f).get("favorites", DEFAULT_KR_FAVORITES)
-        except:
-            return DEFAULT_KR_FAVORITES
-    return DEFAULT_KR_FAVORITES
+    """한국 주식 즐겨찾기 로드 (메모리 캐시)"""
+    return _watchlist.items()
 
 
 def save_kr_favorites(favorites: List[str]) -> None:
     """한국 주식 즐겨찾기 저장"""
-    with open(KR_FAVORITES_PATH, "w", encoding="utf-8") as f:
-        json.dump({"favorites": favorites}, f, ensure_ascii=False, indent=2)
+    _watchlist.replace(favorites)
 
 
 def add_kr_favorite(ticker: str) -> List[str]:
     """즐겨찾기 추가"""
-    favorites = load_kr_favorites()
     # KRX: 접두사 추가
     if ":" not in ticker:
         ticker = f"KRX:{ticker}"
     else:
         ticker = ticker.upper()
-    if ticker not in favorites:
-        favorites.append(ticker)
-        save_kr_favorites(favorites)
-    return favorites
+    return _watchlist.add(ticker)
 
 
 def remove_kr_favorite(ticker: str) -> List[str]:
     """즐겨찾기 삭제"""
-    favorites = load_kr_favorites()
-    if ticker in favorites:
-        favorites.remove(ticker)
-        save_kr_favorites(favorites)
-    return favorites
+    return _watchlist.remove(ticker)
 
 
 def get_kr_stock_name(ticker: str) -> str:
-    """종목코드로 종목명 반환"""
+    """종목코드로 종목명 반환 (종목 마스터 우선)"""
+    symbol = symbol_master.lookup(ticker)
+    if symbol:
+        return symbol.name
     return KR_STOCK_NAMES.get(ticker, ticker.split(":")[-1] if ":" in ticker else ticker)
@@ -2,10 +2,17 @@
 Korean Stock Service - Yahoo Finance based
 TradingView 무료 위젯이 한국주식을 지원하지 않아 Yahoo Finance로 대체
 """
-import requests
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
+
+from config.settings import BACKEND_URL, CACHE_TTL, QUOTE_MAX_SYMBOLS
+from services import http_client
+from services.cache_service import cached
+from services.index_service import fetch_quotes, map_bounded
+from services.symbol_master import symbol_master
+from shared.market_universe import KR_STOCK_INFO, KRX_OPEN, KST, is_krx_open
+from shared.ohlcv_format import as_columns, as_records, columns_to_records, frame_to_columns, frame_to_records
 
 
 @dataclass
@@ -19,34 +26,31 @@ class KrStockData:
     error: Optional[str] = None
 
 
-# 종목코드 -> Yahoo Finance 심볼 변환 (한국주식은 .KS 또는 .KQ 접미사)
-KR_STOCK_INFO = {
-    "005930": ("005930.KS", "삼성전자"),
-    "000660": ("000660.KS", "SK하이닉스"),
-    "373220": ("373220.KS", "LG에너지솔루션"),
-    "005380": ("005380.KS", "현대차"),
-    "035420": ("035420.KS", "NAVER"),
-    "051910": ("051910.KS", "LG화학"),
-    "006400": ("006400.KS", "삼성SDI"),
-    "035720": ("035720.KS", "카카오"),
-    "003670": ("003670.KS", "포스코퓨처엠"),
-    "068270": ("068270.KS", "셀트리온"),
-    "005490": ("005490.KS", "POSCO홀딩스"),
-    "028260": ("028260.KS", "삼성물산"),
-    "105560": ("105560.KS", "KB금융"),
-    "055550": ("055550.KS", "신한지주"),
-    "034730": ("034730.KS", "SK"),
-}
+def kr_history_ttl() -> float:
+    """장중에는 짧게, 장 마감 후에는 다음 장 시작까지 (최대 CACHE_TTL["kr_history"]) 캐시"""
+    now = datetime.now(KST)
+    if is_krx_open(now):
+        return CACHE_TTL["kr_history_live"]
+    next_open = now.replace(hour=KRX_OPEN[0], minute=KRX_OPEN[1], second=0, microsecond=0)
+    if next_open <= now:
+        next_open += timedelta(days=1)
+    while next_open.weekday() >= 5:
+        next_open += timedelta(days=1)
+    return min(CACHE_TTL["kr_history"], (next_open - now).total_seconds())
 
 
 def get_kr_stock_name(code: str) -> str:
-    """종목코드로 종목명 반환"""
+    """종목코드로 종목명 반환 (종목 마스터 -> KR_STOCK_INFO -> 코드)"""
     clean_code = code.replace("KRX:", "").replace(".KS", "").replace(".KQ", "")
+    symbol = symbol_master.lookup(clean_code)
+    if symbol:
+        return symbol.name
     if clean_code in KR_STOCK_INFO:
         return KR_STOCK_INFO[clean_code][1]
     return clean_code
 
 
+@cached("kr_history", ttl=kr_history_ttl)
 def fetch_kr_stock(code: str, days: int = 30) -> KrStockData:
     """
     Accelerated Data Fetching via Localhost Backend with FDR Fallback
@@ -54,38 +58,28 @@ def fetch_kr_stock(code: str, days: int = 30) -> KrStockData:
     # 코드 정리
     clean_code = code.replace("KRX:", "").replace(".KS", "").replace(".KQ", "")
     
-    # 이름 조회 (기존 로직 활용)
-    name = clean_code
-    if clean_code in KR_STOCK_INFO:
-        _, name = KR_STOCK_INFO[clean_code]
+    # 이름 조회 (종목 마스터)
+    name = get_kr_stock_name(clean_code)
 
     # 1차 시도: Backend API
     try:
-        url = f"http://127.0.0.1:8000/api/v1/stocks/history/{clean_code}?days={days}"
-        response = requests.get(url, timeout=2)  # 빠른 실패를 위해 2초
+        url = f"{BACKEND_URL}/stocks/history/{clean_code}?days={days}&format=columns"
+        response = http_client.get(url, timeout=2)  # 빠른 실패를 위해 2초
         
         if response.status_code == 200:
-            data = response.json()
-            if data:
-                latest = data[-1]
-                prev = data[-2] if len(data) > 1 else latest
-                history_dicts = [{
-                    "time": d['time'],
-                    "open": float(d.get('open', d['close'])),
-                    "high": float(d.get('high', d['close'])),
-                    "low": float(d.get('low', d['close'])),
-                    "close": float(d['close']),
-                    "volume": int(d.get('volume', 0))
-                } for d in data]
-                current_price = latest['close']
-                change_percent = ((latest['close'] - prev['close']) / prev['close']) * 100
+            cols = as_columns(response.json())
+            closes = cols["close"]
+            if closes:
+                current_price = closes[-1]
+                prev_close = closes[-2] if len(closes) > 1 else current_price
+                change_percent = ((current_price - prev_close) / prev_close) * 100
                 
                 return KrStockData(
                     code=clean_code,
                     name=name,
                     current_price=current_price,
                     change_percent=change_percent,
-                    history=history_dicts,
+                    history=columns_to_records(cols),
                 )
     except Exception:
         pass  # 폴백으로 진행
@@ -98,38 +92,29 @@ def fetch_kr_stock(code: str, days: int = 30) -> KrStockData:
         start_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
         df = fdr.DataReader(clean_code, start_date)
         
-        if df is not None and len(df) > 0:
-            df = df.dropna()
-            history_dicts = [{
-                "time": idx.strftime("%Y-%m-%d"),
-                "open": float(row.get('Open', row['Close'])),
-                "high": float(row.get('High', row['Close'])),
-                "low": float(row.get('Low', row['Close'])),
-                "close": float(row['Close']),
-                "volume": int(row.get('Volume', 0))
-            } for idx, row in df.iterrows()]
-            
-            latest = df.iloc[-1]
-            prev = df.iloc[-2] if len(df) > 1 else latest
-            current_price = float(latest['Close'])
-            change_percent = ((latest['Close'] - prev['Close']) / prev['Close']) * 100
+        cols = frame_to_columns(df)
+        closes = cols["close"]
+        if closes:
+            current_price = closes[-1]
+            prev_close = closes[-2] if len(closes) > 1 else current_price
+            change_percent = ((current_price - prev_close) / prev_close) * 100
             
             return KrStockData(
                 code=clean_code,
                 name=name,
                 current_price=current_price,
-                change_percent=float(change_percent),
-                history=history_dicts,
+                change_percent=change_percent,
+                history=columns_to_records(cols),
             )
     except Exception as e:
         return KrStockData(clean_code, name, None, None, [], error=f"데이터 로딩 실패: {str(e)[:30]}")
 
 
+@cached("kr_history", ttl=kr_history_ttl)
 def fetch_kr_index_history(code: str, days: int = 365) -> List[dict]:
     """
     백엔드 API를 통해 지수 이력 데이터 조회 (실패 시 네이버 금융 API 폴백)
     """
-    import requests
     import json
     from datetime import datetime
     
@@ -138,11 +123,11 @@ def fetch_kr_index_history(code: str, days: int = 365) -> List[dict]:
     elif code == "KOSDAQ": target_code = "KOSDAQ" 
     
     # 1. Try Backend API (localhost)
-    url = f"http://127.0.0.1:8000/api/v1/stocks/history/{target_code}?days={days}"
+    url = f"{BACKEND_URL}/stocks/history/{target_code}?days={days}&format=columns"
     try:
-        response = requests.get(url, timeout=2)
+        response = http_client.get(url, timeout=2)
         if response.status_code == 200:
-            return response.json()
+            return as_records(response.json())
     except Exception:
         pass
 
@@ -159,7 +144,7 @@ def fetch_kr_index_history(code: str, days: int = 365) -> List[dict]:
             'Referer': 'https://finance.naver.com/'
         }
         
-        response = requests.get(url, headers=headers, timeout=5)
+        response = http_client.get(url, headers=headers, timeout=5)
         if response.status_code == 200:
             text = response.text.strip()
             cleaned_text = text.replace("NaN", "0")
@@ -194,21 +179,45 @@ def fetch_kr_index_history(code: str, days: int = 365) -> List[dict]:
     try:
         import FinanceDataReader as fdr
         fdr_code = "KS11" if code == "KOSPI" else "KQ11"
-        df = fdr.DataReader(fdr_code)
+        # 전체 상장 이력 대신 필요한 구간만 (거래일 기준 days개 + 휴일 여유)
+        start_date = (datetime.now() - timedelta(days=int(days * 1.5) + 10)).strftime("%Y-%m-%d")
+        df = fdr.DataReader(fdr_code, start_date)
         if df is not None and not df.empty:
-            df = df.iloc[-days:].dropna()
-            history = []
-            for index, row in df.iterrows():
-                history.append({
-                    "time": index.strftime("%Y-%m-%d"),
-                    "open": float(row.get('Open', 0)),
-                    "high": float(row.get('High', 0)),
-                    "low": float(row.get('Low', 0)),
-                    "close": float(row.get('Close', 0)),
-                    "volume": int(row.get('Volume', 0))
-                })
-            return history
+            return frame_to_records(df.iloc[-days:])
     except Exception as e:
         print(f"FDR Error ({code}): {e}")
         
     return []
+
+
+def _clean_kr_code(ticker: str) -> str:
+    return ticker.replace("KRX:", "").replace(".KS", "").replace(".KQ", "")
+
+
+def fetch_kr_quotes(tickers: Tuple[str, ...]) -> Dict[str, KrStockData]:
+    """
+    한국 즐겨찾기 시세 일괄 조회 ({입력 심볼: KrStockData}, history 없음, 최대 QUOTE_MAX_SYMBOLS 종목)
+
+    1) Yahoo spark 묶음 조회 - 종목 마스터에 없는 종목은 .KS/.KQ를 같은 묶음에 함께 요청
+    2) 응답에 없는 종목은 종목별 fetch_kr_stock (백엔드/FDR)을 제한된 병렬로 조회
+    """
+    codes = {t: _clean_kr_code(t) for t in tickers[:QUOTE_MAX_SYMBOLS]}
+    candidates = {}
+    for code in codes.values():
+        symbol = symbol_master.lookup(code)
+        candidates[code] = [symbol.yahoo] if symbol else [f"{code}.KS", f"{code}.KQ"]
+    quotes = fetch_quotes(tuple(sym for syms in candidates.values() for sym in syms), fallback=False)
+    yahoo = {code: next((sym for sym in syms if sym in quotes), None) for code, syms in candidates.items()}
+
+    results = {}
+    for code, sym in yahoo.items():
+        q = quotes.get(sym)
+        if q:
+            results[code] = KrStockData(code, get_kr_stock_name(code), q.current_price, q.change_percent, [])
+
+    missing = [code for code in dict.fromkeys(codes.values()) if code not in results]
+    for data in map_bounded(lambda code: fetch_kr_stock(code, days=10), missing):
+        if not data.error and data.current_price is not None:
+            results[data.code] = KrStockData(data.code, data.name, data.current_price, data.change_percent, [])
+
+    return {t: results[code] for t, code in codes.items() if code in results}
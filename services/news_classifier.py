@@ -0,0 +1,121 @@
+"""
+News Classifier - Precompiled keyword category matcher
+모듈 import 시 카테고리 키워드를 접두사 트리 정규식 하나로 컴파일하고, 제목당 한 번만 스캔합니다.
+- 영어: 단어 경계 매칭 (rate ≠ corporate, war ≠ software), 복수형(s/es) 허용
+- 한국어: 조사가 붙으므로 부분 문자열 매칭 (금리 -> 금리가, 금리인상)
+- 키워드별 가중치 합이 가장 큰 카테고리 선택 (동점이면 거시 > 지수 > 주식)
+- 피드(source)별 가중치 추가/변경 (FEED_OVERRIDES)
+"""
+import re
+from typing import Dict, Optional, Tuple
+
+MACRO, INDEX, STOCK = 1, 2, 3
+
+# 카테고리 -> {키워드: 가중치}
+KEYWORDS: Dict[int, Dict[str, float]] = {
+    MACRO: {
+        "fed": 2, "fomc": 2, "powell": 2, "rate": 1, "rate cut": 2, "rate hike": 2, "interest rate": 2,
+        "inflation": 2, "cpi": 2, "pce": 2, "gdp": 2, "job": 1, "payrolls": 2, "unemployment": 2,
+        "economy": 1.5, "recession": 2, "policy": 1, "treasury": 1.5, "yield": 1.5, "tariff": 1.5,
+        "war": 1, "oil": 1, "opec": 1.5, "gold": 1, "dollar": 1, "central bank": 2, "ecb": 2, "boj": 2,
+        "금리": 2, "물가": 2, "연준": 2, "인플레이션": 2, "경기": 1, "고용": 1.5, "환율": 1.5, "국채": 1.5,
+        "관세": 1.5, "유가": 1, "한국은행": 2, "기준금리": 2,
+    },
+    INDEX: {
+        "s&p": 2, "s&p 500": 2, "nasdaq": 2, "dow": 2, "dow jones": 2, "russell": 1.5, "market": 1,
+        "stocks": 1, "wall street": 1.5, "rally": 1, "rallies": 1, "sell-off": 1.5, "selloff": 1.5,
+        "crash": 1, "bull": 1, "bear": 1, "index": 1, "kospi": 2, "kosdaq": 2, "nikkei": 2, "futures": 1,
+        "지수": 2, "증시": 2, "코스피": 2, "코스닥": 2, "상승": 0.5, "하락": 0.5, "마감": 0.5, "선물": 1,
+    },
+    STOCK: {
+        "earnings": 1.5, "shares": 1, "revenue": 1, "guidance": 1, "ceo": 1, "ipo": 1.5, "buyback": 1.5,
+        "dividend": 1, "downgrade": 1, "upgrade": 1, "acquisition": 1, "merger": 1,
+        "실적": 1.5, "주가": 1, "매출": 1, "영업이익": 1.5, "목표가": 1.5, "상장": 1,
+    },
+}
+
+# source -> 카테고리 -> {키워드: 가중치} (기본 테이블에 덮어씀)
+FEED_OVERRIDES: Dict[str, Dict[int, Dict[str, float]]] = {
+    # 종목 티커(NVDA, TSLA...) 기준 피드: 종목명이 나오면 개별 종목 기사로 우선 분류
+    "Yahoo Finance": {
+        STOCK: {"nvidia": 2, "tesla": 2, "apple": 2, "microsoft": 2},
+    },
+}
+
+_HANGUL = re.compile(r'[가-힣]')
+
+
+def _trie_pattern(terms) -> str:
+    """
+    키워드 목록 -> 접두사 트리 형태의 정규식 (Aho-Corasick처럼 공통 접두사를 한 번만 비교)
+    예: ["rate", "rate cut", "recession"] -> r(?:ate(?:\ cut)?|ecession)
+    수량자는 greedy이므로 같은 위치에서는 가장 긴 키워드가 매칭됩니다.
+    """
+    trie: Dict = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class KeywordClassifier:
+    """키워드 테이블을 정규식 하나로 컴파일한 분류기 (제목당 한 번 스캔)"""
+
+    def __init__(self, keywords: Dict[int, Dict[str, float]]):
+        self.weights: Dict[str, Tuple[int, float]] = {}
+        for category, terms in keywords.items():
+            for term, weight in terms.items():
+                self.weights[term.lower()] = (category, weight)
+
+        english = [t for t in self.weights if not _HANGUL.search(t)]
+        korean = [t for t in self.weights if _HANGUL.search(t)]
+        parts = []
+        if english:
+            parts.append(r'(?<![0-9a-z])(' + _trie_pattern(english) + r')(?:e?s)?(?![0-9a-z])')
+        if korean:
+            parts.append('(' + _trie_pattern(korean) + ')')
+        self.pattern = re.compile('|'.join(parts)) if parts else None
+
+    def scores(self, title: str) -> Dict[int, float]:
+        scores: Dict[int, float] = {}
+        if self.pattern is None:
+            return scores
+        for m in self.pattern.finditer(title.lower()):
+            category, weight = self.weights[m.group(1) or m.group(2)]
+            scores[category] = scores.get(category, 0) + weight
+        return scores
+
+    def classify(self, title: str, default: int = STOCK) -> int:
+        scores = self.scores(title)
+        if not scores:
+            return default
+        return max(sorted(scores), key=lambda c: scores[c])
+
+
+def _merged(overrides: Dict[int, Dict[str, float]]) -> Dict[int, Dict[str, float]]:
+    merged = {category: dict(terms) for category, terms in KEYWORDS.items()}
+    for category, terms in overrides.items():
+        for term in terms:
+            for other in merged.values():
+                other.pop(term, None)
+        merged.setdefault(category, {}).update(terms)
+    return merged
+
+
+_default = KeywordClassifier(KEYWORDS)
+_by_source = {source: KeywordClassifier(_merged(o)) for source, o in FEED_OVERRIDES.items()}
+
+
+def classify_title(title: str, source: Optional[str] = None) -> int:
+    """뉴스 카테고리 (1:거시, 2:지수, 3:주식)"""
+    return _by_source.get(source, _default).classify(title)
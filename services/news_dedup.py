@@ -0,0 +1,99 @@
+"""
+News Dedup - Near-duplicate headline clustering (MinHash + LSH)
+피드마다 문구만 조금 다른 같은 기사를 하나로 묶습니다.
+- 정규화된 제목의 문자 n-gram shingle -> MinHash 서명 (numpy 벡터 연산)
+- LSH 밴딩으로 후보 쌍만 추려 추정 Jaccard 유사도로 확인 (전체 쌍 비교 없음)
+- 클러스터마다 가장 최신 기사를 대표로, 출처 수를 hotness로 제공
+"""
+import re
+import unicodedata
+import zlib
+from typing import Dict, List
+
+import numpy as np
+
+SHINGLE_SIZE = 4
+NUM_PERM = 64
+BANDS = 16                 # 16 bands x 4 rows -> 후보 임계값 ~ (1/16)^(1/4) = 0.5
+SIMILARITY_THRESHOLD = 0.5
+
+_PRIME = (1 << 31) - 1
+_rng = np.random.RandomState(42)  # 고정 seed: 실행마다 같은 서명
+_A = _rng.randint(1, _PRIME, size=NUM_PERM).astype(np.int64)
+_B = _rng.randint(0, _PRIME, size=NUM_PERM).astype(np.int64)
+
+
+def normalize_title(title: str) -> str:
+    """소문자 + NFKC, 문장부호 제거, 공백 정리"""
+    t = unicodedata.normalize("NFKC", title).lower()
+    t = re.sub(r'[^0-9a-z가-힣\s]', ' ', t)
+    return re.sub(r'\s+', ' ', t).strip()
+
+
+def shingles(title: str, k: int = SHINGLE_SIZE) -> set:
+    t = normalize_title(title)
+    if len(t) <= k:
+        return {t} if t else set()
+    return {t[i:i + k] for i in range(len(t) - k + 1)}
+
+
+def minhash(shingle_set: set) -> np.ndarray:
+    """MinHash 서명 (NUM_PERM개). 빈 집합이면 모두 _PRIME"""
+    if not shingle_set:
+        return np.full(NUM_PERM, _PRIME, dtype=np.int64)
+    h = np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingle_set), dtype=np.int64, count=len(shingle_set))
+    # (a * h + b) mod p : a < 2^31, h < 2^32 -> int64 범위 내
+    return ((_A[:, None] * h[None, :] + _B[:, None]) % _PRIME).min(axis=1)
+
+
+def _find(parent: List[int], i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def cluster_news(items: List[Dict], threshold: float = SIMILARITY_THRESHOLD) -> List[Dict]:
+    """
+    유사 제목 기사 클러스터링
+
+    Args:
+        items: fetch_rss_news 형식 기사 ("title", "source", "hours_ago" 필수)
+
+    Returns:
+        클러스터 대표 기사 목록 (입력 순서 유지). 대표는 가장 최신 기사의 사본에
+        "sources"(출처 목록), "hotness"(출처 수), "cluster_size"가 추가됩니다.
+        원본 dict는 수정하지 않습니다 (캐시 공유 객체).
+    """
+    if not items:
+        return []
+    signatures = np.vstack([minhash(shingles(item["title"])) for item in items])
+    rows = NUM_PERM // BANDS
+
+    parent = list(range(len(items)))
+    checked = set()
+    for band in range(BANDS):
+        buckets: Dict[bytes, List[int]] = {}
+        for i, sig in enumerate(signatures[:, band * rows:(band + 1) * rows]):
+            buckets.setdefault(sig.tobytes(), []).append(i)
+        for members in buckets.values():
+            for j in members[1:]:
+                i = members[0]
+                if (i, j) in checked:
+                    continue
+                checked.add((i, j))
+                if np.mean(signatures[i] == signatures[j]) >= threshold:
+                    ri, rj = _find(parent, i), _find(parent, j)
+                    if ri != rj:
+                        parent[rj] = ri
+
+    clusters: Dict[int, List[int]] = {}
+    for i in range(len(items)):
+        clusters.setdefault(_find(parent, i), []).append(i)
+
+    result = []
+    for members in sorted(clusters.values(), key=lambda m: m[0]):
+        rep = min(members, key=lambda i: items[i]["hours_ago"])
+        sources = list(dict.fromkeys(items[i]["source"] for i in members))
+        result.append(dict(items[rep], sources=sources, hotness=len(sources), cluster_size=len(members)))
+    return result
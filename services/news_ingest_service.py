@@ -0,0 +1,153 @@
+"""
+News Ingest Service - Incremental RSS ingestion with a persistent article index
+- 피드별 ETag / Last-Modified 저장 후 조건부 요청 (304면 다운로드/파싱 생략)
+- GUID(없으면 link, title) 해시로 이미 본 기사는 건너뜀
+- data/news_index.json 에 기사 인덱스 보관 (NEWS_RETENTION_HOURS 지나면 정리)
+  정리된 기사 id는 피드에서 빠질 때까지 피드별 "pruned"에 남겨 다시 추가하지 않음 (느린 피드)
+- 변경(새 기사, 정리, ETag)이 없으면 인덱스 파일을 다시 쓰지 않음 (checked_at은 메모리에만 갱신)
+뉴스 화면은 피드 전체 재다운로드 대신 인덱스 조회로 구성됩니다.
+"""
+import hashlib
+import json
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import requests
+
+from config.settings import NEWS_INDEX_PATH, NEWS_RETENTION_HOURS, NEWS_FEED_LIMIT
+from services import http_client
+from services.data_service import write_json_atomic
+from services.rss_parser import iter_feed_items
+
+_lock = threading.Lock()
+_index: Optional[Dict] = None
+
+
+def article_id(guid: str = "", link: str = "", title: str = "") -> str:
+    """기사 식별 키 (GUID > link > title 순)"""
+    key = (guid or link or title).strip()
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def _load_index() -> Dict:
+    global _index
+    if _index is None:
+        try:
+            _index = json.loads(NEWS_INDEX_PATH.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            _index = {}
+        _index.setdefault("feeds", {})
+        _index.setdefault("articles", {})
+    return _index
+
+
+def parse_new_items(chunks: Iterable[bytes], seen, feed_ids: Optional[set] = None) -> Iterator[Dict]:
+    """
+    피드 본문(청크 스트림)에서 아직 인덱스에 없는 기사만 반환
+
+    최신 NEWS_FEED_LIMIT개까지만 읽고 나머지 문서는 다운로드/파싱하지 않습니다.
+    feed_ids를 주면 피드에 있는 모든 기사 id를 모읍니다 (정리된 기사 id 유지 여부 판단용).
+    """
+    for item in iter_feed_items(chunks, limit=NEWS_FEED_LIMIT):
+        aid = article_id(item["guid"], item["link"], "" if (item["guid"] or item["link"]) else item["title"])
+        if feed_ids is not None:
+            feed_ids.add(aid)
+        if aid in seen or not item["title"]:
+            continue
+        yield {
+            "id": aid,
+            "title": item["title"],
+            "link": item["link"],
+            "published": item["published"],
+        }
+
+
+def ingest_feed(feed_url: str, source_name: str) -> int:
+    """
+    피드 하나를 조건부 요청으로 가져와 새 기사만 인덱스에 추가
+
+    Returns:
+        새로 추가된 기사 수 (304 / 오류 시 0)
+    """
+    with _lock:
+        index = _load_index()
+        feed_state = dict(index["feeds"].get(feed_url, {}))
+        seen = set(index["articles"]) | set(feed_state.get("pruned", ()))
+
+    headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
+    if feed_state.get("etag"):
+        headers["If-None-Match"] = feed_state["etag"]
+    if feed_state.get("last_modified"):
+        headers["If-Modified-Since"] = feed_state["last_modified"]
+
+    feed_ids = None
+    try:
+        # stream=True: 필요한 항목까지만 받아 파싱하고 연결을 닫음
+        with http_client.get(feed_url, headers=headers, timeout=10, stream=True) as response:
+            if response.status_code == 304:
+                new_items = []
+            elif response.status_code == 200:
+                feed_ids = set()
+                new_items = list(parse_new_items(response.iter_content(65536), seen, feed_ids))
+            else:
+                print(f"RSS ingest error ({source_name}): HTTP {response.status_code}")
+                return 0
+    except requests.RequestException as e:
+        print(f"RSS ingest error ({source_name}): {e}")
+        return 0
+
+    now = time.time()
+
+    with _lock:
+        index = _load_index()
+        previous = index["feeds"].get(feed_url, {})
+        pruned = previous.get("pruned", [])
+        if feed_ids is not None:
+            pruned = [aid for aid in pruned if aid in feed_ids]  # 피드에서 빠진 기사는 잊음
+        state = {
+            "etag": response.headers.get("ETag") or feed_state.get("etag"),
+            "last_modified": response.headers.get("Last-Modified") or feed_state.get("last_modified"),
+            "checked_at": now,
+            "pruned": pruned,
+        }
+        changed = bool(new_items) or any(state[k] != previous.get(k) for k in ("etag", "last_modified", "pruned"))
+        index["feeds"][feed_url] = state
+        for item in new_items:
+            index["articles"][item["id"]] = {
+                "feed": feed_url,
+                "source": source_name,
+                "title": item["title"],
+                "link": item["link"],
+                "published": item["published"],
+                "fetched_at": now,
+            }
+        if _prune(index, now) or changed:
+            write_json_atomic(NEWS_INDEX_PATH, index)
+    return len(new_items)
+
+
+def _prune(index: Dict, now: float) -> int:
+    """보관 기간이 지난 기사 정리 (id는 피드별 "pruned"에 남김). 정리된 기사 수 반환"""
+    cutoff = now - NEWS_RETENTION_HOURS * 3600
+    expired = [
+        (aid, a["feed"]) for aid, a in index["articles"].items()
+        if (a.get("published") or a["fetched_at"]) < cutoff
+    ]
+    for aid, feed in expired:
+        del index["articles"][aid]
+        index["feeds"].setdefault(feed, {}).setdefault("pruned", []).append(aid)
+    return len(expired)
+
+
+def get_feed_articles(feed_url: str, limit: int = NEWS_FEED_LIMIT) -> List[Dict]:
+    """
+    인덱스에서 피드 기사 조회 (최신순)
+
+    Returns:
+        {"title", "link", "source", "published"(epoch, 없으면 None)} 리스트
+    """
+    with _lock:
+        articles = [a for a in _load_index()["articles"].values() if a["feed"] == feed_url]
+    articles.sort(key=lambda a: a.get("published") or a["fetched_at"], reverse=True)
+    return articles[:limit]
@@ -4,12 +4,23 @@ News Service v17.1 - Quota: Breaking(2), Macro(2), Index(3), Stock(3)
 - Others: Filtered by category
 """
 import os
-import requests
 import re
-import html
 import json
+import time
+import threading
+from concurrent.futures import Future
 from datetime import datetime
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
+
+from config.settings import NEWS_TRANSLATION_RETRY_SEC
+from services import http_client
+from services.cache_service import cached
+from services.news_ingest_service import ingest_feed, get_feed_articles
+from services.translation_cache import translation_cache
+from services.prefetch_service import submit_background
+from services.news_dedup import cluster_news
+from services.news_classifier import classify_title
+
 try:
     import streamlit as st
 except ImportError:
@@ -56,58 +67,32 @@ def format_economic_calendar(target_date: datetime) -> str:
     return "\n".join(lines)
 
 
-def categorize_news(title: str) -> int:
-    """뉴스 카테고리 분류 (1:거시, 2:지수, 3:주식)"""
-    t = title.lower()
-    macro = ['fed', 'rate', 'inflation', 'cpi', 'gdp', 'job', 'economy', 'recession', 'policy', 'treasury', 'yield', 'war', 'oil', 'gold', '금리', '물가', '연준']
-    index = ['s&p', 'nasdaq', 'dow', 'market', 'stocks', 'rally', 'crash', 'bull', 'bear', 'index', 'kospi', 'kosdaq', '지수', '증시', '상승', '하락', 'futures']
-    if any(k in t for k in macro): return 1
-    if any(k in t for k in index): return 2
-    return 3
+def categorize_news(title: str, source: Optional[str] = None) -> int:
+    """뉴스 카테고리 분류 (1:거시, 2:지수, 3:주식) - 키워드/가중치는 news_classifier 참고"""
+    return classify_title(title, source)
 
 
+@cached("news")
 def fetch_rss_news(feed_url: str, source_name: str) -> List[Dict]:
-    """RSS Parser"""
-    try:
-        headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
-        response = requests.get(feed_url, headers=headers, timeout=10)
-        items = re.findall(r'<item>(.*?)</item>', response.text, re.DOTALL)
-        news_list = []
-        now = datetime.now()
-        
-        # Increase fetch limit to 30 to ensure we have enough candidates
-        for item in items[:30]:
-            title_m = re.search(r'<title>(.*?)</title>', item, re.DOTALL)
-            link_m = re.search(r'<link>(.*?)</link>', item, re.DOTALL)
-            pub_m = re.search(r'<pubDate>(.*?)</pubDate>', item, re.DOTALL)
-            
-            if title_m:
-                t = html.unescape(re.sub(r'<!\[CDATA\[(.*?)\]\]>', r'\1', title_m.group(1))).strip()
-                t = re.sub(r'<[^>]+>', '', t)
-                l = re.sub(r'<!\[CDATA\[(.*?)\]\]>', r'\1', link_m.group(1)).strip() if link_m else ""
-                
-                h_ago = 999
-                t_disp = "최근"
-                if pub_m:
-                    try:
-                        pd_str = pub_m.group(1).strip()[:25]
-                        dt = datetime.strptime(pd_str, "%a, %d %b %Y %H:%M:%S")
-                        
-                        # Timezone handling assumption (UTC if +0000)
-                        diff = (datetime.utcnow() - dt).total_seconds() / 3600
-                        
-                        h_ago = diff
-                        if diff < 1: t_disp = f"{int(diff*60)}분 전"
-                        elif diff < 24: t_disp = f"{int(diff)}시간 전"
-                        else: t_disp = f"{int(diff/24)}일 전"
-                    except: pass
-                
-                news_list.append({
-                    "time": t_disp, "source": source_name, "title": t, "link": l,
-                    "priority": categorize_news(t), "hours_ago": h_ago
-                })
-        return news_list
-    except: return []
+    """RSS 뉴스 (조건부 요청으로 새 기사만 인덱스에 추가한 뒤 인덱스에서 조회)"""
+    ingest_feed(feed_url, source_name)
+    now = time.time()
+    news_list = []
+    for a in get_feed_articles(feed_url):
+        h_ago = 999
+        t_disp = "최근"
+        if a["published"]:
+            diff = (now - a["published"]) / 3600
+            h_ago = diff
+            if diff < 1: t_disp = f"{int(diff*60)}분 전"
+            elif diff < 24: t_disp = f"{int(diff)}시간 전"
+            else: t_disp = f"{int(diff/24)}일 전"
+
+        news_list.append({
+            "time": t_disp, "source": source_name, "title": a["title"], "link": a["link"],
+            "priority": categorize_news(a["title"], source_name), "hours_ago": h_ago
+        })
+    return news_list
 
 
 def parse_json_list(text: str) -> List[str]:
@@ -133,6 +118,10 @@ def parse_json_list(text: str) -> List[str]:
 
 class TranslationService:
     """Gemini API를 이용한 전문 번역 서비스 (Python-Pro patterns)"""
+
+    TARGET_LANG = "ko"
+    # 캐시 조회 시 허용하는 모델 (번역에 사용될 수 있는 모델 전체)
+    MODELS = ["gemini-2.0-flash", "gemini-1.5-flash"]
     
     def __init__(self, api_key: Optional[str]):
         self.api_key = api_key
@@ -151,7 +140,7 @@ class TranslationService:
         if not self.api_key: return []
         try:
             url = f"https://generativelanguage.googleapis.com/v1/models?key={self.api_key}"
-            resp = requests.get(url, timeout=5)
+            resp = http_client.get(url, timeout=5)
             if resp.status_code == 200:
                 models = resp.json().get("models", [])
                 return [m["name"].replace("models/", "") for m in models]
@@ -160,11 +149,32 @@ class TranslationService:
         return []
 
     def translate_headlines(self, titles: List[str]) -> List[str]:
-        """기사를 유동적으로 번역하여 리스트로 반환"""
+        """기사를 유동적으로 번역하여 리스트로 반환 (캐시에 없는 헤드라인만 한 번에 모델 호출)"""
+        final_list = titles.copy()
+        hits = translation_cache.get_many(titles, self.TARGET_LANG, self.MODELS)
+        for i, t in hits.items():
+            final_list[i] = t
+        misses = [i for i in range(len(titles)) if i not in hits]
+        if not misses:
+            return final_list
+
         if not self.api_key:
             self.last_error = "API Key missing"
-            return titles
-            
+            return final_list
+
+        batch = [titles[i] for i in misses]
+        translated, model = self._translate_batch(batch)
+        if model:
+            pairs = []
+            for i, t in zip(misses, translated):
+                final_list[i] = t
+                if t != titles[i]:
+                    pairs.append((titles[i], t))
+            translation_cache.put_many(pairs, self.TARGET_LANG, model)
+        return final_list
+
+    def _translate_batch(self, titles: List[str]) -> tuple:
+        """모델 호출 (SDK -> REST 순). Returns: (번역 리스트, 성공한 모델 또는 None)"""
         count = len(titles)
         # Prompt Engineering for Strict Korean Only
         prompt = f"Translate these headlines to Korean. Return a flat JSON list of strings. Do not include original English text. Input: {json.dumps(titles, ensure_ascii=False)}"
@@ -189,7 +199,7 @@ class TranslationService:
                     if result:
                         final_list = titles.copy()
                         for i, r in enumerate(result[:count]): final_list[i] = r
-                        return final_list
+                        return final_list, model_name
             except Exception as e:
                 self.last_error = f"SDK Error: {str(e)}"
                 print(f"TranslationService: {model_name} failed. {e}")
@@ -208,14 +218,14 @@ class TranslationService:
                 url = f"https://generativelanguage.googleapis.com/{ver}/models/{m_id}:generateContent?key={self.api_key}"
                 payload = {"contents": [{"parts": [{"text": prompt}]}]}
                 try:
-                    resp = requests.post(url, json=payload, headers=headers, timeout=10)
+                    resp = http_client.post(url, json=payload, headers=headers, timeout=10)
                     if resp.status_code == 200:
                         text = resp.json()["candidates"][0]["content"]["parts"][0]["text"]
                         result = parse_json_list(text)
                         if result:
                             final_list = titles.copy()
                             for i, r in enumerate(result[:count]): final_list[i] = r
-                            return final_list
+                            return final_list, m_id
                     else:
                         self.last_error = f"REST {ver}/{m_id} Error {resp.status_code}"
                 except Exception as e:
@@ -224,25 +234,21 @@ class TranslationService:
         except Exception as e:
             self.last_error = f"Global REST Error: {str(e)}"
 
-        return titles
+        return titles, None
 
 
-def get_translated_market_news() -> str:
-    """뉴스 쿼터 (속보2, 거시2, 지수3, 종목3)"""
-    sources = [
-        ("https://feeds.finance.yahoo.com/rss/2.0/headline?s=^GSPC,^IXIC,^DJI,NVDA,TSLA,AAPL,MSFT&region=US&lang=en-US", "Yahoo Finance"),
-        ("https://kr.investing.com/rss/news_25.rss", "Investing.com"), 
-        ("https://kr.investing.com/rss/stock.rss", "Investing.com"),
-        ("https://news.google.com/rss/topics/CAAqJggBCiSJQVVCQzFBUWcyTWpCb1kzbG9hWGIwS2hVcGQzQnliMWRpYXlnQVAB?hl=en-US&gl=US&ceid=US:en", "Google News")
-    ]
-    
-    all_items = []
-    seen = set()
-    for url, src in sources:
-        for item in fetch_rss_news(url, src):
-            if item["title"] not in seen:
-                seen.add(item["title"])
-                all_items.append(item)
+MARKET_NEWS_SOURCES = [
+    ("https://feeds.finance.yahoo.com/rss/2.0/headline?s=^GSPC,^IXIC,^DJI,NVDA,TSLA,AAPL,MSFT&region=US&lang=en-US", "Yahoo Finance"),
+    ("https://kr.investing.com/rss/news_25.rss", "Investing.com"), 
+    ("https://kr.investing.com/rss/stock.rss", "Investing.com"),
+    ("https://news.google.com/rss/topics/CAAqJggBCiSJQVVCQzFBUWcyTWpCb1kzbG9hWGIwS2hVcGQzQnliMWRpYXlnQVAB?hl=en-US&gl=US&ceid=US:en", "Google News")
+]
+
+
+def _select_market_news(feeds: List[List[Dict]]) -> List[Dict]:
+    """뉴스 쿼터 선택 (속보2, 거시2, 지수3, 종목3)"""
+    # 피드 간 유사 기사는 하나로 묶고 (가장 최신 기사 대표), 출처 수를 hotness로 유지
+    all_items = cluster_news([item for feed_items in feeds for item in feed_items])
     
     all_items.sort(key=lambda x: x["hours_ago"])
     
@@ -266,8 +272,16 @@ def get_translated_market_news() -> str:
         final.extend(rem[:10 - len(final)])
     
     final.sort(key=lambda x: x["hours_ago"])
-    final = final[:10]
-    
+    return final[:10]
+
+
+def _resolve_gemini_key() -> Tuple[Optional[str], str, List[str]]:
+    """
+    API 키 탐색 (세션 입력 > Secrets > 환경변수)
+
+    Returns:
+        (api_key, 출처 설명, 감지된 Secrets 키 목록)
+    """
     # --- Professional Translation (Brute-Force Source Control) ---
     api_key = None
     source = "Not Found"
@@ -308,10 +322,102 @@ def get_translated_market_news() -> str:
     if api_key:
         # Final clean
         api_key = str(api_key).strip().replace('"', '').replace("'", "")
-    
-    titles = [n["title"] for n in final]
+    return api_key, source, detected_keys
+
+
+# --- Background translation ---
+# (api_key, titles) -> (Future, 시작 시각). 완료된 작업은 NEWS_TRANSLATION_RETRY_SEC 동안 유지
+# (실패한 번역을 rerun마다 재시도하지 않도록)
+_translation_jobs: Dict[tuple, Tuple[Future, float]] = {}
+# api_key -> 모델 목록 조회 Future (프로세스당 1회)
+_model_discovery: Dict[str, Future] = {}
+_jobs_lock = threading.Lock()
+
+
+def _translation_job(api_key: str, titles: List[str]) -> Tuple[List[str], str]:
     service = TranslationService(api_key)
-    translated = service.translate_headlines(titles)
+    return service.translate_headlines(titles), service.last_error
+
+
+def _translation_future(api_key: str, titles: List[str]) -> Future:
+    """번역 작업 조회 (없으면 공유 스레드 풀에 제출)"""
+    key = (api_key, tuple(titles))
+    now = time.monotonic()
+    with _jobs_lock:
+        for k, (future, started_at) in list(_translation_jobs.items()):
+            if future.done() and now - started_at > NEWS_TRANSLATION_RETRY_SEC:
+                del _translation_jobs[k]
+        job = _translation_jobs.get(key)
+        if job is None:
+            job = (submit_background(_translation_job, api_key, titles), now)
+            _translation_jobs[key] = job
+    return job[0]
+
+
+def get_available_models(api_key: str) -> Optional[List[str]]:
+    """사용 가능한 모델 목록 (프로세스당 1회 백그라운드 조회, 조회 중이면 None)"""
+    with _jobs_lock:
+        future = _model_discovery.get(api_key)
+        if future is None:
+            future = submit_background(TranslationService(api_key).discover_models)
+            _model_discovery[api_key] = future
+    return future.result() if future.done() else None
+
+
+def news_translation_state(feeds: Optional[List[List[Dict]]] = None) -> Dict:
+    """
+    선택된 기사 + 현재까지의 번역 (모델 호출을 기다리지 않음, 필요하면 번역 작업을 시작)
+    "pending": 백그라운드 번역이 아직 진행 중인지
+    """
+    if feeds is None:
+        feeds = [fetch_rss_news(url, src) for url, src in MARKET_NEWS_SOURCES]
+    final = _select_market_news(feeds)
+    api_key, source, detected_keys = _resolve_gemini_key()
+    titles = [n["title"] for n in final]
+
+    translated = titles.copy()
+    hits = translation_cache.get_many(titles, TranslationService.TARGET_LANG, TranslationService.MODELS, record=False)
+    for i, t in hits.items():
+        translated[i] = t
+
+    pending = False
+    last_error = ""
+    if len(hits) < len(titles):
+        if not api_key:
+            last_error = "API Key missing"
+        else:
+            future = _translation_future(api_key, titles)
+            if future.done():
+                try:
+                    translated, last_error = future.result()
+                except Exception as e:
+                    last_error = f"Translation job error: {e}"
+            else:
+                pending = True
+
+    return {
+        "final": final, "titles": titles, "translated": translated, "pending": pending,
+        "api_key": api_key, "source": source, "detected_keys": detected_keys, "last_error": last_error,
+    }
+
+
+def get_translated_market_news(feeds: Optional[List[List[Dict]]] = None, state: Optional[Dict] = None) -> str:
+    """
+    뉴스 쿼터 (속보2, 거시2, 지수3, 종목3)
+
+    번역은 백그라운드에서 진행되며, 완료 전에는 원문(+캐시된 번역)을 바로 반환합니다.
+
+    Args:
+        feeds: MARKET_NEWS_SOURCES 순서의 피드별 기사 목록 (선행 조회 결과). 없으면 직접 조회
+        state: 이미 계산한 news_translation_state 결과 (없으면 계산)
+    """
+    state = state or news_translation_state(feeds)
+    final = state["final"]
+    titles = state["titles"]
+    translated = state["translated"]
+    api_key = state["api_key"]
+    source = state["source"]
+    detected_keys = state["detected_keys"]
     
     # Professional Formatter
     lines = ["### 📰 시장 뉴스 (실시간)", ""]
@@ -325,20 +431,27 @@ def get_translated_market_news() -> str:
     success_count = sum(1 for i, t in enumerate(translated) if t != titles[i])
     
     # Clean UI: Use expander for logs if anything is less than perfect
-    if success_count < len(titles) or source != "Streamlit Secrets":
+    if not state["pending"] and (success_count < len(titles) or source != "Streamlit Secrets"):
         with st.expander("🛠️ 시스템 진단 로그 (번역 문제 발생 시 확인)", expanded=(success_count == 0)):
             st.write(f"**Diagnostic**: {source}")
             st.write(f"**Secrets Detection**: `{detected_keys if detected_keys else 'None'}`")
+            cache_stats = translation_cache.stats()
+            st.write(
+                f"**Translation Cache**: 적중률 {cache_stats['hit_rate']:.0%} "
+                f"({cache_stats['hits']} hit / {cache_stats['misses']} miss, {cache_stats['size']}개 저장)"
+            )
             if api_key:
                 st.write(f"**Key Check**: `{api_key[:5]}...{api_key[-5:]}`")
-                st.write(f"**Last Error**: `{service.last_error if service.last_error else 'None'}`")
-                models = service.discover_models()
+                st.write(f"**Last Error**: `{state['last_error'] if state['last_error'] else 'None'}`")
+                models = get_available_models(api_key)
                 if models: st.write(f"**Available Models**: `{', '.join(models[:5])}...`")
             else:
                 st.error("🚨 유효한 API 키가 없습니다. .env 또는 Secrets를 확인해 주세요.")
     
     if success_count == len(titles):
         lines.append(f"> ✅ **뉴스 번역 완료** (Gemini 2.0)")
+    elif state["pending"]:
+        lines.append(f"> 🔄 **번역 중**: 원문을 먼저 표시합니다 ({success_count}/{len(titles)} 항목 완료)")
     elif success_count > 0:
         lines.append(f"> 🔄 **번역 상태**: {success_count}/{len(titles)} 항목 완료")
     else:
@@ -351,8 +464,10 @@ def get_translated_market_news() -> str:
         is_translated = (t != item["title"])
         badge = "🔥" if i < 2 and item["hours_ago"] < 3 else "📢"
         trans_badge = " 🤖" if is_translated else ""
+        # 같은 기사를 다룬 매체 수 (2곳 이상일 때만 표시)
+        hot_badge = f" 📡{item['hotness']}" if item.get("hotness", 1) > 1 else ""
         
-        lines.append(f"**{badge} [{item['time']}] {item['source']}**{trans_badge} [🔗]({item['link']})  \n&nbsp;&nbsp;&nbsp;&nbsp;{t}\n")
+        lines.append(f"**{badge} [{item['time']}] {item['source']}{hot_badge}**{trans_badge} [🔗]({item['link']})  \n&nbsp;&nbsp;&nbsp;&nbsp;{t}\n")
         
     return "\n".join(lines)
 
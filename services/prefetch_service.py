@@ -0,0 +1,67 @@
+"""
+Prefetch Service - Concurrent fan-out for the dashboard page load
+스크립트 상단에서 독립적인 fetcher들을 스레드 풀로 동시에 시작하고,
+각 탭은 future 결과를 받아 사용합니다. Cold render 시간 = 가장 느린 source 하나.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor, Future, TimeoutError as FutureTimeout
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from config.settings import PREFETCH_DEADLINES, PREFETCH_MAX_WORKERS
+
+# 프로세스 전체에서 공유 (Streamlit 세션마다 풀을 새로 만들지 않음)
+_executor = ThreadPoolExecutor(max_workers=PREFETCH_MAX_WORKERS, thread_name_prefix="prefetch")
+
+
+def submit_background(fn: Callable, *args, **kwargs) -> Future:
+    """공유 스레드 풀에 작업 제출"""
+    return _executor.submit(fn, *args, **kwargs)
+
+
+class Prefetch:
+    """
+    한 번의 렌더(rerun) 동안 사용할 선행 조회 묶음
+
+    submit()으로 시작한 작업은 get()에서 같은 함수/인자로 조회하면 결과를 기다리고,
+    제출되지 않은 조합이면 그 자리에서 직접 호출합니다.
+    기한(deadline)은 제출 시점부터 계산하며, 초과 시 default를 반환합니다.
+    기한을 넘긴 작업도 계속 실행되어 캐시를 채우므로 다음 rerun에서 바로 사용됩니다.
+    """
+
+    def __init__(self):
+        self._jobs: Dict[Hashable, Tuple[Future, float, str, Any]] = {}
+
+    @staticmethod
+    def _key(fn: Callable, args: tuple, kwargs: dict) -> Hashable:
+        return (fn, args, tuple(sorted(kwargs.items())))
+
+    def submit(self, source: str, fn: Callable, *args, default: Any = None, **kwargs) -> Future:
+        """
+        Args:
+            source: PREFETCH_DEADLINES 키 (기한 및 로그 구분용)
+            fn: 실행할 fetcher
+            default: 기한 초과/예외 시 반환할 값
+        """
+        key = self._key(fn, args, kwargs)
+        if key in self._jobs:
+            return self._jobs[key][0]
+        deadline_at = time.monotonic() + PREFETCH_DEADLINES.get(source, 10)
+        future = _executor.submit(fn, *args, **kwargs)
+        self._jobs[key] = (future, deadline_at, source, default)
+        return future
+
+    def get(self, fn: Callable, *args, **kwargs) -> Any:
+        """선행 조회 결과 반환 (미제출 시 직접 호출)"""
+        job = self._jobs.get(self._key(fn, args, kwargs))
+        if job is None:
+            return fn(*args, **kwargs)
+
+        future, deadline_at, source, default = job
+        try:
+            return future.result(timeout=max(0.0, deadline_at - time.monotonic()))
+        except FutureTimeout:
+            print(f"Prefetch deadline exceeded ({source}): {getattr(fn, '__name__', fn)}{args}")
+            return default
+        except Exception as e:
+            print(f"Prefetch failed ({source}): {e}")
+            return default
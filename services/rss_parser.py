@@ -0,0 +1,129 @@
+"""
+RSS Parser - Streaming RSS 2.0 / Atom parser
+xml.etree.XMLPullParser로 받은 청크를 바로 파싱하고, 처리한 item/entry는 즉시 해제합니다.
+- N개 항목을 얻으면 나머지 문서는 읽지 않음 (피드는 최신순)
+- pubDate(RFC 822)와 Atom 날짜(ISO 8601)의 타임존을 반영해 epoch(UTC)로 변환
+"""
+import html
+import re
+from html.entities import name2codepoint
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+from xml.etree.ElementTree import ParseError, XMLPullParser
+
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_TAGS = re.compile(r'<[^>]+>')
+_ENTITY = re.compile(rb'&(?!(?:amp|lt|gt|quot|apos);)([A-Za-z][A-Za-z0-9]{1,31});')
+_PARTIAL_ENTITY = re.compile(rb'&[A-Za-z0-9]{0,31}$')
+
+
+def parse_date(value: Optional[str]) -> Optional[float]:
+    """RFC 822 (RSS pubDate) / ISO 8601 (Atom) 날짜 -> epoch 초. 타임존 없으면 UTC로 간주"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _text(elem, tag: str) -> str:
+    child = elem.find(tag)
+    return (child.text or "").strip() if child is not None else ""
+
+
+def _clean_title(raw: str) -> str:
+    # XML 엔티티는 파서가 처리, 이중 이스케이프된 HTML 엔티티/태그만 정리
+    return _TAGS.sub('', html.unescape(raw)).strip()
+
+
+def _rss_item(elem) -> Dict:
+    return {
+        "guid": _text(elem, "guid"),
+        "title": _clean_title(_text(elem, "title")),
+        "link": _text(elem, "link"),
+        "published": parse_date(_text(elem, "pubDate")),
+    }
+
+
+def _atom_entry(elem) -> Dict:
+    link = ""
+    for l in elem.iter(f"{ATOM_NS}link"):
+        if l.get("rel", "alternate") == "alternate":
+            link = l.get("href", "")
+            break
+    return {
+        "guid": _text(elem, f"{ATOM_NS}id"),
+        "title": _clean_title(_text(elem, f"{ATOM_NS}title")),
+        "link": link,
+        "published": parse_date(_text(elem, f"{ATOM_NS}published") or _text(elem, f"{ATOM_NS}updated")),
+    }
+
+
+def _entity_ref(m) -> bytes:
+    codepoint = name2codepoint.get(m.group(1).decode("ascii"))
+    return f"&#{codepoint};".encode("ascii") if codepoint else b""
+
+
+def _xml_safe(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    HTML 전용 엔티티(&nbsp; 등)를 숫자 참조로 변환 (XML 파서는 미정의 엔티티에서 중단됨)
+    청크 끝에 걸린 엔티티는 다음 청크와 합쳐서 처리합니다.
+    """
+    tail = b""
+    for chunk in chunks:
+        chunk = tail + chunk
+        m = _PARTIAL_ENTITY.search(chunk)
+        chunk, tail = (chunk[:m.start()], chunk[m.start():]) if m else (chunk, b"")
+        yield _ENTITY.sub(_entity_ref, chunk)
+    if tail:
+        yield _ENTITY.sub(_entity_ref, tail)
+
+
+def iter_feed_items(chunks: Iterable[bytes], limit: Optional[int] = None) -> Iterator[Dict]:
+    """
+    바이트 청크 스트림에서 항목을 하나씩 파싱
+
+    Args:
+        chunks: response.iter_content() 등 바이트 청크
+        limit: 최대 항목 수 (도달 시 나머지 청크는 읽지 않음)
+
+    Yields:
+        {"guid", "title", "link", "published"(epoch 또는 None)}
+        문서 중간에 XML 오류가 있으면 그 전까지의 항목만 반환합니다.
+    """
+    parser = XMLPullParser(events=("end",))
+    count = 0
+    try:
+        for chunk in _xml_safe(chunks):
+            parser.feed(chunk)
+            for _, elem in parser.read_events():
+                if elem.tag == "item":
+                    item = _rss_item(elem)
+                elif elem.tag == f"{ATOM_NS}entry":
+                    item = _atom_entry(elem)
+                else:
+                    continue
+                elem.clear()
+                yield item
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+    except ParseError as e:
+        print(f"RSS parse error after {count} items: {e}")
+
+
+def parse_feed(data: Union[bytes, str], limit: Optional[int] = None, chunk_size: int = 65536) -> List[Dict]:
+    """문서 전체(bytes/str)를 청크 단위로 파싱"""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    chunks = (data[i:i + chunk_size] for i in range(0, len(data), chunk_size))
+    return list(iter_feed_items(chunks, limit))
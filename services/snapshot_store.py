@@ -0,0 +1,212 @@
+"""
+Snapshot Store - Append-only market snapshot history (typed SQLite)
+매 호출마다 CSV를 열고 닫는 대신 메모리 버퍼에 모았다가 한 트랜잭션으로 기록합니다.
+- 타입 지정 테이블 (STRICT), 시각(µs)이 rowid -> 시간 범위 조회가 인덱스 범위 스캔
+- 버퍼 flush: SNAPSHOT_FLUSH_ROWS 행 또는 SNAPSHOT_FLUSH_SEC 경과 시, 조회 전, 프로세스 종료 시
+- 다운샘플 조회: 구간 평균/최소/최대를 SQL GROUP BY로 계산 (예: 30일 김프 1분 평균)
+- 기존 market_history.csv는 DB 최초 생성 시 1회 가져오기 (import_csv)
+"""
+import atexit
+import csv
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, astuple
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from config.settings import HISTORY_PATH, SNAPSHOT_DB_PATH, SNAPSHOT_FLUSH_ROWS, SNAPSHOT_FLUSH_SEC
+
+SNAPSHOT_FIELDS = ("btc_global", "btc_krw", "kimchi_premium", "usd_krw", "fear_greed")
+AGGREGATES = ("avg", "min", "max", "count")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS market_snapshots (
+    ts INTEGER PRIMARY KEY,
+    btc_global REAL,
+    btc_krw REAL,
+    kimchi_premium REAL,
+    usd_krw REAL,
+    fear_greed INTEGER
+) STRICT
+"""
+
+Columns = Dict[str, list]
+
+
+@dataclass
+class MarketSnapshot:
+    """시장 스냅샷 한 행"""
+    timestamp: datetime
+    btc_global: Optional[float] = None
+    btc_krw: Optional[float] = None
+    kimchi_premium: Optional[float] = None
+    usd_krw: Optional[float] = None
+    fear_greed: Optional[int] = None
+
+
+def _to_us(dt: datetime) -> int:
+    return int(dt.timestamp() * 1_000_000)
+
+
+def _from_us(ts: int) -> str:
+    return datetime.fromtimestamp(ts / 1_000_000).isoformat(timespec="seconds")
+
+
+def _float_or_none(value: str) -> Optional[float]:
+    return float(value) if value not in ("", None) else None
+
+
+class SnapshotStore:
+    """버퍼링 + 배치 기록 스냅샷 저장소 (스레드 안전)"""
+
+    def __init__(
+        self,
+        path: Path = SNAPSHOT_DB_PATH,
+        legacy_csv: Optional[Path] = HISTORY_PATH,
+        flush_rows: int = SNAPSHOT_FLUSH_ROWS,
+        flush_sec: float = SNAPSHOT_FLUSH_SEC,
+    ):
+        self.path = Path(path)
+        self.legacy_csv = legacy_csv
+        self.flush_rows = flush_rows
+        self.flush_sec = flush_sec
+        self._buffer: List[tuple] = []
+        self._buffer_since = 0.0
+        self._last_values: Optional[tuple] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    # --- Connection ---
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            created = not self.path.exists()
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            conn.commit()
+            self._conn = conn
+            if created and self.legacy_csv and Path(self.legacy_csv).exists():
+                count = self.import_csv(self.legacy_csv)
+                print(f"Snapshot store: imported {count} rows from {Path(self.legacy_csv).name}")
+        return self._conn
+
+    # --- Write ---
+    def append(self, snapshot: MarketSnapshot) -> None:
+        """스냅샷 추가 (직전과 값이 같으면 건너뜀 - 캐시된 시세로 rerun이 반복되는 경우)"""
+        values = astuple(snapshot)[1:]
+        with self._lock:
+            if values == self._last_values:
+                return
+            self._last_values = values
+            if not self._buffer:
+                self._buffer_since = time.monotonic()
+            self._buffer.append((_to_us(snapshot.timestamp),) + values)
+            if len(self._buffer) >= self.flush_rows or time.monotonic() - self._buffer_since >= self.flush_sec:
+                self.flush()
+
+    def flush(self) -> int:
+        """버퍼의 행을 한 트랜잭션으로 기록"""
+        with self._lock:
+            if not self._buffer:
+                return 0
+            rows, self._buffer = self._buffer, []
+            conn = self._db()
+            with conn:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO market_snapshots (ts, {', '.join(SNAPSHOT_FIELDS)}) "
+                    f"VALUES ({', '.join('?' * (len(SNAPSHOT_FIELDS) + 1))})",
+                    rows,
+                )
+            return len(rows)
+
+    def import_csv(self, path: Path) -> int:
+        """기존 market_history.csv 가져오기 (같은 시각의 행은 덮어씀)"""
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            next(reader, None)  # header
+            rows = []
+            for row in reader:
+                if len(row) < 5:
+                    continue
+                try:
+                    ts = _to_us(datetime.fromisoformat(row[0]))
+                    values = [_float_or_none(v) for v in row[1:5]]
+                    fear_greed = row[5] if len(row) > 5 and row[5] != "" else None
+                    rows.append((ts, *values, int(float(fear_greed)) if fear_greed is not None else None))
+                except ValueError:
+                    continue
+        with self._lock:
+            self._buffer.extend(rows)
+            return self.flush()
+
+    # --- Read ---
+    @staticmethod
+    def _range(start: Optional[datetime], end: Optional[datetime]):
+        return (_to_us(start) if start else 0, _to_us(end) if end else 2 ** 62)
+
+    def scan(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        fields: Sequence[str] = SNAPSHOT_FIELDS,
+    ) -> Columns:
+        """[start, end) 구간 원본 행 (columnar: {"time": [...], field: [...]})"""
+        fields = [f for f in fields if f in SNAPSHOT_FIELDS]
+        with self._lock:
+            self.flush()
+            rows = self._db().execute(
+                f"SELECT ts{''.join(', ' + f for f in fields)} FROM market_snapshots "
+                "WHERE ts >= ? AND ts < ? ORDER BY ts",
+                self._range(start, end),
+            ).fetchall()
+        columns = list(zip(*rows)) if rows else [()] * (len(fields) + 1)
+        result = {"time": [_from_us(ts) for ts in columns[0]]}
+        result.update({f: list(values) for f, values in zip(fields, columns[1:])})
+        return result
+
+    def resample(
+        self,
+        field: str,
+        bucket_sec: int = 60,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        agg: str = "avg",
+    ) -> Columns:
+        """
+        구간 집계 조회 ({"time": 구간 시작, "value": 집계값})
+
+        Args:
+            field: SNAPSHOT_FIELDS 중 하나
+            bucket_sec: 구간 길이 (초)
+            agg: avg / min / max / count
+        """
+        if field not in SNAPSHOT_FIELDS or agg not in AGGREGATES:
+            raise ValueError(f"unsupported field/agg: {field}/{agg}")
+        bucket = int(bucket_sec * 1_000_000)
+        with self._lock:
+            self.flush()
+            rows = self._db().execute(
+                f"SELECT (ts / ?) * ? AS bucket, {agg}({field}) FROM market_snapshots "
+                f"WHERE ts >= ? AND ts < ? AND {field} IS NOT NULL GROUP BY bucket ORDER BY bucket",
+                (bucket, bucket, *self._range(start, end)),
+            ).fetchall()
+        return {"time": [_from_us(ts) for ts, _ in rows], "value": [v for _, v in rows]}
+
+    def stats(self) -> dict:
+        with self._lock:
+            count, first, last = self._db().execute(
+                "SELECT COUNT(*), MIN(ts), MAX(ts) FROM market_snapshots"
+            ).fetchone()
+            return {
+                "rows": count,
+                "buffered": len(self._buffer),
+                "first": _from_us(first) if first else None,
+                "last": _from_us(last) if last else None,
+            }
+
+
+snapshot_store = SnapshotStore()
+atexit.register(snapshot_store.flush)
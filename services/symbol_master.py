@@ -0,0 +1,251 @@
+"""
+Symbol Master - KRX(KOSPI/KOSDAQ) 전 종목 목록과 접두어 검색 색인
+종목명/Yahoo 접미사(.KS/.KQ)를 하드코딩된 dict 대신 상장 목록에서 조회합니다.
+- FDR StockListing("KRX") (+ "KRX-DESC" 업종)을 data/krx_symbols.csv로 캐시, 하루 지나면 백그라운드 갱신
+- 캐시 파일이 없으면 KR_STOCK_INFO로 시작하고 백그라운드에서 목록을 받아옴 (화면은 막지 않음)
+- 접두어 색인: (키, 종목) 정렬 배열 + bisect -> 코드/한글명/영문명 접두어 검색 O(log n + k)
+  종목명은 접미사(2글자 이상)도 키로 넣어 "하이닉스" -> SK하이닉스 처럼 중간부터 입력해도 검색
+- 검색 결과 순서: 코드/이름 완전 일치 -> 접두어 일치 -> 중간 일치, 같은 단계는 시가총액 순
+"""
+import csv
+import os
+import re
+import tempfile
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from config.settings import SYMBOL_MASTER_PATH, SYMBOL_MASTER_REFRESH_SEC
+from shared.market_universe import KR_STOCK_INFO
+
+FIELDS = ("code", "name", "market", "sector", "marcap", "name_en")
+_SPACE_RE = re.compile(r"\s+")
+
+
+@dataclass
+class KrSymbol:
+    """KRX 상장 종목"""
+    code: str
+    name: str
+    market: str
+    sector: str = ""
+    marcap: float = 0.0
+    name_en: str = ""
+
+    @property
+    def yahoo(self) -> str:
+        """Yahoo Finance 심볼 (코스닥 .KQ, 그 외 .KS)"""
+        return f"{self.code}.KQ" if self.market.upper().startswith("KOSDAQ") else f"{self.code}.KS"
+
+
+def clean_code(ticker: str) -> str:
+    """'KRX:005930', '005930.KS' -> '005930'"""
+    return ticker.split(":")[-1].replace(".KS", "").replace(".KQ", "").strip().upper()
+
+
+def _norm(text: str) -> str:
+    return _SPACE_RE.sub("", text).lower()
+
+
+def _fetch_listing() -> List[KrSymbol]:
+    """FDR로 KRX 전 종목 목록 조회 (업종은 KRX-DESC에서 보강)"""
+    import FinanceDataReader as fdr
+
+    df = fdr.StockListing("KRX")
+    sectors: Dict[str, str] = {}
+    try:
+        desc = fdr.StockListing("KRX-DESC")
+        sectors = dict(zip(desc["Code"].astype(str), desc["Sector"].fillna("").astype(str)))
+    except Exception as e:
+        print(f"Symbol master: sector listing unavailable ({e})")
+
+    marcaps = df["Marcap"] if "Marcap" in df else [0] * len(df)
+    names_en = df["NameEng"] if "NameEng" in df else [""] * len(df)
+    symbols = []
+    for code, name, market, marcap, name_en in zip(df["Code"], df["Name"], df["Market"], marcaps, names_en):
+        code = str(code).zfill(6)
+        symbols.append(KrSymbol(
+            code=code,
+            name=str(name),
+            market=str(market),
+            sector=sectors.get(code, ""),
+            marcap=float(marcap or 0),
+            name_en=str(name_en or ""),
+        ))
+    return symbols
+
+
+class SymbolMaster:
+    """KRX 종목 마스터 + 접두어 색인 (스레드 안전, 일 단위 백그라운드 갱신)"""
+
+    def __init__(self, path=SYMBOL_MASTER_PATH, refresh_sec: float = SYMBOL_MASTER_REFRESH_SEC):
+        self.path = path
+        self.refresh_sec = refresh_sec
+        self._by_code: Dict[str, KrSymbol] = {}
+        # 접두어 색인 2개: 코드/전체 이름, 이름 접미사 (각각 (키 정렬 배열, 종목 순위 배열))
+        self._names: Tuple[List[str], List[int]] = ([], [])
+        self._suffixes: Tuple[List[str], List[int]] = ([], [])
+        self._symbols: List[KrSymbol] = []
+        self._loaded = False
+        self._refreshing = False
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+
+    # --- Index ---
+    def _build(self, symbols: List[KrSymbol]) -> None:
+        symbols = sorted(symbols, key=lambda s: -s.marcap)  # 색인 번호 = 시가총액 순위
+        names, suffixes = [], []
+        for i, s in enumerate(symbols):
+            keys = {s.code}
+            for name in (_norm(s.name), _norm(s.name_en)):
+                if name:
+                    keys.add(name)
+                    suffixes.extend((name[j:], i) for j in range(1, len(name) - 1))
+            names.extend((key, i) for key in keys)
+        names.sort()
+        suffixes = sorted(set(suffixes))
+        with self._lock:
+            self._symbols = symbols
+            self._by_code = {s.code: s for s in symbols}
+            self._names = ([key for key, _ in names], [i for _, i in names])
+            self._suffixes = ([key for key, _ in suffixes], [i for _, i in suffixes])
+
+    # --- Load / refresh ---
+    def _read_cache(self) -> Optional[List[KrSymbol]]:
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, newline="", encoding="utf-8") as f:
+                return [
+                    KrSymbol(row["code"], row["name"], row["market"], row.get("sector") or "",
+                             float(row.get("marcap") or 0), row.get("name_en") or "")
+                    for row in csv.DictReader(f)
+                ]
+        except (OSError, KeyError, ValueError) as e:
+            print(f"Symbol master cache error: {e}")
+            return None
+
+    def _write_cache(self, symbols: List[KrSymbol]) -> None:
+        directory = os.path.dirname(self.path)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".krx_symbols.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(FIELDS)
+                writer.writerows([s.code, s.name, s.market, s.sector, s.marcap, s.name_en] for s in symbols)
+            os.replace(tmp, self.path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def _seed(self) -> List[KrSymbol]:
+        return [
+            KrSymbol(code, name, "KOSDAQ" if yahoo.endswith(".KQ") else "KOSPI", marcap=-rank)
+            for rank, (code, (yahoo, name)) in enumerate(KR_STOCK_INFO.items())
+        ]
+
+    def refresh(self) -> bool:
+        """상장 목록을 다시 받아 캐시 파일과 색인 갱신"""
+        try:
+            symbols = _fetch_listing()
+            if not symbols:
+                return False
+            self._write_cache(symbols)
+            self._build(symbols)
+            print(f"Symbol master refreshed: {len(symbols)} symbols")
+            return True
+        except Exception as e:
+            print(f"Symbol master refresh failed: {e}")
+            return False
+        finally:
+            self._refreshing = False
+
+    def _refresh_in_background(self) -> None:
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        from services.prefetch_service import submit_background
+
+        submit_background(self.refresh)
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            with self._load_lock:
+                if not self._loaded:
+                    symbols = self._read_cache()
+                    self._build(symbols or self._seed())
+                    self._loaded = True
+        # 캐시 파일 나이 확인은 10분에 한 번 (장시간 실행 중 일 단위 갱신)
+        now = time.monotonic()
+        if now - self._checked_at < 600:
+            return
+        self._checked_at = now
+        try:
+            age = time.time() - os.path.getmtime(self.path)
+        except OSError:
+            age = float("inf")
+        if age > self.refresh_sec:
+            self._refresh_in_background()
+
+    # --- Query ---
+    def lookup(self, ticker: str) -> Optional[KrSymbol]:
+        """종목코드로 조회 ('KRX:' 접두사 / .KS .KQ 접미사 허용)"""
+        self._ensure_loaded()
+        return self._by_code.get(clean_code(ticker))
+
+    def search(self, query: str, limit: int = 10) -> List[KrSymbol]:
+        """
+        코드/종목명 접두어 검색 (대소문자/공백 무시)
+
+        정확히 일치하는 코드나 이름이 먼저, 나머지는 시가총액 순입니다.
+        """
+        self._ensure_loaded()
+        prefix = _norm(query.split(":")[-1])
+        if not prefix:
+            return []
+        with self._lock:
+            (name_keys, name_refs), (suffix_keys, suffix_refs) = self._names, self._suffixes
+            symbols = self._symbols
+        upper = prefix + "\U0010ffff"
+        start = bisect_left(name_keys, prefix)
+        exact_end = bisect_right(name_keys, prefix, start)
+        end = bisect_left(name_keys, upper, exact_end)
+        s_start = bisect_left(suffix_keys, prefix)
+        s_end = bisect_left(suffix_keys, upper, s_start)
+
+        ranked: List[int] = []
+        seen = set()
+        # 단계별 후보 (색인 번호 = 시가총액 순위이므로 작은 번호부터)
+        for candidates in (name_refs[start:exact_end], name_refs[exact_end:end], suffix_refs[s_start:s_end]):
+            for i in sorted(set(candidates))[:limit + len(seen)]:
+                if i not in seen:
+                    seen.add(i)
+                    ranked.append(i)
+            if len(ranked) >= limit:
+                break
+        return [symbols[i] for i in ranked[:limit]]
+
+    def size(self) -> int:
+        self._ensure_loaded()
+        return len(self._symbols)
+
+
+symbol_master = SymbolMaster()
+
+
+def resolve_kr_code(text: str) -> str:
+    """
+    입력(코드 또는 종목명)을 종목코드로 변환
+
+    알려진 코드면 그대로, 아니면 검색 1순위 종목의 코드, 결과가 없으면 입력 그대로 반환합니다.
+    """
+    code = clean_code(text)
+    if symbol_master.lookup(code):
+        return code
+    matches = symbol_master.search(text, limit=1)
+    return matches[0].code if matches else code
@@ -0,0 +1,109 @@
+"""
+Translation Cache - Content-addressed, persistent headline translation cache
+키: sha1(정규화된 헤드라인 | 대상 언어 | 모델)
+- data/translation_cache.json 에 LRU 순서로 저장 (원자적 쓰기)
+- TRANSLATION_CACHE_MAX_ENTRIES 초과 시 가장 오래 사용되지 않은 항목부터 제거
+"""
+import hashlib
+import json
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+from config.settings import TRANSLATION_CACHE_PATH, TRANSLATION_CACHE_MAX_ENTRIES
+from services.data_service import write_json_atomic
+
+
+def normalize_headline(text: str) -> str:
+    """유니코드 정규화(NFKC) + 공백 정리"""
+    return re.sub(r'\s+', ' ', unicodedata.normalize("NFKC", text)).strip()
+
+
+def cache_key(headline: str, lang: str, model: str) -> str:
+    raw = f"{normalize_headline(headline)}|{lang}|{model}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class TranslationCache:
+    """디스크 기반 LRU 번역 캐시 (프로세스 내 스레드 안전)"""
+
+    def __init__(self, path: Path = TRANSLATION_CACHE_PATH, max_entries: int = TRANSLATION_CACHE_MAX_ENTRIES):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: Optional[OrderedDict] = None
+        self._dirty = False
+
+    def _load(self) -> OrderedDict:
+        if self._entries is None:
+            try:
+                self._entries = OrderedDict(json.loads(self.path.read_text(encoding="utf-8")))
+            except (OSError, ValueError):
+                self._entries = OrderedDict()
+        return self._entries
+
+    def get_many(self, headlines: Sequence[str], lang: str, models: Sequence[str], record: bool = True) -> Dict[int, str]:
+        """
+        캐시된 번역 조회
+
+        Args:
+            models: 허용할 모델 (앞쪽 우선)
+            record: False면 적중률 통계에 반영하지 않음 (화면 갱신용 조회)
+
+        Returns:
+            {headlines 인덱스: 번역} (적중한 항목만)
+        """
+        found = {}
+        with self._lock:
+            entries = self._load()
+            for i, headline in enumerate(headlines):
+                for model in models:
+                    key = cache_key(headline, lang, model)
+                    if key in entries:
+                        entries.move_to_end(key)
+                        found[i] = entries[key]
+                        self._dirty = True
+                        break
+            if record:
+                self.hits += len(found)
+                self.misses += len(headlines) - len(found)
+        return found
+
+    def put_many(self, pairs: Sequence[tuple], lang: str, model: str) -> None:
+        """(원문, 번역) 쌍 저장 후 디스크 반영"""
+        with self._lock:
+            entries = self._load()
+            for headline, translation in pairs:
+                key = cache_key(headline, lang, model)
+                entries[key] = translation
+                entries.move_to_end(key)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+            self._dirty = True
+        self.save()
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            write_json_atomic(self.path, list(self._entries.items()))
+            self._dirty = False
+
+    def stats(self) -> Dict[str, float]:
+        total = self.hits + self.misses
+        with self._lock:
+            size = len(self._load())
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": size,
+        }
+
+
+translation_cache = TranslationCache()
@@ -0,0 +1,185 @@
+"""
+Watchlist Service - In-memory watchlists with write-behind persistence
+미국/한국 즐겨찾기 및 이름 있는 관심 목록을 한 곳에서 관리합니다.
+- 메모리의 순서 있는 집합 (dict) -> 조회/포함 여부 O(1), rerun마다 json.load 하지 않음
+- 파일 변경 감지: stat (mtime_ns, size, inode)이 바뀐 경우에만 다시 읽음 (다른 세션/백엔드 프로세스)
+- 쓰기 지연 (write-behind): 변경은 즉시 메모리에 반영, WATCHLIST_FLUSH_SEC 뒤 원자적 저장
+- 저장 시 파일 잠금(fcntl) 안에서 최신 파일을 다시 읽고 대기 중인 add/remove 연산을 그 위에 적용
+  -> 여러 세션/프로세스가 동시에 수정해도 서로의 변경을 덮어쓰지 않음
+"""
+import atexit
+import os
+import re
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config.settings import DATA_DIR, WATCHLIST_FLUSH_SEC
+from services.data_service import write_json_atomic
+from shared.market_universe import read_watchlist
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 잠금 없이 동작 (원자적 교체는 유지)
+    fcntl = None
+
+_NAME_RE = re.compile(r"^[a-z0-9_-]+$")
+
+Op = Tuple[str, object]  # ("add", ticker) / ("remove", ticker) / ("replace", [tickers])
+
+
+def _apply(base: Dict[str, None], ops: Iterable[Op]) -> Dict[str, None]:
+    items = dict(base)
+    for op, value in ops:
+        if op == "add":
+            items.setdefault(value, None)
+        elif op == "remove":
+            items.pop(value, None)
+        elif op == "replace":
+            items = dict.fromkeys(value)
+    return items
+
+
+@contextmanager
+def _file_lock(path: Path):
+    """프로세스 간 배타 잠금 (fcntl 미지원 환경에서는 no-op)"""
+    if fcntl is None:
+        yield
+        return
+    with open(path, "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class Watchlist:
+    """단일 관심 목록 (스레드 안전)"""
+
+    def __init__(self, name: str, path: Path, default: Optional[List[str]] = None,
+                 flush_sec: float = WATCHLIST_FLUSH_SEC):
+        self.name = name
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self.default = list(default or [])
+        self.flush_sec = flush_sec
+        self._base: Dict[str, None] = {}
+        self._pending: List[Op] = []
+        self._items: Dict[str, None] = {}
+        self._signature = None
+        self._loaded = False
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
+
+    # --- File ---
+    def _stat(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _read(self) -> Dict[str, None]:
+        return dict.fromkeys(read_watchlist(self.path, self.default))
+
+    def _refresh(self) -> None:
+        """파일이 바뀐 경우에만 다시 읽고 대기 중인 연산을 재적용"""
+        signature = self._stat()
+        if not self._loaded or signature != self._signature:
+            self._base = self._read()
+            self._signature = signature
+            self._loaded = True
+            self._items = _apply(self._base, self._pending)
+
+    # --- Read ---
+    def items(self) -> List[str]:
+        with self._lock:
+            self._refresh()
+            return list(self._items)
+
+    def __contains__(self, ticker: str) -> bool:
+        with self._lock:
+            self._refresh()
+            return ticker in self._items
+
+    # --- Write ---
+    def _record(self, op: str, value) -> List[str]:
+        with self._lock:
+            self._refresh()
+            before = self._items
+            self._items = _apply(before, [(op, value)])
+            if list(self._items) != list(before):
+                self._pending.append((op, value))
+                self._schedule_flush()
+            return list(self._items)
+
+    def add(self, ticker: str) -> List[str]:
+        return self._record("add", ticker)
+
+    def remove(self, ticker: str) -> List[str]:
+        return self._record("remove", ticker)
+
+    def replace(self, tickers: List[str]) -> List[str]:
+        return self._record("replace", list(dict.fromkeys(tickers)))
+
+    def _schedule_flush(self) -> None:
+        if self._timer is None:
+            self._timer = threading.Timer(self.flush_sec, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        """대기 중인 연산을 최신 파일 위에 적용해 원자적으로 저장"""
+        with self._lock:
+            self._timer = None
+            if not self._pending:
+                return
+            with _file_lock(self.lock_path):
+                base = self._read()
+                items = _apply(base, self._pending)
+                write_json_atomic(self.path, {"favorites": list(items)}, indent=2)
+                self._base, self._items, self._pending = items, dict(items), []
+                self._signature = self._stat()
+
+
+_watchlists: Dict[str, Watchlist] = {}
+_registry_lock = threading.Lock()
+
+
+def get_watchlist(name: str, path: Optional[Path] = None, default: Optional[List[str]] = None) -> Watchlist:
+    """
+    이름으로 관심 목록 조회 (없으면 생성)
+
+    Args:
+        name: 목록 이름 (영문 소문자/숫자/_/-)
+        path: 저장 파일 (생략 시 data/watchlist_<name>.json)
+        default: 파일이 없을 때의 초기 목록
+    """
+    if not _NAME_RE.match(name):
+        raise ValueError(f"invalid watchlist name: {name!r}")
+    with _registry_lock:
+        watchlist = _watchlists.get(name)
+        if watchlist is None:
+            watchlist = Watchlist(name, path or DATA_DIR / f"watchlist_{name}.json", default)
+            _watchlists[name] = watchlist
+        return watchlist
+
+
+def list_watchlists() -> List[str]:
+    """저장된 관심 목록 이름 (data/watchlist_*.json + 등록된 목록)"""
+    names = {p.stem[len("watchlist_"):] for p in DATA_DIR.glob("watchlist_*.json")}
+    with _registry_lock:
+        names.update(_watchlists)
+    return sorted(names)
+
+
+def flush_all() -> None:
+    with _registry_lock:
+        watchlists = list(_watchlists.values())
+    for watchlist in watchlists:
+        watchlist.flush()
+
+
+atexit.register(flush_all)
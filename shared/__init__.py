@@ -0,0 +1 @@
+# Code shared by the Streamlit app and backend_fastapi (must not import streamlit, services or config)
@@ -0,0 +1,64 @@
+"""
+Market Universe - 주요 한국 종목, KRX 장 시간, 즐겨찾기 파일 읽기
+Streamlit 앱과 백엔드 스케줄러가 함께 사용합니다 (프론트엔드 패키지 의존 없음).
+"""
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List, Optional, Union
+
+KST = timezone(timedelta(hours=9))
+KRX_OPEN = (9, 0)
+KRX_CLOSE = (15, 30)
+
+# 종목코드 -> Yahoo Finance 심볼 변환 (한국주식은 .KS 또는 .KQ 접미사)
+# 전 종목은 services/symbol_master.py, 이 목록은 주요 종목(스케줄러 대상)과 오프라인 초기값
+KR_STOCK_INFO = {
+    "005930": ("005930.KS", "삼성전자"),
+    "000660": ("000660.KS", "SK하이닉스"),
+    "373220": ("373220.KS", "LG에너지솔루션"),
+    "005380": ("005380.KS", "현대차"),
+    "035420": ("035420.KS", "NAVER"),
+    "051910": ("051910.KS", "LG화학"),
+    "006400": ("006400.KS", "삼성SDI"),
+    "035720": ("035720.KS", "카카오"),
+    "003670": ("003670.KS", "포스코퓨처엠"),
+    "068270": ("068270.KS", "셀트리온"),
+    "005490": ("005490.KS", "POSCO홀딩스"),
+    "028260": ("028260.KS", "삼성물산"),
+    "105560": ("105560.KS", "KB금융"),
+    "055550": ("055550.KS", "신한지주"),
+    "034730": ("034730.KS", "SK"),
+}
+
+# 즐겨찾기 파일이 없을 때의 초기 목록
+DEFAULT_FAVORITES = ["NASDAQ:NVDA", "NASDAQ:TSLA", "NASDAQ:AAPL", "NASDAQ:TQQQ", "NASDAQ:QQQ"]
+
+# TradingView 한국 주식 심볼 형식: KOSPI:005930, KOSDAQ:035720
+DEFAULT_KR_FAVORITES = [
+    "KRX:005930",   # 삼성전자
+    "KRX:000660",   # SK하이닉스  
+    "KRX:373220",   # LG에너지솔루션
+    "KRX:005380",   # 현대차
+    "KRX:035420",   # NAVER
+]
+
+
+def is_krx_open(now: Optional[datetime] = None) -> bool:
+    """KRX 정규장(평일 09:00~15:30 KST) 여부"""
+    now = now or datetime.now(KST)
+    if now.weekday() >= 5:
+        return False
+    return KRX_OPEN <= (now.hour, now.minute) <= KRX_CLOSE
+
+
+def read_watchlist(path: Union[str, Path], default: Optional[List[str]] = None) -> List[str]:
+    """즐겨찾기 파일({"favorites": [...]}) 읽기. 없거나 손상되었으면 default"""
+    default = list(default or [])
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return list(json.load(f).get("favorites", default))
+    except FileNotFoundError:
+        return default
+    except (json.JSONDecodeError, AttributeError, TypeError):
+        return default
@@ -0,0 +1,72 @@
+"""
+OHLCV Format - Vectorized DataFrame/JSON conversion for history data
+행 단위 iterrows 대신 컬럼 단위로 한 번에 변환합니다.
+- Row 형식: [{"time", "open", "high", "low", "close", "volume"}, ...] (기존 API / 차트 규격)
+- Columnar 형식: {"time": [...], "open": [...], ...} (응답 크기 축소, 차트에 직접 전달 가능)
+"""
+from typing import Dict, List, Union
+
+import pandas as pd
+
+OHLCV_KEYS = ("time", "open", "high", "low", "close", "volume")
+
+Columns = Dict[str, list]
+Records = List[dict]
+
+
+def frame_to_columns(df: pd.DataFrame) -> Columns:
+    """
+    FDR/Yahoo 스타일 DataFrame(Open/High/Low/Close/Volume, DatetimeIndex)을 columnar dict로 변환
+
+    Open/High/Low가 없으면 Close로, Volume이 없으면 0으로 채웁니다.
+    """
+    if df is None or df.empty:
+        return {key: [] for key in OHLCV_KEYS}
+    df = df.dropna(subset=[c for c in ("Open", "High", "Low", "Close") if c in df])
+    close = df["Close"].astype(float)
+    columns = {"time": df.index.strftime("%Y-%m-%d").tolist()}
+    for key in ("open", "high", "low"):
+        src = key.capitalize()
+        columns[key] = (df[src].astype(float) if src in df else close).tolist()
+    columns["close"] = close.tolist()
+    if "Volume" in df:
+        columns["volume"] = df["Volume"].fillna(0).astype("int64").tolist()
+    else:
+        columns["volume"] = [0] * len(df)
+    return columns
+
+
+def columns_to_records(columns: Columns) -> Records:
+    """Columnar dict -> row dict 리스트 (zip 한 번으로 변환)"""
+    keys = [key for key in columns if columns[key] is not None]
+    return [dict(zip(keys, values)) for values in zip(*(columns[key] for key in keys))]
+
+
+def records_to_columns(records: Records) -> Columns:
+    """Row dict 리스트 -> columnar dict (첫 행의 키 기준)"""
+    if not records:
+        return {key: [] for key in OHLCV_KEYS}
+    return {key: [r.get(key) for r in records] for key in records[0]}
+
+
+def frame_to_records(df: pd.DataFrame) -> Records:
+    """DataFrame -> row dict 리스트"""
+    return columns_to_records(frame_to_columns(df))
+
+
+def is_columnar(data: Union[Columns, Records, None]) -> bool:
+    return isinstance(data, dict) and "time" in data
+
+
+def as_records(data: Union[Columns, Records, None]) -> Records:
+    """Row/columnar 어느 쪽이든 row 형식으로 반환"""
+    if not data:
+        return []
+    return columns_to_records(data) if is_columnar(data) else data
+
+
+def as_columns(data: Union[Columns, Records, None]) -> Columns:
+    """Row/columnar 어느 쪽이든 columnar 형식으로 반환"""
+    if not data:
+        return {key: [] for key in OHLCV_KEYS}
+    return data if is_columnar(data) else records_to_columns(data)